@@ -0,0 +1,60 @@
+"""
+Compares the time to build request URLs from resource path templates, as done for every request, with
+the compiled templates used by the client and with the template parsed again on every call (with a
+regular expression and `str.format`), as it was before templates were compiled.
+
+Usage: python3 benchmark_build_rest_url.py [number of URLs]
+"""
+
+import os
+import re
+import sys
+import timeit
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from linkedin_api.clients.restli.utils.api import build_rest_url
+from linkedin_api.clients.restli.utils.encoder import encode
+from linkedin_api.clients.restli.utils.resource_path import precompile_resource_paths
+from linkedin_api.common.constants import VERSIONED_BASE_URL
+
+RESOURCE_PATHS = [
+    ("/me", None),
+    ("/adAccounts/{id}", {"id": 123456}),
+    (
+        "/socialActions/{id}/comments/{commentId}",
+        {"id": "urn:li:share:6789", "commentId": 42},
+    ),
+]
+
+
+def build_rest_url_uncompiled(resource_path, path_keys=None):
+    encoded_path_keys = (
+        {k: encode(v) for (k, v) in path_keys.items()} if path_keys else {}
+    )
+    placeholders = re.findall(r"{(.*?)}", resource_path)
+    assert len(placeholders) == len(encoded_path_keys)
+    return f"{VERSIONED_BASE_URL}{resource_path.format(**encoded_path_keys)}"
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 300000
+    precompile_resource_paths(resource_path for (resource_path, _) in RESOURCE_PATHS)
+
+    for (resource_path, path_keys) in RESOURCE_PATHS:
+        assert build_rest_url(
+            resource_path, path_keys, "202302"
+        ) == build_rest_url_uncompiled(resource_path, path_keys)
+        compiled = timeit.timeit(
+            lambda: build_rest_url(resource_path, path_keys, "202302"), number=number
+        )
+        uncompiled = timeit.timeit(
+            lambda: build_rest_url_uncompiled(resource_path, path_keys), number=number
+        )
+        print(resource_path)
+        print(f"  compiled:   {compiled / number * 1e9:6.0f} ns per URL")
+        print(f"  uncompiled: {uncompiled / number * 1e9:6.0f} ns per URL")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Compares the memory retained by a large /adAnalytics FINDER response stored as a list of dictionaries
+(`CollectionResponse.elements`) and stored as columns (`ColumnarCollectionResponse.columns`), along with
+the time to sum a column.
+
+Usage: python3 benchmark_columnar.py [number of elements]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import requests
+from linkedin_api.clients.common.json_codec import StdlibJsonCodec
+from linkedin_api.clients.restli.response_formatter import (
+    CollectionResponseFormatter,
+    ColumnarCollectionResponseFormatter,
+)
+
+COLUMNS = [
+    "pivotValues.0",
+    "dateRange.start.day",
+    "impressions",
+    "clicks",
+    "costInLocalCurrency",
+]
+
+
+def create_response(num_elements: int) -> requests.Response:
+    elements = [
+        {
+            "pivotValues": [f"urn:li:sponsoredCampaign:{index % 500}"],
+            "dateRange": {
+                "start": {"day": index % 28 + 1, "month": 1, "year": 2023},
+                "end": {"day": index % 28 + 1, "month": 1, "year": 2023},
+            },
+            "impressions": index * 13,
+            "clicks": index % 97,
+            "costInLocalCurrency": round(index * 0.37, 2),
+        }
+        for index in range(num_elements)
+    ]
+    response = requests.Response()
+    response.status_code = 200
+    response._content = StdlibJsonCodec().dumps({"elements": elements, "paging": {}})
+    return response
+
+
+def measure_retained(create):
+    tracemalloc.start()
+    result = create()
+    (retained, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (result, retained, peak)
+
+
+def main():
+    num_elements = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    response = create_response(num_elements)
+    print(f"{num_elements} elements, {len(COLUMNS)} fields per element")
+
+    (elements, elements_retained, elements_peak) = measure_retained(
+        lambda: CollectionResponseFormatter.format_response(response).elements
+    )
+    (columns, columns_retained, columns_peak) = measure_retained(
+        lambda: ColumnarCollectionResponseFormatter.format_response(
+            response, columns=COLUMNS
+        ).columns
+    )
+    print(
+        f"     elements: retained {elements_retained / 1024 / 1024:6.1f} MiB, peak {elements_peak / 1024 / 1024:6.1f} MiB"
+    )
+    print(
+        f"      columns: retained {columns_retained / 1024 / 1024:6.1f} MiB, peak {columns_peak / 1024 / 1024:6.1f} MiB"
+    )
+
+    start = time.perf_counter()
+    sum(element["impressions"] for element in elements)
+    elements_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    sum(columns["impressions"])
+    columns_seconds = time.perf_counter() - start
+    print(
+        f"  sum of impressions: elements {elements_seconds * 1000:.2f} ms, columns {columns_seconds * 1000:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
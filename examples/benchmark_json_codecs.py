@@ -0,0 +1,88 @@
+"""
+Compares the speed of the installed JSON codecs when parsing and serializing a large FINDER response,
+such as a page of 1000 ad accounts. Install orjson with `pip install "linkedin-api-client[fast-json]"`
+to compare it with the standard library.
+
+Usage: python3 benchmark_json_codecs.py [number of elements] [repetitions]
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import requests
+from linkedin_api.clients.common.json_codec import (
+    OrjsonCodec,
+    StdlibJsonCodec,
+    UjsonCodec,
+)
+
+
+def create_collection_response(num_elements: int) -> requests.Response:
+    elements = [
+        {
+            "id": 500000000 + index,
+            "name": f"Ad Account {index}",
+            "reference": f"urn:li:organization:{index}",
+            "status": "ACTIVE",
+            "type": "BUSINESS",
+            "currency": "USD",
+            "test": False,
+            "notifiedOnCampaignOptimization": True,
+            "servingStatuses": ["RUNNABLE"],
+            "changeAuditStamps": {
+                "created": {"time": 1672531200000 + index},
+                "lastModified": {"time": 1675209600000 + index},
+            },
+        }
+        for index in range(num_elements)
+    ]
+    body = {
+        "elements": elements,
+        "paging": {"start": 0, "count": num_elements, "total": num_elements * 10},
+    }
+    response = requests.Response()
+    response.status_code = 200
+    response._content = StdlibJsonCodec().dumps(body)
+    response.encoding = "utf-8"
+    return response
+
+
+def main():
+    num_elements = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    repetitions = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    response = create_collection_response(num_elements)
+    body = StdlibJsonCodec().decode_response(response)
+    print(
+        f"{num_elements} elements, {len(response.content) / 1024:.0f} KiB, {repetitions} repetitions"
+    )
+
+    codecs = [StdlibJsonCodec()]
+    for codec_class in (OrjsonCodec, UjsonCodec):
+        try:
+            codecs.append(codec_class())
+        except ImportError:
+            print(f"{codec_class.name} is not installed, skipping")
+
+    baseline = None
+    for codec in codecs:
+        decode_seconds = (
+            timeit.timeit(lambda: codec.decode_response(response), number=repetitions)
+            / repetitions
+        )
+        encode_seconds = (
+            timeit.timeit(lambda: codec.dumps(body), number=repetitions) / repetitions
+        )
+        if baseline is None:
+            baseline = (decode_seconds, encode_seconds)
+        print(
+            f"{codec.name:>8}: decode {decode_seconds * 1000:7.2f} ms ({baseline[0] / decode_seconds:4.1f}x), "
+            f"encode {encode_seconds * 1000:7.2f} ms ({baseline[1] / encode_seconds:4.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
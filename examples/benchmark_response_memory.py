@@ -0,0 +1,81 @@
+"""
+Measures the memory used by the results of a large BATCH_PARTIAL_UPDATE response, formatted by the
+client, and compares it with equivalent result objects storing their attributes in a per-instance
+`__dict__`, as they did before the response classes declared `__slots__`.
+
+Usage: python3 benchmark_response_memory.py [number of results]
+"""
+
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import requests
+from linkedin_api.clients.common.json_codec import StdlibJsonCodec
+from linkedin_api.clients.restli.response_formatter import (
+    BatchUpdateResponseFormatter,
+)
+
+
+class DictBatchUpdateResult:
+    def __init__(self, status: int):
+        self.status = status
+
+
+def create_batch_update_response(num_results: int) -> requests.Response:
+    body = {"results": {str(id): {"status": 204} for id in range(num_results)}}
+    response = requests.Response()
+    response.status_code = 200
+    response._content = StdlibJsonCodec().dumps(body)
+    return response
+
+
+def measure(create):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = create()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return (objects, size)
+
+
+def main():
+    num_results = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    response = create_batch_update_response(num_results)
+    statuses = [204] * num_results
+
+    (slotted_results, slotted_size) = measure(
+        lambda: BatchUpdateResponseFormatter.format_response(response).results
+    )
+    (dict_results, dict_size) = measure(
+        lambda: {
+            str(id): DictBatchUpdateResult(status)
+            for (id, status) in enumerate(statuses)
+        }
+    )
+    (ids, ids_size) = measure(
+        lambda: {str(id): status for (id, status) in enumerate(statuses)}
+    )
+
+    # Subtract the map of ids, shared by both measurements, to compare the result objects alone
+    print(f"{num_results} results")
+    print(
+        f"  __slots__: {(slotted_size - ids_size) / num_results:6.1f} bytes per result"
+    )
+    print(f"  __dict__:  {(dict_size - ids_size) / num_results:6.1f} bytes per result")
+
+    slotted_result = next(iter(slotted_results.values()))
+    dict_result = next(iter(dict_results.values()))
+    number = 1000000
+    print(
+        f"  attribute access: __slots__ {timeit.timeit(lambda: slotted_result.status, number=number) * 1000:.0f} ms, "
+        f"__dict__ {timeit.timeit(lambda: dict_result.status, number=number) * 1000:.0f} ms for {number} reads"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Compares parsing a large FINDER response (e.g. a page of analytics) as a whole with parsing it while it is
+downloaded with `stream=True`: the time until the first element is available, the total time and the peak
+memory. The download is simulated by reading the body in 64 KiB chunks.
+
+Usage: python3 benchmark_streaming.py [number of elements]
+"""
+
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import requests
+from linkedin_api.clients.common.json_codec import StdlibJsonCodec
+from linkedin_api.clients.restli.response_formatter import (
+    CollectionResponseFormatter,
+    StreamingCollectionResponseFormatter,
+)
+
+
+def create_body(num_elements: int) -> bytes:
+    elements = [
+        {
+            "pivotValues": [f"urn:li:sponsoredCampaign:{index}"],
+            "dateRange": {
+                "start": {"day": 1, "month": 1, "year": 2023},
+                "end": {"day": 31, "month": 1, "year": 2023},
+            },
+            "impressions": index * 13,
+            "clicks": index % 97,
+            "costInLocalCurrency": str(index * 0.37),
+        }
+        for index in range(num_elements)
+    ]
+    return StdlibJsonCodec().dumps(
+        {"elements": elements, "paging": {"start": 0, "count": num_elements}}
+    )
+
+
+def create_response(body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(body)
+    return response
+
+
+def measure(consume):
+    tracemalloc.start()
+    start = time.perf_counter()
+    first_element_seconds = consume(start)
+    total_seconds = time.perf_counter() - start
+    (_, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (first_element_seconds, total_seconds, peak)
+
+
+def main():
+    num_elements = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    body = create_body(num_elements)
+    print(f"{num_elements} elements, {len(body) / 1024 / 1024:.1f} MiB")
+
+    def consume_whole(start):
+        response = CollectionResponseFormatter.format_response(
+            create_response(body), json_codec=StdlibJsonCodec()
+        )
+        elements = iter(response.elements)
+        next(elements)
+        first_element_seconds = time.perf_counter() - start
+        for _ in elements:
+            pass
+        return first_element_seconds
+
+    def consume_streamed(start):
+        response = StreamingCollectionResponseFormatter.format_response(
+            create_response(body)
+        )
+        elements = iter(response)
+        next(elements)
+        first_element_seconds = time.perf_counter() - start
+        for _ in elements:
+            pass
+        return first_element_seconds
+
+    for (name, consume) in [("whole", consume_whole), ("streamed", consume_streamed)]:
+        (first_element_seconds, total_seconds, peak) = measure(consume)
+        print(
+            f"{name:>9}: first element {first_element_seconds * 1000:8.2f} ms, "
+            f"total {total_seconds * 1000:8.2f} ms, peak memory {peak / 1024 / 1024:6.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
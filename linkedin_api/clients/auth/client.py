@@ -16,6 +16,8 @@ from linkedin_api.clients.auth.response import (
 )
 from typing import Optional, List
 from linkedin_api.common.constants import HTTP_METHODS
+from linkedin_api.clients.common.session import SessionConfig, create_session
+from linkedin_api.clients.common.json_codec import JsonCodec
 
 
 class AuthClient:
@@ -27,10 +29,17 @@ class AuthClient:
         client_secret (str): The client secret of the developer application.
         redirect_url (Optional[str], optional): The redirect URL. This URL is used in the authorization code flow (3-legged OAuth). Users will be redirected to this URL after authorization. Defaults to None.
         session (requests.Session): The session instance used to make requests to the Auth server. Session attributes can be modified, which will affect all requests.
+        json_codec (Optional[JsonCodec]): The JSON codec parsing the response bodies, or None to use the default codec.
     """
 
     def __init__(
-        self, client_id: str, client_secret: str, redirect_url: Optional[str] = None
+        self,
+        client_id: str,
+        client_secret: str,
+        redirect_url: Optional[str] = None,
+        *,
+        session_config: Optional[SessionConfig] = None,
+        json_codec: Optional[JsonCodec] = None,
     ):
         """
         The constructor for the AuthClient class.
@@ -39,11 +48,14 @@ class AuthClient:
             client_id (str): The client ID of the developer application.
             client_secret (str): The client secret of the developer application.
             redirect_url (Optional[str], optional): The redirect URL. This URL is used in the authorization code flow (3-legged OAuth). Users will be redirected to this URL after authorization. Defaults to None.
+            session_config (Optional[SessionConfig], optional): The connection pool size and blocking behavior, default connect and read timeouts, and TCP keep-alive settings of the session. Defaults to None (the requests defaults).
+            json_codec (Optional[JsonCodec], optional): The JSON codec parsing the response bodies. Defaults to None (the default codec, the standard library unless configured otherwise, see `get_default_json_codec()`).
         """
         self.client_id = client_id
         self.client_secret = client_secret
         self.redirect_url = redirect_url
-        self.session = requests.Session()
+        self.session = create_session(session_config)
+        self.json_codec = json_codec
 
     def generate_member_auth_url(
         self, scopes: List[str], state: Optional[str] = None
@@ -118,7 +130,9 @@ class AuthClient:
         prepared_request = request.prepare()
         response = self.session.send(prepared_request)
 
-        return AccessToken3LResponseFormatter.format_response(response)
+        return AccessToken3LResponseFormatter.format_response(
+            response, json_codec=self.json_codec
+        )
 
     def exchange_refresh_token_for_access_token(
         self, refresh_token: str
@@ -155,7 +169,9 @@ class AuthClient:
         )
         prepared_request = request.prepare()
         response = self.session.send(prepared_request)
-        return RefreshTokenExchangeResponseFormatter.format_response(response)
+        return RefreshTokenExchangeResponseFormatter.format_response(
+            response, json_codec=self.json_codec
+        )
 
     def get_two_legged_access_token(self) -> AccessToken2LResponse:
         """
@@ -186,7 +202,9 @@ class AuthClient:
         )
         prepared_request = request.prepare()
         response = self.session.send(prepared_request)
-        return AccessToken2LResponseFormatter.format_response(response)
+        return AccessToken2LResponseFormatter.format_response(
+            response, json_codec=self.json_codec
+        )
 
     def introspect_access_token(self, access_token: str) -> IntrospectTokenResponse:
         """
@@ -219,4 +237,6 @@ class AuthClient:
         )
         prepared_request = request.prepare()
         response = self.session.send(prepared_request)
-        return IntrospectTokenResponseFormatter.format_response(response)
+        return IntrospectTokenResponseFormatter.format_response(
+            response, json_codec=self.json_codec
+        )
@@ -1,3 +1,4 @@
+from typing import Optional
 from requests import Response
 from linkedin_api.clients.auth.response import (
     AccessToken3LResponse,
@@ -5,6 +6,7 @@ from linkedin_api.clients.auth.response import (
     IntrospectTokenResponse,
     RefreshTokenExchangeResponse,
 )
+from linkedin_api.clients.common.json_codec import JsonCodec, resolve_json_codec
 from linkedin_api.clients.common.response_formatter import (
     BaseResponseFormatter,
     wrap_format_exception,
@@ -14,8 +16,10 @@ from linkedin_api.clients.common.response_formatter import (
 class AccessToken3LResponseFormatter(BaseResponseFormatter[AccessToken3LResponse]):
     @classmethod
     @wrap_format_exception
-    def format_response(cls, response: Response) -> AccessToken3LResponse:
-        json_data = response.json()
+    def format_response(
+        cls, response: Response, *, json_codec: Optional[JsonCodec] = None
+    ) -> AccessToken3LResponse:
+        json_data = resolve_json_codec(json_codec).decode_response(response)
 
         return AccessToken3LResponse(
             status_code=response.status_code,
@@ -33,8 +37,10 @@ class AccessToken3LResponseFormatter(BaseResponseFormatter[AccessToken3LResponse
 class AccessToken2LResponseFormatter(BaseResponseFormatter[AccessToken2LResponse]):
     @classmethod
     @wrap_format_exception
-    def format_response(cls, response: Response) -> AccessToken2LResponse:
-        json_data = response.json()
+    def format_response(
+        cls, response: Response, *, json_codec: Optional[JsonCodec] = None
+    ) -> AccessToken2LResponse:
+        json_data = resolve_json_codec(json_codec).decode_response(response)
 
         return AccessToken2LResponse(
             status_code=response.status_code,
@@ -49,8 +55,10 @@ class AccessToken2LResponseFormatter(BaseResponseFormatter[AccessToken2LResponse
 class IntrospectTokenResponseFormatter(BaseResponseFormatter[IntrospectTokenResponse]):
     @classmethod
     @wrap_format_exception
-    def format_response(cls, response: Response) -> IntrospectTokenResponse:
-        json_data = response.json()
+    def format_response(
+        cls, response: Response, *, json_codec: Optional[JsonCodec] = None
+    ) -> IntrospectTokenResponse:
+        json_data = resolve_json_codec(json_codec).decode_response(response)
 
         return IntrospectTokenResponse(
             status_code=response.status_code,
@@ -73,8 +81,10 @@ class RefreshTokenExchangeResponseFormatter(
 ):
     @classmethod
     @wrap_format_exception
-    def format_response(cls, response: Response) -> RefreshTokenExchangeResponse:
-        json_data = response.json()
+    def format_response(
+        cls, response: Response, *, json_codec: Optional[JsonCodec] = None
+    ) -> RefreshTokenExchangeResponse:
+        json_data = resolve_json_codec(json_codec).decode_response(response)
 
         return RefreshTokenExchangeResponse(
             status_code=response.status_code,
@@ -0,0 +1,116 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+from linkedin_api.common.errors import InvalidArgumentError
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL_SECONDS = 300.0
+
+
+class CacheBackend(ABC):
+    """
+    The interface for cache storage backends. Keys are strings, and values are the objects to cache.
+    A `None` value is never stored, so `get()` returning `None` means a cache miss. Implementations
+    storing values outside of the process are responsible for serializing them.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Returns the cached value for the key, or None if it is missing or expired.
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Stores a value for the key. If `ttl` (in seconds) is not provided, the backend default applies.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Removes the value for the key, if any.
+        """
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Removes all values.
+        """
+        pass
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """
+    A thread-safe, bounded, in-process cache backend. Entries expire after their time-to-live, and
+    the least recently used entries are evicted once the maximum number of entries is reached.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: Optional[float] = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        The constructor for the InMemoryCacheBackend class.
+
+        Args:
+            max_entries (int, optional): The maximum number of entries to keep. Defaults to 1024.
+            ttl (Optional[float], optional): The default time-to-live of entries, in seconds. If None, entries do not expire. Defaults to 300.
+            clock (Callable[[], float], optional): The monotonic clock used for expiration, in seconds. Defaults to time.monotonic.
+        """
+        if max_entries <= 0:
+            raise InvalidArgumentError("The 'max_entries' argument must be positive")
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self.__lock = threading.Lock()
+        # Maps each key to an (expiration time, value) tuple, from least to most recently used
+        self.__entries = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return None
+
+            (expires_at, value) = entry
+            if expires_at is not None and expires_at <= self.clock():
+                del self.__entries[key]
+                return None
+
+            self.__entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        if value is None:
+            return
+
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = self.clock() + ttl if ttl is not None else None
+
+        with self.__lock:
+            self.__entries[key] = (expires_at, value)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_entries:
+                self.__entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__entries)
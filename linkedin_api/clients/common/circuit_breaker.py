@@ -0,0 +1,186 @@
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Callable, Dict, Optional
+from linkedin_api.common.errors import CircuitOpenError, InvalidArgumentError
+
+DEFAULT_FAILURE_RATE_THRESHOLD = 0.5
+DEFAULT_MINIMUM_REQUESTS = 10
+DEFAULT_WINDOW_SIZE = 20
+DEFAULT_OPEN_DURATION_SECONDS = 30.0
+DEFAULT_HALF_OPEN_MAX_REQUESTS = 1
+
+
+class CIRCUIT_STATES(Enum):
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+
+class _Circuit:
+    def __init__(self, window_size: int):
+        self.state = CIRCUIT_STATES.CLOSED
+        # The outcomes of the most recent requests, True for failures
+        self.outcomes = deque(maxlen=window_size)
+        self.opened_at = 0.0
+        self.half_open_requests = 0
+        self.half_open_successes = 0
+
+
+class CircuitBreaker:
+    """
+    A thread-safe circuit breaker with one circuit per key (e.g. per resource path template).
+
+    A circuit starts closed. Once the failure rate of its most recent requests (5xx responses and
+    connection errors) reaches the threshold, it opens, and requests fail fast with a CircuitOpenError
+    instead of being sent. After the open duration, it becomes half-open and lets a limited number of
+    trial requests through: if they all succeed, the circuit closes, and if any fails, it opens again.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_rate_threshold: float = DEFAULT_FAILURE_RATE_THRESHOLD,
+        minimum_requests: int = DEFAULT_MINIMUM_REQUESTS,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        open_duration: float = DEFAULT_OPEN_DURATION_SECONDS,
+        half_open_max_requests: int = DEFAULT_HALF_OPEN_MAX_REQUESTS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        The constructor for the CircuitBreaker class.
+
+        Args:
+            failure_rate_threshold (float, optional): The failure rate, between 0 and 1, at which a circuit opens. Defaults to 0.5.
+            minimum_requests (int, optional): The minimum number of requests in the window before the failure rate is evaluated. Defaults to 10.
+            window_size (int, optional): The number of most recent requests the failure rate is computed on. Defaults to 20.
+            open_duration (float, optional): The time in seconds a circuit stays open before letting trial requests through. Defaults to 30.
+            half_open_max_requests (int, optional): The number of trial requests of a half-open circuit. Defaults to 1.
+            clock (Callable[[], float], optional): The monotonic clock, in seconds. Defaults to time.monotonic.
+        """
+        if not 0 < failure_rate_threshold <= 1:
+            raise InvalidArgumentError(
+                "The 'failure_rate_threshold' argument must be between 0 and 1"
+            )
+        if not 1 <= minimum_requests <= window_size:
+            raise InvalidArgumentError(
+                "The arguments must satisfy 1 <= minimum_requests <= window_size"
+            )
+        if half_open_max_requests < 1:
+            raise InvalidArgumentError(
+                "The 'half_open_max_requests' argument must be at least 1"
+            )
+
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_requests = minimum_requests
+        self.window_size = window_size
+        self.open_duration = open_duration
+        self.half_open_max_requests = half_open_max_requests
+        self.clock = clock
+        self.__lock = threading.Lock()
+        self.__circuits: Dict[str, _Circuit] = {}
+
+    def before_request(self, key: str) -> None:
+        """
+        Checks whether a request can be sent on the circuit of the key.
+
+        Args:
+            key (str): The circuit key
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all its trial requests in flight
+        """
+        with self.__lock:
+            circuit = self.__get_circuit(key)
+            if circuit.state == CIRCUIT_STATES.OPEN:
+                retry_in = circuit.opened_at + self.open_duration - self.clock()
+                if retry_in > 0:
+                    raise CircuitOpenError(
+                        f"The circuit for '{key}' is open, retry in {retry_in:.3f} seconds"
+                    )
+                circuit.state = CIRCUIT_STATES.HALF_OPEN
+                circuit.half_open_requests = 0
+                circuit.half_open_successes = 0
+
+            if circuit.state == CIRCUIT_STATES.HALF_OPEN:
+                if circuit.half_open_requests >= self.half_open_max_requests:
+                    raise CircuitOpenError(
+                        f"The circuit for '{key}' is half-open, and its trial requests are in flight"
+                    )
+                circuit.half_open_requests += 1
+
+    def cancel_request(self, key: str) -> None:
+        """
+        Cancels a request allowed by `before_request()` that is not sent after all (e.g. because it was
+        rate limited), so that it neither counts as an outcome nor holds a trial request slot.
+
+        Args:
+            key (str): The circuit key
+        """
+        with self.__lock:
+            circuit = self.__get_circuit(key)
+            if (
+                circuit.state == CIRCUIT_STATES.HALF_OPEN
+                and circuit.half_open_requests > 0
+            ):
+                circuit.half_open_requests -= 1
+
+    def record(self, key: str, status_code: Optional[int]) -> None:
+        """
+        Records the outcome of a request sent on the circuit of the key.
+
+        Args:
+            key (str): The circuit key
+            status_code (Optional[int]): The response status code, or None if the request failed with an error
+        """
+        failed = status_code is None or status_code >= 500
+        with self.__lock:
+            circuit = self.__get_circuit(key)
+            if circuit.state == CIRCUIT_STATES.HALF_OPEN:
+                if failed:
+                    self.__open(circuit)
+                else:
+                    circuit.half_open_successes += 1
+                    if circuit.half_open_successes >= self.half_open_max_requests:
+                        circuit.state = CIRCUIT_STATES.CLOSED
+                        circuit.outcomes.clear()
+            elif circuit.state == CIRCUIT_STATES.CLOSED:
+                circuit.outcomes.append(failed)
+                if (
+                    len(circuit.outcomes) >= self.minimum_requests
+                    and sum(circuit.outcomes) / len(circuit.outcomes)
+                    >= self.failure_rate_threshold
+                ):
+                    self.__open(circuit)
+
+    def get_state(self, key: str) -> CIRCUIT_STATES:
+        """
+        Returns the state of the circuit of the key. An open circuit whose open duration has elapsed
+        is reported as open until the next request makes it half-open.
+        """
+        with self.__lock:
+            circuit = self.__circuits.get(key)
+            return circuit.state if circuit is not None else CIRCUIT_STATES.CLOSED
+
+    def reset(self, key: Optional[str] = None) -> None:
+        """
+        Closes the circuit of the key, or all circuits if no key is specified.
+        """
+        with self.__lock:
+            if key is None:
+                self.__circuits.clear()
+            else:
+                self.__circuits.pop(key, None)
+
+    def __get_circuit(self, key: str) -> _Circuit:
+        circuit = self.__circuits.get(key)
+        if circuit is None:
+            circuit = _Circuit(self.window_size)
+            self.__circuits[key] = circuit
+        return circuit
+
+    def __open(self, circuit: _Circuit) -> None:
+        circuit.state = CIRCUIT_STATES.OPEN
+        circuit.opened_at = self.clock()
+        circuit.outcomes.clear()
@@ -0,0 +1,233 @@
+import asyncio
+import threading
+import time
+from typing import Callable, FrozenSet, Optional
+from linkedin_api.common.errors import InvalidArgumentError
+
+DEFAULT_INITIAL_LIMIT = 8
+DEFAULT_MIN_LIMIT = 1
+DEFAULT_MAX_LIMIT = 128
+DEFAULT_BACKOFF_RATIO = 0.5
+DEFAULT_LATENCY_TOLERANCE = 2.0
+DEFAULT_BASELINE_DECAY = 0.01
+
+DEFAULT_OVERLOAD_STATUS_CODES = frozenset([429, 503])
+
+
+class AimdConcurrencyLimit:
+    """
+    An additive-increase/multiplicative-decrease (AIMD) concurrency limit driven by response feedback.
+
+    The limit is decreased multiplicatively when a request is throttled (429), the service is unavailable
+    (503), the request fails with a connection error, or its latency exceeds the baseline latency by
+    more than the latency tolerance (the latency gradient signaling queueing). Otherwise, while at
+    least half of the limit is in use, the limit is increased by one for each window of successful
+    requests. This class is not thread-safe; it is used by the concurrency limiters under their lock.
+
+    The baseline latency is a decaying minimum of the 2xx latencies: it drops to any lower latency, and
+    otherwise moves towards the observed latencies by the baseline decay, so that it follows a lasting
+    shift (e.g. a network route change) instead of pinning the limit low. Error responses, which are
+    often answered without doing the work, are ignored. There is a single limit and baseline per
+    limiter, shared by all the resource paths it is used for: use a limiter per client (or per group of
+    resource paths with comparable latencies) for the latency gradient to be meaningful.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_limit: int = DEFAULT_INITIAL_LIMIT,
+        min_limit: int = DEFAULT_MIN_LIMIT,
+        max_limit: int = DEFAULT_MAX_LIMIT,
+        backoff_ratio: float = DEFAULT_BACKOFF_RATIO,
+        latency_tolerance: Optional[float] = DEFAULT_LATENCY_TOLERANCE,
+        baseline_decay: float = DEFAULT_BASELINE_DECAY,
+        overload_status_codes: FrozenSet[int] = DEFAULT_OVERLOAD_STATUS_CODES
+    ):
+        """
+        The constructor for the AimdConcurrencyLimit class.
+
+        Args:
+            initial_limit (int, optional): The initial number of requests allowed in flight. Defaults to 8.
+            min_limit (int, optional): The minimum limit. Defaults to 1.
+            max_limit (int, optional): The maximum limit. Defaults to 128.
+            backoff_ratio (float, optional): The ratio the limit is multiplied by on overload, between 0 and 1. Defaults to 0.5.
+            latency_tolerance (Optional[float], optional): The ratio to the baseline latency above which a latency is considered an overload. If None, latency is ignored. Defaults to 2.
+            baseline_decay (float, optional): The weight, between 0 and 1, with which each 2xx latency above the baseline latency moves it. Defaults to 0.01.
+            overload_status_codes (FrozenSet[int], optional): The response status codes considered an overload. Defaults to 429 and 503.
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise InvalidArgumentError(
+                "The limits must satisfy 1 <= min_limit <= initial_limit <= max_limit"
+            )
+        if not 0 < backoff_ratio < 1:
+            raise InvalidArgumentError(
+                "The 'backoff_ratio' argument must be between 0 and 1"
+            )
+        if not 0 <= baseline_decay <= 1:
+            raise InvalidArgumentError(
+                "The 'baseline_decay' argument must be between 0 and 1"
+            )
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.overload_status_codes = overload_status_codes
+        self.baseline_decay = baseline_decay
+        self.baseline_latency: Optional[float] = None
+        self.__limit = float(initial_limit)
+
+    @property
+    def limit(self) -> int:
+        """
+        The current number of requests allowed in flight.
+        """
+        return int(self.__limit)
+
+    def on_sample(
+        self, *, latency: float, status_code: Optional[int], in_flight: int
+    ) -> None:
+        """
+        Updates the limit with the outcome of a request.
+
+        Args:
+            latency (float): The latency of the request, in seconds
+            status_code (Optional[int]): The response status code, or None if the request failed with a connection error
+            in_flight (int): The number of requests in flight when the request completed, including itself
+        """
+        overloaded = status_code is None or status_code in self.overload_status_codes
+
+        if status_code is not None and 200 <= status_code < 300:
+            if self.baseline_latency is None or latency < self.baseline_latency:
+                self.baseline_latency = latency
+            else:
+                if (
+                    self.latency_tolerance is not None
+                    and latency > self.baseline_latency * self.latency_tolerance
+                ):
+                    overloaded = True
+                self.baseline_latency += self.baseline_decay * (
+                    latency - self.baseline_latency
+                )
+
+        if overloaded:
+            self.__limit = max(float(self.min_limit), self.__limit * self.backoff_ratio)
+        elif in_flight * 2 >= self.limit:
+            self.__limit = min(float(self.max_limit), self.__limit + 1 / self.__limit)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    A thread-safe limiter of the number of requests in flight, whose limit adapts to the response
+    latencies and status codes with an AimdConcurrencyLimit. `acquire()` blocks while the limit is
+    reached, so a thread pool of any size sending requests through it converges to the highest
+    concurrency the API sustains without throttling.
+    """
+
+    def __init__(
+        self,
+        limit: Optional[AimdConcurrencyLimit] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        The constructor for the AdaptiveConcurrencyLimiter class.
+
+        Args:
+            limit (Optional[AimdConcurrencyLimit], optional): The adaptive limit. Defaults to an AimdConcurrencyLimit with its default settings.
+            clock (Callable[[], float], optional): The monotonic clock used to measure latencies, in seconds. Defaults to time.monotonic.
+        """
+        self.limit = limit if limit is not None else AimdConcurrencyLimit()
+        self.clock = clock
+        self.in_flight = 0
+        self.__condition = threading.Condition()
+
+    def acquire(self) -> float:
+        """
+        Waits until a request can be sent, and marks it as in flight.
+
+        Returns:
+            float: The start time of the request, to pass to `release()`
+        """
+        with self.__condition:
+            while self.in_flight >= self.limit.limit:
+                self.__condition.wait()
+            self.in_flight += 1
+        return self.clock()
+
+    def release(self, start: float, status_code: Optional[int]) -> None:
+        """
+        Marks a request as completed, and updates the limit with its outcome.
+
+        Args:
+            start (float): The start time returned by `acquire()`
+            status_code (Optional[int]): The response status code, or None if the request failed with a connection error
+        """
+        latency = self.clock() - start
+        with self.__condition:
+            self.limit.on_sample(
+                latency=latency, status_code=status_code, in_flight=self.in_flight
+            )
+            self.in_flight -= 1
+            self.__condition.notify_all()
+
+
+class AsyncAdaptiveConcurrencyLimiter:
+    """
+    The asyncio counterpart of AdaptiveConcurrencyLimiter, for coroutines running on a single event loop.
+    """
+
+    def __init__(
+        self,
+        limit: Optional[AimdConcurrencyLimit] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        The constructor for the AsyncAdaptiveConcurrencyLimiter class.
+
+        Args:
+            limit (Optional[AimdConcurrencyLimit], optional): The adaptive limit. Defaults to an AimdConcurrencyLimit with its default settings.
+            clock (Callable[[], float], optional): The monotonic clock used to measure latencies, in seconds. Defaults to time.monotonic.
+        """
+        self.limit = limit if limit is not None else AimdConcurrencyLimit()
+        self.clock = clock
+        self.in_flight = 0
+        self.__condition: Optional[asyncio.Condition] = None
+
+    async def acquire(self) -> float:
+        """
+        Waits until a request can be sent, and marks it as in flight.
+
+        Returns:
+            float: The start time of the request, to pass to `release()`
+        """
+        condition = self.__get_condition()
+        async with condition:
+            while self.in_flight >= self.limit.limit:
+                await condition.wait()
+            self.in_flight += 1
+        return self.clock()
+
+    async def release(self, start: float, status_code: Optional[int]) -> None:
+        """
+        Marks a request as completed, and updates the limit with its outcome.
+
+        Args:
+            start (float): The start time returned by `acquire()`
+            status_code (Optional[int]): The response status code, or None if the request failed with a connection error
+        """
+        latency = self.clock() - start
+        condition = self.__get_condition()
+        async with condition:
+            self.limit.on_sample(
+                latency=latency, status_code=status_code, in_flight=self.in_flight
+            )
+            self.in_flight -= 1
+            condition.notify_all()
+
+    def __get_condition(self) -> asyncio.Condition:
+        # Created lazily, so that the condition is bound to the running event loop
+        if self.__condition is None:
+            self.__condition = asyncio.Condition()
+        return self.__condition
@@ -0,0 +1,197 @@
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Optional, Union
+from requests import Response
+from linkedin_api.common.errors import InvalidArgumentError
+
+
+class JsonCodec(ABC):
+    """
+    The interface for serializing request bodies to JSON and parsing JSON response bodies. Decoding
+    errors must be raised as ValueError (or a subclass).
+    """
+
+    name = ""
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Serializes an object to UTF-8 encoded JSON.
+        """
+        pass
+
+    @abstractmethod
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Parses JSON, encoded in UTF-8 if provided as bytes.
+        """
+        pass
+
+    def decode_response(self, response: Response) -> Any:
+        """
+        Parses the JSON body of a response.
+
+        Raises:
+            ValueError: Error if the body is not valid JSON (e.g. an empty body)
+        """
+        return self.loads(response.content)
+
+
+class StdlibJsonCodec(JsonCodec):
+    """
+    The JSON codec built on the standard library `json` module. Request bodies are serialized exactly as
+    the `json` argument of requests would.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, allow_nan=False).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+    def decode_response(self, response: Response) -> Any:
+        # Honors the response encoding, like requests
+        return response.json()
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    The JSON codec built on orjson, which is several times faster than the standard library. Requires the
+    `orjson` package to be installed.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        try:
+            import orjson
+        except ImportError as error:
+            raise ImportError(
+                'The orjson package is required to use OrjsonCodec. Install it with `pip install "linkedin-api-client[fast-json]"`.'
+            ) from error
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> bytes:
+        # Like the standard library, non-string keys (e.g. integer ids) are serialized as strings
+        return self._orjson.dumps(obj, option=self._orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._orjson.loads(data)
+
+
+class UjsonCodec(JsonCodec):
+    """
+    The JSON codec built on ujson, which is faster than the standard library. Requires the `ujson`
+    package to be installed.
+    """
+
+    name = "ujson"
+
+    def __init__(self):
+        try:
+            import ujson
+        except ImportError as error:
+            raise ImportError(
+                "The ujson package is required to use UjsonCodec. Install it with `pip install ujson`."
+            ) from error
+        self._ujson = ujson
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._ujson.dumps(
+            obj, ensure_ascii=False, escape_forward_slashes=False
+        ).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._ujson.loads(data)
+
+
+JSON_CODEC_ENV_VAR = "LINKEDIN_API_JSON_CODEC"
+
+FASTEST_JSON_CODEC = "fastest"
+
+_JSON_CODEC_CLASSES = {
+    codec_class.name: codec_class
+    for codec_class in (StdlibJsonCodec, OrjsonCodec, UjsonCodec)
+}
+
+_default_json_codec: Optional[JsonCodec] = None
+_default_json_codec_lock = threading.Lock()
+
+
+def get_fastest_json_codec() -> JsonCodec:
+    """
+    Returns the fastest JSON codec installed: orjson, then ujson, and the standard library otherwise.
+    """
+    for codec_class in (OrjsonCodec, UjsonCodec):
+        try:
+            return codec_class()
+        except ImportError:
+            continue
+    return StdlibJsonCodec()
+
+
+def create_json_codec(name: str) -> JsonCodec:
+    """
+    Creates a JSON codec by name: "json" (the standard library), "orjson", "ujson", or "fastest" for the
+    fastest codec installed (see `get_fastest_json_codec()`).
+
+    Raises:
+        InvalidArgumentError: Error if the name is unknown
+        ImportError: Error if the package of the named codec is not installed
+    """
+    if name == FASTEST_JSON_CODEC:
+        return get_fastest_json_codec()
+    codec_class = _JSON_CODEC_CLASSES.get(name)
+    if codec_class is None:
+        raise InvalidArgumentError(
+            f"Unknown JSON codec '{name}', expected one of: {', '.join([*_JSON_CODEC_CLASSES, FASTEST_JSON_CODEC])}"
+        )
+    return codec_class()
+
+
+def set_default_json_codec(json_codec: Optional[JsonCodec]) -> None:
+    """
+    Sets the JSON codec used by all the clients and helpers that are not given a codec explicitly, e.g.
+    `set_default_json_codec(OrjsonCodec())` at startup to opt into orjson everywhere.
+
+    Args:
+        json_codec (Optional[JsonCodec]): The default codec, or None to restore the initial default
+    """
+    global _default_json_codec
+    with _default_json_codec_lock:
+        _default_json_codec = json_codec
+
+
+def get_default_json_codec() -> JsonCodec:
+    """
+    Returns the default JSON codec: the codec set with `set_default_json_codec()`, or else the codec
+    named by the `LINKEDIN_API_JSON_CODEC` environment variable (see `create_json_codec()`), or else the
+    standard library codec. Faster codecs are never used unless requested, since they serialize some
+    values differently (e.g. whitespace and floats). The codec is created once and then reused.
+
+    Raises:
+        InvalidArgumentError: Error if the environment variable names an unknown codec
+        ImportError: Error if the environment variable names a codec that is not installed
+    """
+    global _default_json_codec
+    json_codec = _default_json_codec
+    if json_codec is None:
+        with _default_json_codec_lock:
+            if _default_json_codec is None:
+                name = os.environ.get(JSON_CODEC_ENV_VAR)
+                _default_json_codec = (
+                    create_json_codec(name) if name else StdlibJsonCodec()
+                )
+            json_codec = _default_json_codec
+    return json_codec
+
+
+def resolve_json_codec(json_codec: Optional[JsonCodec]) -> JsonCodec:
+    """
+    Returns the specified JSON codec, or the default JSON codec if none is specified.
+    """
+    return json_codec if json_codec is not None else get_default_json_codec()
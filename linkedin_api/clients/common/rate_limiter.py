@@ -0,0 +1,422 @@
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, List, Optional, Tuple
+from linkedin_api.common.errors import InvalidArgumentError, RateLimitExceededError
+
+DEFAULT_MAX_BUCKETS = 10000
+DEFAULT_SHARED_SLOTS = 4096
+MAX_SLOT_PROBES = 8
+
+# Each slot of a shared store holds the key digest, the number of tokens and the update time
+SLOT_FORMAT = struct.Struct("<32sdd")
+EMPTY_DIGEST = bytes(32)
+
+APPLICATION_SCOPE = "application"
+ACCESS_TOKEN_SCOPE = "access_token"
+RESOURCE_PATH_SCOPE = "resource_path"
+ACCESS_TOKEN_AND_RESOURCE_PATH_SCOPE = "access_token_resource_path"
+
+
+class RateLimit:
+    """
+    The rate and burst capacity of a token bucket. A bucket starts full, holding `burst` tokens, and is
+    refilled at `requests / period` tokens per second. Each request consumes one token.
+    """
+
+    def __init__(
+        self, requests: float, period: float, *, burst: Optional[float] = None
+    ):
+        """
+        The constructor for the RateLimit class.
+
+        Args:
+            requests (float): The number of requests allowed per period
+            period (float): The period, in seconds (e.g. 86400 for a daily limit)
+            burst (Optional[float], optional): The maximum number of requests that can be sent at once. Defaults to None (the `requests` value).
+        """
+        if requests <= 0 or period <= 0:
+            raise InvalidArgumentError(
+                "The 'requests' and 'period' arguments must be positive"
+            )
+        if burst is not None and burst < 1:
+            raise InvalidArgumentError("The 'burst' argument must be at least 1")
+
+        self.rate = requests / period
+        self.capacity = burst if burst is not None else max(1.0, requests)
+
+
+# A (bucket key, rate limit) pair
+Bucket = Tuple[str, RateLimit]
+
+
+class TokenBucketStore(ABC):
+    """
+    The interface for the storage of token bucket states. Implementations must acquire the tokens of
+    all the buckets of a request atomically, so that no token is consumed unless all are available.
+    """
+
+    @abstractmethod
+    def try_acquire(self, buckets: List[Bucket], now: float) -> float:
+        """
+        Consumes one token from each bucket if all of them have a token available.
+
+        Args:
+            buckets (List[Bucket]): The buckets to consume a token from
+            now (float): The current time of the rate limiter clock, in seconds
+
+        Returns:
+            float: 0 if the tokens were consumed, otherwise the number of seconds until all buckets have a token available
+        """
+        pass
+
+
+def refill_tokens(
+    tokens: float, updated_at: float, rate_limit: RateLimit, now: float
+) -> float:
+    """
+    Returns the number of tokens of a bucket at the specified time.
+
+    Args:
+        tokens (float): The number of tokens when the bucket was last updated
+        updated_at (float): The time the bucket was last updated
+        rate_limit (RateLimit): The rate limit of the bucket
+        now (float): The current time
+
+    Returns:
+        float: The number of tokens, up to the bucket capacity
+    """
+    elapsed = max(0.0, now - updated_at)
+    return min(rate_limit.capacity, tokens + elapsed * rate_limit.rate)
+
+
+def acquire_refilled_tokens(
+    buckets: List[Bucket], states: List[Tuple[float, float]], now: float
+) -> Tuple[float, List[float]]:
+    """
+    Refills the buckets, and computes the wait until all of them have a token available.
+
+    Args:
+        buckets (List[Bucket]): The buckets
+        states (List[Tuple[float, float]]): The (tokens, update time) state of each bucket
+        now (float): The current time
+
+    Returns:
+        Tuple[float, List[float]]: The wait in seconds (0 if a token is available in all buckets), and the refilled number of tokens of each bucket
+    """
+    wait = 0.0
+    refilled = []
+    for ((_, rate_limit), (tokens, updated_at)) in zip(buckets, states):
+        tokens = refill_tokens(tokens, updated_at, rate_limit, now)
+        if tokens < 1:
+            wait = max(wait, (1 - tokens) / rate_limit.rate)
+        refilled.append(tokens)
+    return (wait, refilled)
+
+
+class InMemoryTokenBucketStore(TokenBucketStore):
+    """
+    A thread-safe, bounded, in-process store of token buckets. Once the maximum number of buckets is
+    reached, the least recently used buckets are evicted (and start full again if used later).
+    """
+
+    def __init__(self, *, max_buckets: int = DEFAULT_MAX_BUCKETS):
+        """
+        The constructor for the InMemoryTokenBucketStore class.
+
+        Args:
+            max_buckets (int, optional): The maximum number of buckets to keep. Defaults to 10000.
+        """
+        if max_buckets <= 0:
+            raise InvalidArgumentError("The 'max_buckets' argument must be positive")
+
+        self.max_buckets = max_buckets
+        self.__lock = threading.Lock()
+        # Maps each bucket key to a (tokens, update time) tuple, from least to most recently used
+        self.__buckets = OrderedDict()
+
+    def try_acquire(self, buckets: List[Bucket], now: float) -> float:
+        with self.__lock:
+            states = [
+                self.__buckets.get(key, (rate_limit.capacity, now))
+                for (key, rate_limit) in buckets
+            ]
+            (wait, refilled) = acquire_refilled_tokens(buckets, states, now)
+            if wait > 0:
+                return wait
+
+            for ((key, _), tokens) in zip(buckets, refilled):
+                self.__buckets[key] = (tokens - 1, now)
+                self.__buckets.move_to_end(key)
+            while len(self.__buckets) > self.max_buckets:
+                self.__buckets.popitem(last=False)
+            return 0.0
+
+
+class SharedFileTokenBucketStore(TokenBucketStore):
+    """
+    A store of token buckets shared by all the processes of a host (e.g. the workers of a web server),
+    so that they draw from the same budget. The bucket states are kept in a fixed number of slots of a
+    memory-mapped file, and each acquisition holds an exclusive lock on the file. Once all the slots a
+    key can be stored in are used, the least recently updated bucket is evicted. Requires a POSIX
+    platform (`fcntl`). The rate limiter clock must be shared by the processes, which is the case for
+    the default `time.monotonic` clock on a single host.
+    """
+
+    def __init__(self, path: str, *, slots: int = DEFAULT_SHARED_SLOTS):
+        """
+        The constructor for the SharedFileTokenBucketStore class.
+
+        Args:
+            path (str): The path of the file holding the bucket states, which is created if needed. A file in a memory-backed file system (e.g. "/dev/shm") avoids disk writes.
+            slots (int, optional): The number of bucket slots. All processes sharing the file must use the same number of slots. Defaults to 4096.
+        """
+        try:
+            import fcntl
+        except ImportError as error:
+            raise ImportError(
+                "SharedFileTokenBucketStore requires the fcntl module, which is only available on POSIX platforms."
+            ) from error
+
+        if slots <= 0:
+            raise InvalidArgumentError("The 'slots' argument must be positive")
+
+        self._fcntl = fcntl
+        self.path = path
+        self.slots = slots
+        self.__pid = None
+        self.__lock = threading.Lock()
+        self.__file = None
+        self.__mmap = None
+
+    def try_acquire(self, buckets: List[Bucket], now: float) -> float:
+        with self.__lock:
+            self.__open()
+            self._fcntl.flock(self.__file.fileno(), self._fcntl.LOCK_EX)
+            try:
+                digests = [
+                    hashlib.sha256(key.encode("utf-8")).digest() for (key, _) in buckets
+                ]
+                slot_indexes = []
+                for digest in digests:
+                    slot_indexes.append(self.__find_slot(digest, slot_indexes))
+                states = []
+                for (digest, slot_index, (_, rate_limit)) in zip(
+                    digests, slot_indexes, buckets
+                ):
+                    (slot_digest, tokens, updated_at) = SLOT_FORMAT.unpack_from(
+                        self.__mmap, slot_index * SLOT_FORMAT.size
+                    )
+                    # New buckets, and buckets updated before a restart of the clock, start full
+                    if slot_digest != digest or updated_at > now:
+                        (tokens, updated_at) = (rate_limit.capacity, now)
+                    states.append((tokens, updated_at))
+
+                (wait, refilled) = acquire_refilled_tokens(buckets, states, now)
+                if wait > 0:
+                    return wait
+
+                for (digest, slot_index, tokens) in zip(
+                    digests, slot_indexes, refilled
+                ):
+                    SLOT_FORMAT.pack_into(
+                        self.__mmap,
+                        slot_index * SLOT_FORMAT.size,
+                        digest,
+                        tokens - 1,
+                        now,
+                    )
+                return 0.0
+            finally:
+                self._fcntl.flock(self.__file.fileno(), self._fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        """
+        Closes the memory-mapped file. The store reopens it if it is used again.
+        """
+        with self.__lock:
+            self.__close()
+
+    def __open(self) -> None:
+        # File locks are held per open file, so each process (including forked ones) opens its own
+        if self.__pid == os.getpid():
+            return
+
+        self.__close()
+        size = self.slots * SLOT_FORMAT.size
+        self.__file = open(self.path, "a+b")
+        self._fcntl.flock(self.__file.fileno(), self._fcntl.LOCK_EX)
+        try:
+            if os.fstat(self.__file.fileno()).st_size < size:
+                os.ftruncate(self.__file.fileno(), size)
+        finally:
+            self._fcntl.flock(self.__file.fileno(), self._fcntl.LOCK_UN)
+        self.__mmap = mmap.mmap(self.__file.fileno(), size)
+        self.__pid = os.getpid()
+
+    def __close(self) -> None:
+        if self.__mmap is not None:
+            self.__mmap.close()
+            self.__mmap = None
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+        self.__pid = None
+
+    def __find_slot(self, digest: bytes, reserved_slot_indexes: List[int]) -> int:
+        """
+        Returns the slot of a bucket: its current slot, an empty slot, or else the least recently updated
+        slot among the slots it can be stored in. The slots reserved for the other buckets of the same
+        acquisition are never returned, so that two buckets of a request never share a slot.
+
+        Raises:
+            InvalidArgumentError: Error if all the slots the bucket can be stored in are reserved, i.e. the store has fewer slots than the buckets of a request
+        """
+        first_slot_index = int.from_bytes(digest[:8], "little") % self.slots
+        oldest_slot_index = None
+        oldest_updated_at = None
+        for probe in range(min(MAX_SLOT_PROBES, self.slots)):
+            slot_index = (first_slot_index + probe) % self.slots
+            if slot_index in reserved_slot_indexes:
+                continue
+            (slot_digest, _, updated_at) = SLOT_FORMAT.unpack_from(
+                self.__mmap, slot_index * SLOT_FORMAT.size
+            )
+            if slot_digest == digest or slot_digest == EMPTY_DIGEST:
+                return slot_index
+            if oldest_updated_at is None or updated_at < oldest_updated_at:
+                (oldest_slot_index, oldest_updated_at) = (slot_index, updated_at)
+        if oldest_slot_index is None:
+            raise InvalidArgumentError(
+                f"The SharedFileTokenBucketStore has no free slot for bucket {len(reserved_slot_indexes) + 1} of the request, as its {self.slots} slots are fewer than the buckets of the request"
+            )
+        return oldest_slot_index
+
+
+class RateLimiter:
+    """
+    A client-side rate limiter pacing requests with token buckets, so that requests are delayed (or
+    rejected) before they would be throttled by the API. Buckets can be scoped to the whole application,
+    to each access token (member), to each resource path, or to each access token and resource path.
+    A request is only sent once a token is available in every bucket it belongs to.
+    """
+
+    def __init__(
+        self,
+        *,
+        per_application: Optional[RateLimit] = None,
+        per_access_token: Optional[RateLimit] = None,
+        per_resource_path: Optional[RateLimit] = None,
+        per_access_token_and_resource_path: Optional[RateLimit] = None,
+        store: Optional[TokenBucketStore] = None,
+        blocking: bool = True,
+        max_wait: Optional[float] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        The constructor for the RateLimiter class.
+
+        Args:
+            per_application (Optional[RateLimit], optional): The rate limit of all requests. Defaults to None.
+            per_access_token (Optional[RateLimit], optional): The rate limit of the requests of each access token. Defaults to None.
+            per_resource_path (Optional[RateLimit], optional): The rate limit of the requests to each resource path template (e.g. "/adAccounts/{id}"). Defaults to None.
+            per_access_token_and_resource_path (Optional[RateLimit], optional): The rate limit of the requests of each access token to each resource path template. Defaults to None.
+            store (Optional[TokenBucketStore], optional): The storage of the bucket states. Defaults to an InMemoryTokenBucketStore.
+            blocking (bool, optional): If True, `acquire()` waits until the tokens are available. Otherwise, it raises a RateLimitExceededError if they are not. Defaults to True.
+            max_wait (Optional[float], optional): The maximum time in seconds a blocking `acquire()` waits before raising a RateLimitExceededError. Defaults to None (no maximum).
+            sleep (Callable[[float], None], optional): The function used to wait for tokens. Defaults to time.sleep.
+            clock (Callable[[], float], optional): The monotonic clock used to refill the buckets, in seconds. Defaults to time.monotonic.
+        """
+        self.per_application = per_application
+        self.per_access_token = per_access_token
+        self.per_resource_path = per_resource_path
+        self.per_access_token_and_resource_path = per_access_token_and_resource_path
+        self.store = store if store is not None else InMemoryTokenBucketStore()
+        self.blocking = blocking
+        self.max_wait = max_wait
+        self.sleep = sleep
+        self.clock = clock
+
+    def try_acquire(self, *, access_token: str, resource_path: str) -> bool:
+        """
+        Consumes a token for a request if one is available in every bucket of the request, without waiting.
+
+        Args:
+            access_token (str): The access token of the request
+            resource_path (str): The resource path template of the request
+
+        Returns:
+            bool: Whether the tokens were consumed
+        """
+        buckets = self.get_buckets(
+            access_token=access_token, resource_path=resource_path
+        )
+        return not buckets or self.store.try_acquire(buckets, self.clock()) == 0
+
+    def acquire(
+        self, *, access_token: str, resource_path: str, blocking: Optional[bool] = None
+    ) -> None:
+        """
+        Consumes a token for a request from every bucket of the request, waiting for the tokens to become
+        available in blocking mode.
+
+        Args:
+            access_token (str): The access token of the request
+            resource_path (str): The resource path template of the request
+            blocking (Optional[bool], optional): Overrides the `blocking` mode of the rate limiter. Defaults to None.
+
+        Raises:
+            RateLimitExceededError: If the tokens are not available in non-blocking mode, or within `max_wait` seconds in blocking mode
+        """
+        buckets = self.get_buckets(
+            access_token=access_token, resource_path=resource_path
+        )
+        if not buckets:
+            return
+
+        blocking = self.blocking if blocking is None else blocking
+        start = self.clock()
+        while True:
+            now = self.clock()
+            wait = self.store.try_acquire(buckets, now)
+            if wait == 0:
+                return
+            if not blocking or (
+                self.max_wait is not None and now - start + wait > self.max_wait
+            ):
+                raise RateLimitExceededError(
+                    f"The client-side rate limit for '{resource_path}' is exceeded, retry in {wait:.3f} seconds"
+                )
+            self.sleep(wait)
+
+    def get_buckets(self, *, access_token: str, resource_path: str) -> List[Bucket]:
+        """
+        Returns the keys and rate limits of the buckets of a request. Access tokens are only included in
+        the keys as a digest.
+        """
+        access_token_digest = hashlib.sha256(access_token.encode("utf-8")).hexdigest()
+        buckets = []
+        if self.per_application is not None:
+            buckets.append((APPLICATION_SCOPE, self.per_application))
+        if self.per_access_token is not None:
+            buckets.append(
+                (f"{ACCESS_TOKEN_SCOPE}:{access_token_digest}", self.per_access_token)
+            )
+        if self.per_resource_path is not None:
+            buckets.append(
+                (f"{RESOURCE_PATH_SCOPE}:{resource_path}", self.per_resource_path)
+            )
+        if self.per_access_token_and_resource_path is not None:
+            buckets.append(
+                (
+                    f"{ACCESS_TOKEN_AND_RESOURCE_PATH_SCOPE}:{access_token_digest}:{resource_path}",
+                    self.per_access_token_and_resource_path,
+                )
+            )
+        return buckets
@@ -1,8 +1,80 @@
 from requests import Response
-from typing import Dict
+from typing import Any, Callable, Dict
+from linkedin_api.common.errors import ResponseFormattingError
+
+
+def _resolved_value(value: Any) -> Any:
+    return value
+
+
+class LazyValue:
+    """
+    A value computed by a function on first access, and then memoized. Used by the response formatters
+    to defer decoding the response body until a field derived from it is accessed.
+
+    The function is usually a closure, which cannot be pickled, so a LazyValue is pickled (and copied)
+    as its resolved value instead: the value is computed if needed, and the unpickled object holds the
+    plain value.
+    """
+
+    __slots__ = ("function", "value", "computed")
+
+    def __init__(self, function: Callable[[], Any]):
+        self.function = function
+        self.value = None
+        self.computed = False
+
+    def get(self) -> Any:
+        """
+        Returns the value, computing it on the first call.
+
+        Raises:
+            ResponseFormattingError: Error if computing the value failed
+        """
+        if not self.computed:
+            try:
+                value = self.function()
+            except Exception as e:
+                raise ResponseFormattingError from e
+            # Concurrent first accesses may both compute the value, but all callers then share the first
+            # stored one
+            if not self.computed:
+                self.value = value
+                self.computed = True
+                self.function = None
+        return self.value
+
+    def __reduce__(self):
+        return (_resolved_value, (self.get(),))
+
+
+class LazyField:
+    """
+    A descriptor for a response attribute that can be assigned either a value, or a LazyValue that is
+    resolved on first access. The resolved value replaces the LazyValue, so that later accesses are
+    plain attribute reads. The value is stored in the attribute named after the field with a leading
+    underscore, which classes declaring `__slots__` must include.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.storage_name = f"_{name}"
+
+    def __get__(self, instance: Any, owner: type = None) -> Any:
+        if instance is None:
+            return self
+        value = getattr(instance, self.storage_name)
+        if type(value) is LazyValue:
+            value = value.get()
+            setattr(instance, self.storage_name, value)
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        setattr(instance, self.storage_name, value)
 
 
 class BaseResponse:
+    __slots__ = ("status_code", "response", "headers", "url")
+
     def __init__(
         self,
         status_code: int,
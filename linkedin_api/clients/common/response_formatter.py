@@ -1,16 +1,17 @@
 from abc import ABC, abstractmethod
 from functools import wraps
-from typing import Generic, TypeVar
+from typing import Generic, Optional, TypeVar
 from requests import Response
+from linkedin_api.clients.common.json_codec import JsonCodec
 from linkedin_api.common.errors import ResponseFormattingError
 from linkedin_api.clients.common.response import BaseResponse
 
 
 def wrap_format_exception(fn):
     @wraps(fn)
-    def wrap(cls, response: Response):
+    def wrap(cls, response: Response, **kwargs):
         try:
-            return fn(cls, response)
+            return fn(cls, response, **kwargs)
         except Exception as e:
             raise ResponseFormattingError from e
 
@@ -23,5 +24,14 @@ T = TypeVar("T", bound=BaseResponse)
 class BaseResponseFormatter(ABC, Generic[T]):
     @classmethod
     @abstractmethod
-    def format_response(cls, response: Response) -> T:
+    def format_response(
+        cls, response: Response, *, json_codec: Optional[JsonCodec] = None
+    ) -> T:
+        """
+        Formats a response.
+
+        Args:
+            response (Response): The response
+            json_codec (Optional[JsonCodec], optional): The codec parsing the JSON body. Defaults to the default codec (see `get_default_json_codec()`).
+        """
         pass
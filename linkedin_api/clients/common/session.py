@@ -0,0 +1,167 @@
+import socket
+from typing import Any, Dict, Optional, Tuple, Union
+import requests
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
+from urllib3.connection import HTTPConnection
+from linkedin_api.common.errors import InvalidArgumentError
+
+Timeout = Union[None, float, Tuple[Optional[float], Optional[float]]]
+
+
+class SessionConfig:
+    """
+    The connection pooling, timeout and keep-alive settings of the requests.Session used by a client.
+    The defaults match the defaults of a bare requests.Session.
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        pool_block: bool = DEFAULT_POOLBLOCK,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        tcp_keepalive: bool = False,
+        tcp_keepalive_idle: Optional[int] = None,
+    ):
+        """
+        The constructor for the SessionConfig class.
+
+        Args:
+            pool_connections (int, optional): The number of connection pools (one per host) to keep. Defaults to 10.
+            pool_maxsize (int, optional): The maximum number of connections kept alive per host. Set it to at least the number of threads sending requests concurrently. Defaults to 10.
+            pool_block (bool, optional): If True, requests wait for a pooled connection to be available instead of opening connections that are discarded after use. Defaults to False.
+            connect_timeout (Optional[float], optional): The default timeout in seconds to establish a connection. Defaults to None (no timeout).
+            read_timeout (Optional[float], optional): The default timeout in seconds to wait for the server between bytes of the response. Defaults to None (no timeout).
+            tcp_keepalive (bool, optional): If True, TCP keep-alive probes are enabled on the connections, so that idle pooled connections dropped by the network are detected. Defaults to False.
+            tcp_keepalive_idle (Optional[int], optional): The idle time in seconds before the first keep-alive probe, on platforms supporting it. Defaults to None (the system default).
+        """
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise InvalidArgumentError(
+                "The 'pool_connections' and 'pool_maxsize' arguments must be positive"
+            )
+
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.tcp_keepalive = tcp_keepalive
+        self.tcp_keepalive_idle = tcp_keepalive_idle
+
+    @property
+    def timeout(self) -> Timeout:
+        """
+        The default (connect, read) timeout of the requests, or None if neither is set.
+        """
+        if self.connect_timeout is None and self.read_timeout is None:
+            return None
+        return (self.connect_timeout, self.read_timeout)
+
+    @property
+    def socket_options(self) -> Optional[list]:
+        """
+        The socket options of the connections, or None for the urllib3 defaults.
+        """
+        if not self.tcp_keepalive:
+            return None
+
+        options = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        ]
+        if self.tcp_keepalive_idle is not None and hasattr(socket, "TCP_KEEPIDLE"):
+            options.append(
+                (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self.tcp_keepalive_idle)
+            )
+        return options
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    An HTTPAdapter applying the pooling, timeout and keep-alive settings of a SessionConfig. The default
+    timeout only applies to requests sent without an explicit timeout.
+    """
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["session_config"]
+
+    def __init__(self, config: SessionConfig):
+        """
+        The constructor for the PooledHTTPAdapter class.
+
+        Args:
+            config (SessionConfig): The session settings
+        """
+        # HTTPAdapter uses the `config` attribute for its own settings
+        self.session_config = config
+        super().__init__(
+            pool_connections=config.pool_connections,
+            pool_maxsize=config.pool_maxsize,
+            pool_block=config.pool_block,
+        )
+
+    def init_poolmanager(self, *args, **pool_kwargs):
+        socket_options = self.session_config.socket_options
+        if socket_options is not None:
+            pool_kwargs["socket_options"] = socket_options
+        super().init_poolmanager(*args, **pool_kwargs)
+
+    def send(self, request, timeout=None, **kwargs):
+        if timeout is None:
+            timeout = self.session_config.timeout
+        return super().send(request, timeout=timeout, **kwargs)
+
+    def get_pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the usage statistics of the connection pool of each host, keyed by "scheme://host:port".
+        Each entry contains the maximum number of kept-alive connections (`maxsize`), the number of
+        connections opened (`num_connections`) and requests sent (`num_requests`) since the pool was
+        created, and the number of idle connections available for reuse (`idle_connections`).
+        """
+        stats = {}
+        pools = self.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            idle_connections = sum(
+                connection is not None for connection in list(pool.pool.queue)
+            )
+            stats[f"{pool.scheme}://{pool.host}:{pool.port}"] = {
+                "maxsize": pool.pool.maxsize,
+                "num_connections": pool.num_connections,
+                "num_requests": pool.num_requests,
+                "idle_connections": idle_connections,
+            }
+        return stats
+
+
+def create_session(config: Optional[SessionConfig] = None) -> requests.Session:
+    """
+    Creates a requests.Session whose HTTP and HTTPS adapters apply the specified settings.
+
+    Args:
+        config (Optional[SessionConfig], optional): The session settings. Defaults to a SessionConfig with the requests defaults.
+
+    Returns:
+        requests.Session: The session
+    """
+    config = config if config is not None else SessionConfig()
+    session = requests.Session()
+    adapter = PooledHTTPAdapter(config)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_pool_stats(session: requests.Session) -> Dict[str, Dict[str, Any]]:
+    """
+    Returns the connection pool usage statistics of the PooledHTTPAdapters mounted on a session. See
+    `PooledHTTPAdapter.get_pool_stats()`.
+    """
+    stats = {}
+    adapters = {id(adapter): adapter for adapter in session.adapters.values()}
+    for adapter in adapters.values():
+        if isinstance(adapter, PooledHTTPAdapter):
+            stats.update(adapter.get_pool_stats())
+    return stats
@@ -0,0 +1,131 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from requests import PreparedRequest, Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+
+class AsyncTransport(ABC):
+    """
+    The interface for sending prepared requests over an asyncio HTTP client. Implementations must return
+    a `requests.Response` so that the existing response formatters can be reused as-is.
+    """
+
+    @abstractmethod
+    async def send(self, prepared_request: PreparedRequest) -> Response:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+class AiohttpTransport(AsyncTransport):
+    """
+    An asyncio transport built on top of aiohttp. A single aiohttp ClientSession (and its connection
+    pool) is lazily created on first use and shared by all requests, so many concurrent requests can be
+    multiplexed on one event loop. Requires the `aiohttp` package to be installed.
+    """
+
+    def __init__(
+        self,
+        *,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        timeout: Optional[float] = None,
+    ):
+        """
+        The constructor for the AiohttpTransport class.
+
+        Args:
+            limit (int, optional): The total number of simultaneous connections in the pool. Defaults to 100.
+            limit_per_host (int, optional): The number of simultaneous connections to a single host. 0 means no limit. Defaults to 0.
+            timeout (Optional[float], optional): The total timeout in seconds for each request. Defaults to None (no timeout).
+        """
+        try:
+            import aiohttp
+        except ImportError as error:
+            raise ImportError(
+                'The aiohttp package is required to use AiohttpTransport. Install it with `pip install "linkedin-api-client[async]"`.'
+            ) from error
+
+        self._aiohttp = aiohttp
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self._session = None
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            self._session = self._aiohttp.ClientSession(
+                connector=self._aiohttp.TCPConnector(
+                    limit=self.limit, limit_per_host=self.limit_per_host
+                ),
+                timeout=self._aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def send(self, prepared_request: PreparedRequest) -> Response:
+        body = prepared_request.body
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        # Let aiohttp compute the content length of the (possibly re-encoded) body
+        headers = {
+            k: v
+            for (k, v) in prepared_request.headers.items()
+            if k.lower() != "content-length"
+        }
+
+        async with self._get_session().request(
+            method=prepared_request.method,
+            url=prepared_request.url,
+            headers=headers,
+            data=body,
+        ) as aiohttp_response:
+            content = await aiohttp_response.read()
+            return to_requests_response(
+                prepared_request=prepared_request,
+                status_code=aiohttp_response.status,
+                reason=aiohttp_response.reason,
+                url=str(aiohttp_response.url),
+                headers=aiohttp_response.headers,
+                content=content,
+            )
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+def to_requests_response(
+    *,
+    prepared_request: PreparedRequest,
+    status_code: int,
+    url: str,
+    headers,
+    content: bytes,
+    reason: Optional[str] = None,
+) -> Response:
+    """
+    Builds a `requests.Response` from the raw parts of a response received by another HTTP client.
+
+    Args:
+        prepared_request (PreparedRequest): The request that produced this response
+        status_code (int): The response status code
+        url (str): The final URL location of the response
+        headers: A mapping of response headers
+        content (bytes): The raw response body
+        reason (Optional[str], optional): The response reason phrase. Defaults to None.
+
+    Returns:
+        Response: The equivalent requests.Response object
+    """
+    response = Response()
+    response.status_code = status_code
+    response.reason = reason
+    response.url = url
+    response.headers = CaseInsensitiveDict(headers)
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.request = prepared_request
+    response._content = content
+    return response
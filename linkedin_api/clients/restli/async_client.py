@@ -0,0 +1,543 @@
+import copy
+from typing import Dict, Any, List, Optional, Type, Tuple, TypeVar
+import linkedin_api.clients.restli.utils.encoder as encoder
+from linkedin_api.clients.common.transport import AsyncTransport, AiohttpTransport
+from linkedin_api.clients.common.concurrency import AsyncAdaptiveConcurrencyLimiter
+from linkedin_api.clients.common.json_codec import JsonCodec
+from linkedin_api.clients.restli.utils.restli import (
+    encode_query_params_for_get_requests,
+    prepare_restli_request,
+)
+from linkedin_api.common.constants import RESTLI_METHODS
+from linkedin_api.clients.restli.response_formatter import (
+    BaseResponseFormatter,
+    ActionResponseFormatter,
+    BatchCreateResponseFormatter,
+    BatchDeleteResponseFormatter,
+    BatchFinderResponseFormatter,
+    CollectionResponseFormatter,
+    BatchGetResponseFormatter,
+    CreateResponseFormatter,
+    GetResponseFormatter,
+    BatchUpdateResponseFormatter,
+    DeleteResponseFormatter,
+    UpdateResponseFormatter,
+)
+from linkedin_api.clients.restli.response import (
+    BaseRestliResponse,
+    ActionResponse,
+    BatchCreateResponse,
+    BatchDeleteResponse,
+    BatchFinderResponse,
+    BatchUpdateResponse,
+    CreateResponse,
+    GetResponse,
+    BatchGetResponse,
+    CollectionResponse,
+    RestliEntity,
+    UpdateResponse,
+)
+from linkedin_api.clients.restli.client import RestliEntityId
+
+T = TypeVar("T", bound=BaseRestliResponse)
+
+
+class AsyncRestliClient:
+    """
+    An asyncio client for making Rest.li-based, LinkedIn API calls. It exposes the same methods as
+    RestliClient, but each method is a coroutine, so many requests can be in flight concurrently on a
+    single event loop without a thread per request. Requests are encoded, query tunneled and formatted
+    exactly like they are by RestliClient.
+
+    Attributes:
+        transport (AsyncTransport): The asyncio transport used to send the API requests. Defaults to an
+        AiohttpTransport, which requires the `aiohttp` package to be installed.
+        concurrency_limiter (Optional[AsyncAdaptiveConcurrencyLimiter]): The adaptive limiter of the number of
+        requests in flight, if enabled.
+        json_codec (Optional[JsonCodec]): The JSON codec serializing request bodies and parsing response
+        bodies, or None to use the default codec.
+    """
+
+    def __init__(
+        self,
+        transport: Optional[AsyncTransport] = None,
+        *,
+        concurrency_limiter: Optional[AsyncAdaptiveConcurrencyLimiter] = None,
+        json_codec: Optional[JsonCodec] = None
+    ):
+        """
+        The constructor for the AsyncRestliClient class.
+
+        Args:
+            transport (Optional[AsyncTransport], optional): The asyncio transport to use for sending requests. Defaults to an AiohttpTransport.
+            concurrency_limiter (Optional[AsyncAdaptiveConcurrencyLimiter], optional): If specified, concurrent requests wait while the number of requests in flight reaches the limit of the limiter, which adapts to the response latencies and to throttled (429) or unavailable (503) responses. Defaults to None (no limit).
+            json_codec (Optional[JsonCodec], optional): The JSON codec serializing request bodies and parsing response bodies. Defaults to None (the default codec, the standard library unless configured otherwise, see `get_default_json_codec()`).
+        """
+        self.transport = transport if transport is not None else AiohttpTransport()
+        self.concurrency_limiter = concurrency_limiter
+        self.json_codec = json_codec
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Closes the underlying transport and releases its pooled connections.
+        """
+        await self.transport.close()
+
+    async def get(
+        self,
+        *,
+        resource_path: str,
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> GetResponse:
+        """
+        Makes a Rest.li GET request to fetch the specified entity on a resource. See `RestliClient.get()`
+        for details on the arguments.
+
+        Example:
+            >>> response = await async_restli_client.get(
+                    resource_path="/adAccounts/{id}",
+                    path_keys={ "id": 123 },
+                    access_token=MY_ACCESS_TOKEN,
+                    version_string="202302"
+                )
+            >>> ad_account = response.entity
+        """
+        encoded_query_param_string = encode_query_params_for_get_requests(query_params)
+
+        return await self.__send_and_format_response(
+            restli_method=RESTLI_METHODS.GET,
+            resource_path=resource_path,
+            path_keys=path_keys,
+            encoded_query_param_string=encoded_query_param_string,
+            access_token=access_token,
+            version_string=version_string,
+            formatter=GetResponseFormatter,
+        )
+
+    async def batch_get(
+        self,
+        *,
+        resource_path: str,
+        ids: List[RestliEntityId],
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> BatchGetResponse:
+        """
+        Makes a Rest.li BATCH_GET request to fetch multiple entities on a resource. See
+        `RestliClient.batch_get()` for details on the arguments.
+        """
+        query_params_final = copy.deepcopy(query_params) if query_params else {}
+        query_params_final.update({"ids": ids})
+        encoded_query_param_string = encode_query_params_for_get_requests(
+            query_params_final
+        )
+
+        return await self.__send_and_format_response(
+            restli_method=RESTLI_METHODS.BATCH_GET,
+            resource_path=resource_path,
+            path_keys=path_keys,
+            encoded_query_param_string=encoded_query_param_string,
+            access_token=access_token,
+            version_string=version_string,
+            formatter=BatchGetResponseFormatter,
+        )
+
+    async def get_all(
+        self,
+        *,
+        resource_path: str,
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> CollectionResponse:
+        """
+        Makes a Rest.li GET_ALL request to fetch all entities on a resource. See `RestliClient.get_all()`
+        for details on the arguments.
+        """
+        encoded_query_param_string = encode_query_params_for_get_requests(query_params)
+
+        return await self.__send_and_format_response(
+            restli_method=RESTLI_METHODS.GET_ALL,
+            resource_path=resource_path,
+            path_keys=path_keys,
+            encoded_query_param_string=encoded_query_param_string,
+            access_token=access_token,
+            version_string=version_string,
+            formatter=CollectionResponseFormatter,
+        )
+
+    async def finder(
+        self,
+        *,
+        resource_path: str,
+        finder_name: str,
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> CollectionResponse:
+        """
+        Makes a Rest.li FINDER request to find entities by some specified criteria. See
+        `RestliClient.finder()` for details on the arguments.
+        """
+        final_query_params = copy.deepcopy(query_params) if query_params else {}
+        final_query_params.update({"q": finder_name})
+        encoded_query_param_string = encode_query_params_for_get_requests(
+            final_query_params
+        )
+
+        return await self.__send_and_format_response(
+            restli_method=RESTLI_METHODS.FINDER,
+            resource_path=resource_path,
+            path_keys=path_keys,
+            encoded_query_param_string=encoded_query_param_string,
+            access_token=access_token,
+            version_string=version_string,
+            formatter=CollectionResponseFormatter,
+        )
+
+    async def batch_finder(
+        self,
+        *,
+        resource_path: str,
+        finder_name: str,
+        finder_criteria: Tuple[str, List[Dict[str, Any]]],
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> BatchFinderResponse:
+        """
+        Makes a Rest.li BATCH_FINDER request to find entities by multiple sets of criteria. See
+        `RestliClient.batch_finder()` for details on the arguments.
+        """
+        final_query_params = copy.deepcopy(query_params) if query_params else {}
+        final_query_params.update({"bq": finder_name})
+        final_query_params.update({finder_criteria[0]: finder_criteria[1]})
+        encoded_query_param_string = encode_query_params_for_get_requests(
+            final_query_params
+        )
+
+        return await self.__send_and_format_response(
+            restli_method=RESTLI_METHODS.BATCH_FINDER,
+            resource_path=resource_path,
+            path_keys=path_keys,
+            encoded_query_param_string=encoded_query_param_string,
+            access_token=access_token,
+            version_string=version_string,
+            formatter=BatchFinderResponseFormatter,
+        )
+
+    async def create(
+        self,
+        *,
+        resource_path: str,
+        entity: RestliEntity,
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> CreateResponse:
+        """
+        Makes a Rest.li CREATE request to create a new resource entity. See `RestliClient.create()` for
+        details on the arguments.
+        """
+        encoded_query_param_string = encoder.param_encode(query_params)
+
+        return await self.__send_and_format_response(
+            restli_method=RESTLI_METHODS.CREATE,
+            resource_path=resource_path,
+            path_keys=path_keys,
+            encoded_query_param_string=encoded_query_param_string,
+            access_token=access_token,
+            request_body=entity,
+            version_string=version_string,
+            formatter=CreateResponseFormatter,
+        )
+
+    async def batch_create(
+        self,
+        *,
+        resource_path: str,
+        entities: List[RestliEntity],
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> BatchCreateResponse:
+        """
+        Makes a Rest.li BATCH_CREATE request to create multiple entities in a single call. See
+        `RestliClient.batch_create()` for details on the arguments.
+        """
+        encoded_query_param_string = encoder.param_encode(query_params)
+        request_body = {"elements": entities}
+
+        return await self.__send_and_format_response(
+            restli_method=RESTLI_METHODS.BATCH_CREATE,
+            resource_path=resource_path,
+            path_keys=path_keys,
+            encoded_query_param_string=encoded_query_param_string,
+            access_token=access_token,
+            request_body=request_body,
+            version_string=version_string,
+            formatter=BatchCreateResponseFormatter,
+        )
+
+    async def update(
+        self,
+        *,
+        resource_path: str,
+        entity: RestliEntity,
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> UpdateResponse:
+        """
+        Makes a Rest.li UPDATE request to update an entity (overwriting the entity with the provided
+        value). See `RestliClient.update()` for details on the arguments.
+        """
+        encoded_query_param_string = encoder.param_encode(query_params)
+
+        return await self.__send_and_format_response(
+            restli_method=RESTLI_METHODS.UPDATE,
+            resource_path=resource_path,
+            path_keys=path_keys,
+            encoded_query_param_string=encoded_query_param_string,
+            access_token=access_token,
+            request_body=entity,
+            version_string=version_string,
+            formatter=UpdateResponseFormatter,
+        )
+
+    async def batch_update(
+        self,
+        *,
+        resource_path: str,
+        entities: List[RestliEntity],
+        ids: List[RestliEntityId],
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> BatchUpdateResponse:
+        """
+        Makes a Rest.li BATCH_UPDATE request to update multiple entities in a single call. See
+        `RestliClient.batch_update()` for details on the arguments.
+        """
+        final_query_params = copy.deepcopy(query_params) if query_params else {}
+        final_query_params.update({"ids": ids})
+        encoded_query_param_string = encoder.param_encode(final_query_params)
+
+        encoded_ids = [encoder.encode(id) for id in ids]
+        entities_map = dict(zip(encoded_ids, entities))
+        request_body = {"entities": entities_map}
+
+        return await self.__send_and_format_response(
+            restli_method=RESTLI_METHODS.BATCH_UPDATE,
+            resource_path=resource_path,
+            path_keys=path_keys,
+            encoded_query_param_string=encoded_query_param_string,
+            request_body=request_body,
+            access_token=access_token,
+            version_string=version_string,
+            formatter=BatchUpdateResponseFormatter,
+        )
+
+    async def partial_update(
+        self,
+        *,
+        resource_path: str,
+        patch_set_object: Dict[str, Any],
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> UpdateResponse:
+        """
+        Makes a Rest.li PARTIAL_UPDATE request to update part of an entity. See
+        `RestliClient.partial_update()` for details on the arguments.
+        """
+        encoded_query_param_string = encoder.param_encode(query_params)
+        request_body = {"patch": {"$set": patch_set_object}}
+
+        return await self.__send_and_format_response(
+            restli_method=RESTLI_METHODS.PARTIAL_UPDATE,
+            resource_path=resource_path,
+            path_keys=path_keys,
+            encoded_query_param_string=encoded_query_param_string,
+            request_body=request_body,
+            access_token=access_token,
+            version_string=version_string,
+            formatter=UpdateResponseFormatter,
+        )
+
+    async def batch_partial_update(
+        self,
+        *,
+        resource_path: str,
+        ids: List[RestliEntityId],
+        patch_set_objects: List[Dict[str, Any]],
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> BatchUpdateResponse:
+        """
+        Makes a Rest.li BATCH_PARTIAL_UPDATE request to update multiple entities at once. See
+        `RestliClient.batch_partial_update()` for details on the arguments.
+        """
+        final_query_params = copy.deepcopy(query_params) if query_params else {}
+        final_query_params.update({"ids": ids})
+        encoded_query_param_string = encoder.param_encode(final_query_params)
+
+        id_to_patch_map = dict(zip(ids, patch_set_objects))
+        entities_map = {
+            encoder.encode(id): {"patch": {"$set": patch_set_object}}
+            for (id, patch_set_object) in id_to_patch_map.items()
+        }
+        request_body = {"entities": entities_map}
+
+        return await self.__send_and_format_response(
+            restli_method=RESTLI_METHODS.BATCH_PARTIAL_UPDATE,
+            resource_path=resource_path,
+            path_keys=path_keys,
+            encoded_query_param_string=encoded_query_param_string,
+            request_body=request_body,
+            access_token=access_token,
+            version_string=version_string,
+            formatter=BatchUpdateResponseFormatter,
+        )
+
+    async def delete(
+        self,
+        *,
+        resource_path: str,
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> BaseRestliResponse:
+        """
+        Makes a Rest.li DELETE request to delete an entity. See `RestliClient.delete()` for details on
+        the arguments.
+        """
+        encoded_query_param_string = encoder.param_encode(query_params)
+
+        return await self.__send_and_format_response(
+            restli_method=RESTLI_METHODS.DELETE,
+            resource_path=resource_path,
+            path_keys=path_keys,
+            encoded_query_param_string=encoded_query_param_string,
+            access_token=access_token,
+            version_string=version_string,
+            formatter=DeleteResponseFormatter,
+        )
+
+    async def batch_delete(
+        self,
+        *,
+        resource_path: str,
+        ids: List[RestliEntityId],
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> BatchDeleteResponse:
+        """
+        Makes a Rest.li BATCH_DELETE request to delete multiple entities at once. See
+        `RestliClient.batch_delete()` for details on the arguments.
+        """
+        final_query_params = copy.deepcopy(query_params) if query_params else {}
+        final_query_params.update({"ids": ids})
+        encoded_query_param_string = encoder.param_encode(final_query_params)
+
+        return await self.__send_and_format_response(
+            restli_method=RESTLI_METHODS.BATCH_DELETE,
+            resource_path=resource_path,
+            path_keys=path_keys,
+            encoded_query_param_string=encoded_query_param_string,
+            access_token=access_token,
+            version_string=version_string,
+            formatter=BatchDeleteResponseFormatter,
+        )
+
+    async def action(
+        self,
+        *,
+        resource_path: str,
+        action_name: str,
+        access_token: str,
+        action_params: Optional[Dict[str, Any]] = None,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> ActionResponse:
+        """
+        Makes a Rest.li ACTION request to perform an action on a specified resource. See
+        `RestliClient.action()` for details on the arguments.
+        """
+        final_query_params = copy.deepcopy(query_params) if query_params else {}
+        final_query_params.update({"action": action_name})
+        encoded_query_param_string = encoder.param_encode(final_query_params)
+
+        request_body = action_params if action_params else {}
+
+        return await self.__send_and_format_response(
+            restli_method=RESTLI_METHODS.ACTION,
+            resource_path=resource_path,
+            path_keys=path_keys,
+            encoded_query_param_string=encoded_query_param_string,
+            request_body=request_body,
+            access_token=access_token,
+            version_string=version_string,
+            formatter=ActionResponseFormatter,
+        )
+
+    async def __send_and_format_response(
+        self,
+        *,
+        restli_method: RESTLI_METHODS,
+        resource_path: str,
+        access_token: str,
+        formatter: Type[BaseResponseFormatter[T]],
+        path_keys: Optional[Dict[str, Any]] = None,
+        encoded_query_param_string: Optional[str] = None,
+        request_body: Optional[Any] = None,
+        version_string: Optional[str] = None
+    ) -> T:
+        prepared_request = prepare_restli_request(
+            restli_method=restli_method,
+            resource_path=resource_path,
+            path_keys=path_keys,
+            encoded_query_param_string=encoded_query_param_string,
+            request_body=request_body,
+            access_token=access_token,
+            version_string=version_string,
+            json_codec=self.json_codec,
+        )
+
+        if self.concurrency_limiter is None:
+            response = await self.transport.send(prepared_request)
+            return formatter.format_response(response, json_codec=self.json_codec)
+
+        start = await self.concurrency_limiter.acquire()
+        status_code = None
+        try:
+            response = await self.transport.send(prepared_request)
+            status_code = response.status_code
+        finally:
+            await self.concurrency_limiter.release(start, status_code)
+        return formatter.format_response(response, json_codec=self.json_codec)
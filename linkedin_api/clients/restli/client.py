@@ -1,16 +1,56 @@
 import requests
 import copy
-from typing import Union, Dict, Any, List, Optional, Type, Tuple, TypeVar
-import linkedin_api.clients.restli.utils.api as apiutils
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Union,
+    Dict,
+    Any,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    Tuple,
+    TypeVar,
+    Callable,
+)
 import linkedin_api.clients.restli.utils.encoder as encoder
 from linkedin_api.clients.restli.utils.restli import (
     encode_query_params_for_get_requests,
+    get_request_key,
+    prepare_restli_request,
+)
+from linkedin_api.clients.restli.utils.singleflight import SingleFlight
+from linkedin_api.clients.common.cache import CacheBackend
+from linkedin_api.clients.restli.entity_cache import EntityCache
+from linkedin_api.clients.restli.revalidation import RevalidationCache
+from linkedin_api.clients.restli.retry import RetryPolicy
+from linkedin_api.clients.common.rate_limiter import RateLimiter
+from linkedin_api.clients.common.concurrency import AdaptiveConcurrencyLimiter
+from linkedin_api.clients.common.circuit_breaker import CircuitBreaker
+from linkedin_api.clients.restli.hedging import HedgePolicy
+from linkedin_api.clients.common.json_codec import JsonCodec
+from linkedin_api.clients.common.session import (
+    SessionConfig,
+    create_session,
+    get_pool_stats,
+)
+from linkedin_api.clients.restli.utils.batching import (
+    DEFAULT_MAX_IDS_PER_BATCH,
+    chunk_ids,
+    merge_batch_get_responses,
 )
-from linkedin_api.clients.restli.utils.query_tunneling import (
-    maybe_apply_query_tunneling_get_requests,
-    maybe_apply_query_tunneling_requests_with_body,
+from linkedin_api.clients.restli.utils.query_tunneling import MAX_QUERY_STRING_LENGTH
+from linkedin_api.clients.restli.loader import BatchGetLoader
+from linkedin_api.clients.restli.paginator import Paginator, DEFAULT_PAGE_SIZE
+from linkedin_api.clients.restli.columnar import parse_field_paths
+from linkedin_api.clients.restli.executor import (
+    DEFAULT_MAX_WORKERS,
+    RestliRequest,
+    RestliResult,
+    execute_many,
 )
-from linkedin_api.common.constants import RESTLI_METHODS
+from linkedin_api.common.constants import RESTLI_METHODS, READ_ONLY_RESTLI_METHODS
 from linkedin_api.clients.restli.response_formatter import (
     BaseResponseFormatter,
     ActionResponseFormatter,
@@ -18,6 +58,8 @@ from linkedin_api.clients.restli.response_formatter import (
     BatchDeleteResponseFormatter,
     BatchFinderResponseFormatter,
     CollectionResponseFormatter,
+    StreamingCollectionResponseFormatter,
+    ColumnarCollectionResponseFormatter,
     BatchGetResponseFormatter,
     CreateResponseFormatter,
     GetResponseFormatter,
@@ -36,6 +78,8 @@ from linkedin_api.clients.restli.response import (
     GetResponse,
     BatchGetResponse,
     CollectionResponse,
+    StreamingCollectionResponse,
+    ColumnarCollectionResponse,
     RestliEntity,
     UpdateResponse,
 )
@@ -52,13 +96,137 @@ class RestliClient:
     Attributes:
         session (requests.Session): The session instance used to send the API requests. Session attributes can
         be modified, which will affect all requests.
+        get_loader (Optional[BatchGetLoader]): The loader used to coalesce concurrent GET requests into BATCH_GET
+        requests, if enabled.
+        singleflight_group (Optional[SingleFlight]): The group used to deduplicate concurrent identical read-only
+        requests, if enabled.
+        response_cache (Optional[CacheBackend]): The cache of successful read-only responses, if enabled.
+        entity_cache (Optional[EntityCache]): The per-entity cache of BATCH_GET responses, if enabled.
+        revalidation_cache (Optional[RevalidationCache]): The cache of read-only responses revalidated with
+        conditional requests, if enabled.
+        retry_policy (Optional[RetryPolicy]): The policy for retrying throttled or failed requests, if enabled.
+        rate_limiter (Optional[RateLimiter]): The client-side rate limiter pacing requests, if enabled.
+        concurrency_limiter (Optional[AdaptiveConcurrencyLimiter]): The adaptive limiter of the number of requests
+        in flight, if enabled.
+        circuit_breaker (Optional[CircuitBreaker]): The circuit breaker of the resource paths, if enabled.
+        hedge_policy (Optional[HedgePolicy]): The policy for hedging slow read-only requests, if enabled.
+        json_codec (Optional[JsonCodec]): The JSON codec serializing request bodies and parsing response
+        bodies, or None to use the default codec.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        *,
+        coalesce_get_window: Optional[float] = None,
+        singleflight: bool = False,
+        response_cache: Optional[CacheBackend] = None,
+        entity_cache: Optional[EntityCache] = None,
+        revalidation_cache: Optional[RevalidationCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        json_codec: Optional[JsonCodec] = None,
+        session_config: Optional[SessionConfig] = None
+    ):
         """
         The constructor for the RestliClient class.
+
+        Args:
+            coalesce_get_window (Optional[float], optional): If specified, GET requests on collection entities (e.g. "/adCampaigns/{id}") for the same resource, access token and version, made within this time window in seconds, are coalesced into a single BATCH_GET request. Each caller still receives its own GetResponse. Defaults to None (no coalescing).
+            singleflight (bool, optional): If True, concurrent identical read-only requests (GET, BATCH_GET, GET_ALL, FINDER and BATCH_FINDER requests with the same URL, query string, version and access token) share a single API call, and all callers receive the same response object. Defaults to False.
+            response_cache (Optional[CacheBackend], optional): If specified, successful responses to read-only requests (GET, BATCH_GET, GET_ALL, FINDER and BATCH_FINDER) are stored in this cache, keyed by the URL, query string (including a tunneled query string), version and access token of the request, and returned for subsequent identical requests without an API call. Cached response objects are shared between callers and should not be modified. Use an InMemoryCacheBackend for a bounded LRU cache with a time-to-live. Defaults to None (no caching).
+            entity_cache (Optional[EntityCache], optional): If specified, the entities returned by BATCH_GET requests are cached individually, and subsequent BATCH_GET requests only fetch the ids that are not cached. Not found entities are cached as well. Defaults to None (no caching).
+            revalidation_cache (Optional[RevalidationCache], optional): If specified, the ETag and Last-Modified validators of successful responses to read-only requests are stored along with the responses. Subsequent identical requests are sent with the If-None-Match and If-Modified-Since headers, and a 304 (Not Modified) response is turned into the cached response, without downloading or parsing the body again. Defaults to None (no revalidation).
+            retry_policy (Optional[RetryPolicy], optional): If specified, throttled (429) and failed (5xx or connection error) requests are retried with exponential backoff and jitter, honoring the Retry-After header. Only throttled requests are retried for non-idempotent methods (CREATE, BATCH_CREATE, PARTIAL_UPDATE, BATCH_PARTIAL_UPDATE and ACTION). Defaults to None (no retries).
+            rate_limiter (Optional[RateLimiter], optional): If specified, a token is acquired from the rate limiter before each request (including each retry) is sent, which waits for the token or raises a RateLimitExceededError depending on the mode of the rate limiter. Requests served from a cache do not consume tokens. Defaults to None (no rate limiting).
+            concurrency_limiter (Optional[AdaptiveConcurrencyLimiter], optional): If specified, requests sent concurrently (e.g. from a thread pool) wait while the number of requests in flight reaches the limit of the limiter, which adapts to the response latencies and to throttled (429) or unavailable (503) responses. Defaults to None (no limit).
+            circuit_breaker (Optional[CircuitBreaker], optional): If specified, requests are tracked with one circuit per resource path template (e.g. "/adAnalytics"). Once the failure rate (5xx responses and connection errors) of a resource path reaches the threshold, its requests fail fast with a CircuitOpenError until trial requests succeed again. Defaults to None (no circuit breaking).
+            hedge_policy (Optional[HedgePolicy], optional): If specified, a duplicate of a read-only request is sent when no response is received within a percentile of the observed latencies, and the first response received is returned. The policy budget caps the number of duplicate requests. Defaults to None (no hedging).
+            json_codec (Optional[JsonCodec], optional): The JSON codec serializing request bodies and parsing response bodies. Defaults to None (the default codec, the standard library unless configured otherwise, see `get_default_json_codec()`).
+            session_config (Optional[SessionConfig], optional): The connection pool size and blocking behavior, default connect and read timeouts, and TCP keep-alive settings of the session. Defaults to None (the requests defaults).
+        """
+        self.session = create_session(session_config)
+        self.get_loader = (
+            BatchGetLoader(self, window_seconds=coalesce_get_window)
+            if coalesce_get_window is not None
+            else None
+        )
+        self.singleflight_group = SingleFlight() if singleflight else None
+        self.response_cache = response_cache
+        self.entity_cache = entity_cache
+        self.revalidation_cache = revalidation_cache
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.concurrency_limiter = concurrency_limiter
+        self.circuit_breaker = circuit_breaker
+        self.hedge_policy = hedge_policy
+        self.json_codec = json_codec
+
+    def get_pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the usage statistics of the connection pool of each host the session is connected to,
+        keyed by "scheme://host:port". See `PooledHTTPAdapter.get_pool_stats()`.
+        """
+        return get_pool_stats(self.session)
+
+    def execute(self, request: RestliRequest) -> BaseRestliResponse:
+        """
+        Sends a request described by a RestliRequest, by calling the RestliClient method of its Rest.li
+        method with its keyword arguments.
+
+        Args:
+            request (RestliRequest): The request to send
+
+        Returns:
+            BaseRestliResponse: The response of the RestliClient method (e.g. a BatchGetResponse for a BATCH_GET request)
+        """
+        return getattr(self, request.client_method_name)(**request.kwargs)
+
+    def execute_many(
+        self,
+        restli_requests: Sequence[RestliRequest],
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        ordered: bool = True
+    ) -> Iterator[RestliResult]:
+        """
+        Sends many requests concurrently on a bounded thread pool. The requests share the session (and
+        its connection pool) and the caches, limiters and policies of the client, which are thread-safe.
+        For the connections to be reused, set `pool_maxsize` of the `session_config` to at least
+        `max_workers`. The error raised by a request is captured in its result instead of being raised,
+        so that one failing request does not prevent getting the responses of the others.
+
+        Args:
+            restli_requests (Sequence[RestliRequest]): The requests to send
+            max_workers (int, optional): The maximum number of requests sent concurrently. Defaults to 8.
+            ordered (bool, optional): If True, the results are returned in the order of the requests, otherwise as the requests complete. The `index` of each result is its position in the requests. Defaults to True.
+
+        Returns:
+            Iterator[RestliResult]: The result of each request, with either its `response` or its `error`. All the requests are submitted when this method returns; requests that have not started yet are cancelled if the iteration is abandoned.
+
+        Example:
+            >>> results = restli_client.execute_many(
+                    [
+                        RestliRequest(
+                            RESTLI_METHODS.GET,
+                            resource_path="/adAccounts/{id}",
+                            path_keys={"id": account_id},
+                            access_token=MY_ACCESS_TOKEN,
+                            version_string="202302"
+                        )
+                        for account_id in account_ids
+                    ],
+                    max_workers=16
+                )
+            >>> for result in results:
+                    if result.ok:
+                        process(result.response.entity)
         """
-        self.session = requests.Session()
+        return execute_many(
+            self.execute, restli_requests, max_workers=max_workers, ordered=ordered
+        )
 
     def get(
         self,
@@ -94,6 +262,17 @@ class RestliClient:
             >>> ad_account = response.entity
         """
 
+        if self.get_loader is not None and self.get_loader.can_load(
+            resource_path, path_keys
+        ):
+            return self.get_loader.get(
+                resource_path=resource_path,
+                access_token=access_token,
+                path_keys=path_keys,
+                query_params=query_params,
+                version_string=version_string,
+            )
+
         encoded_query_param_string = encode_query_params_for_get_requests(query_params)
 
         return self.__send_and_format_response(
@@ -140,6 +319,43 @@ class RestliClient:
                 )
             >>> campaign_groups = response.results.items()
         """
+        if self.entity_cache is not None:
+            return self.entity_cache.batch_get(
+                lambda missing_ids: self.__batch_get(
+                    resource_path=resource_path,
+                    ids=missing_ids,
+                    access_token=access_token,
+                    path_keys=path_keys,
+                    query_params=query_params,
+                    version_string=version_string,
+                ),
+                resource_path=resource_path,
+                ids=ids,
+                access_token=access_token,
+                path_keys=path_keys,
+                query_params=query_params,
+                version_string=version_string,
+            )
+
+        return self.__batch_get(
+            resource_path=resource_path,
+            ids=ids,
+            access_token=access_token,
+            path_keys=path_keys,
+            query_params=query_params,
+            version_string=version_string,
+        )
+
+    def __batch_get(
+        self,
+        *,
+        resource_path: str,
+        ids: List[RestliEntityId],
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None
+    ) -> BatchGetResponse:
         query_params_final = copy.deepcopy(query_params) if query_params else {}
 
         query_params_final.update({"ids": ids})
@@ -157,6 +373,88 @@ class RestliClient:
             formatter=BatchGetResponseFormatter,
         )
 
+    def batch_get_chunked(
+        self,
+        *,
+        resource_path: str,
+        ids: List[RestliEntityId],
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None,
+        max_ids_per_request: int = DEFAULT_MAX_IDS_PER_BATCH,
+        max_query_string_length: int = MAX_QUERY_STRING_LENGTH,
+        max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> BatchGetResponse:
+        """
+        Fetches a large number of entities on a resource by splitting the ids into chunks, making a Rest.li
+        BATCH_GET request for each chunk concurrently, and merging the chunk responses. Chunks are bounded
+        both by number of ids and by encoded query string length, so that chunks stay within server-side
+        batch limits and do not require query tunneling.
+
+        Args:
+            resource_path (str): The resource path after the base URL, beginning with a forward slash. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
+            ids (List[RestliEntityId]): The list of ids to fetch on a resource. These will be properly encoded by this method and added to the query parameters.
+            access_token (str): The access token that should provide the application access to the specified API.
+            path_keys (Optional[Dict[str, Any]], optional): If there are path key placeholders as part of the `resource_path` argument, the key placeholders must be specified in this `path_keys` dictionary. The path key values can be strings, numbers, or objects, and these will be properly encoded. Defaults to None.
+            query_params (Optional[Dict[str, Any]], optional): A dictionary of query parameters, where the key is the query parameter name, and the value is the query parameter value. This method will properly encode the query parameters. Defaults to {}.
+            version_string (Optional[str], optional): A version string of the format "YYYYMM" or "YYYYMM.RR". If specified, the version header will be passed and the request will use the versioned APIs base URL. Defaults to None.
+            max_ids_per_request (int, optional): The maximum number of ids per BATCH_GET request. Defaults to 100.
+            max_query_string_length (int, optional): The maximum length of the encoded query string of each BATCH_GET request. Defaults to the query tunneling threshold.
+            max_workers (int, optional): The maximum number of BATCH_GET requests made concurrently. Defaults to 8.
+
+        Returns:
+            BatchGetResponse: An instance of the BatchGetResponse class with the merged `results`, `statuses` and `errors` of all the chunks. The status code is the first unsuccessful chunk status code if any. The url, headers and raw response are the ones of the first chunk.
+
+        Example:
+            >>> response = restli_client.batch_get_chunked(
+                    resource_path="/adCreatives",
+                    ids=creative_urns,
+                    access_token=MY_ACCESS_TOKEN,
+                    version_string="202302",
+                    max_ids_per_request=200
+                )
+            >>> creatives = response.results
+        """
+        base_query_params = copy.deepcopy(query_params) if query_params else {}
+        base_query_params.update({"ids": []})
+        base_encoded_length = len(
+            encode_query_params_for_get_requests(base_query_params)
+        )
+
+        id_chunks = chunk_ids(
+            ids,
+            max_ids=max_ids_per_request,
+            max_encoded_length=max_query_string_length,
+            base_encoded_length=base_encoded_length,
+        )
+        if len(id_chunks) <= 1:
+            return self.batch_get(
+                resource_path=resource_path,
+                ids=ids,
+                access_token=access_token,
+                path_keys=path_keys,
+                query_params=query_params,
+                version_string=version_string,
+            )
+
+        def fetch_chunk(id_chunk: List[RestliEntityId]) -> BatchGetResponse:
+            return self.batch_get(
+                resource_path=resource_path,
+                ids=id_chunk,
+                access_token=access_token,
+                path_keys=path_keys,
+                query_params=query_params,
+                version_string=version_string,
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(id_chunks))
+        ) as executor:
+            chunk_responses = list(executor.map(fetch_chunk, id_chunks))
+
+        return merge_batch_get_responses(chunk_responses)
+
     def get_all(
         self,
         *,
@@ -164,8 +462,12 @@ class RestliClient:
         access_token: str,
         path_keys: Optional[Dict[str, Any]] = None,
         query_params: Optional[Dict[str, Any]] = None,
-        version_string: Optional[str] = None
-    ) -> CollectionResponse:
+        version_string: Optional[str] = None,
+        stream: bool = False,
+        columns: Optional[Sequence[str]] = None
+    ) -> Union[
+        CollectionResponse, StreamingCollectionResponse, ColumnarCollectionResponse
+    ]:
         """
         Makes a Rest.li GET_ALL request to fetch all entities on a resource.
 
@@ -175,9 +477,14 @@ class RestliClient:
             path_keys (Optional[Dict[str, Any]], optional): If there are path key placeholders as part of the `resource_path` argument, the key placeholders must be specified in this `path_keys` dictionary. The path key values can be strings, numbers, or objects, and these will be properly encoded. Defaults to None.
             query_params (Optional[Dict[str, Any]], optional): A dictionary of query parameters, where the key is the query parameter name, and the value is the query parameter value. This method will properly encode the query parameters. Defaults to {}.
             version_string (Optional[str], optional): A version string of the format "YYYYMM" or "YYYYMM.RR". If specified, the version header will be passed and the request will use the versioned APIs base URL. Defaults to None.
+            stream (bool, optional): If True, the body is parsed while it is downloaded, and a StreamingCollectionResponse yielding the elements as they are parsed is returned. Streamed requests bypass the response caches, singleflight and hedging. Defaults to False.
+            columns (Optional[Sequence[str]], optional): If specified, a ColumnarCollectionResponse is returned, storing the elements as one compact column per dot-separated field path (e.g. ["impressions", "pivotValues.0"]) instead of a list of dictionaries. Combined with `stream`, the columns are built as the body is downloaded. Columnar requests bypass the response caches and singleflight. Defaults to None.
+
+        Raises:
+            InvalidArgumentError: Error if `columns` is empty, or has an invalid or duplicated field path
 
         Returns:
-            CollectionResponse: An instance of the CollectionResponse class representing the response from the Rest.li GET_ALL call
+            Union[CollectionResponse, StreamingCollectionResponse, ColumnarCollectionResponse]: An instance of the CollectionResponse class representing the response from the Rest.li GET_ALL call, a StreamingCollectionResponse if `stream` is True, or a ColumnarCollectionResponse if `columns` is specified
 
         Example:
             >>> response = restli_client.get_all(
@@ -201,7 +508,8 @@ class RestliClient:
             encoded_query_param_string=encoded_query_param_string,
             access_token=access_token,
             version_string=version_string,
-            formatter=CollectionResponseFormatter,
+            stream=stream,
+            **self.__collection_formatter(stream=stream, columns=columns),
         )
 
     def finder(
@@ -212,8 +520,12 @@ class RestliClient:
         access_token: str,
         path_keys: Optional[Dict[str, Any]] = None,
         query_params: Optional[Dict[str, Any]] = None,
-        version_string: Optional[str] = None
-    ) -> CollectionResponse:
+        version_string: Optional[str] = None,
+        stream: bool = False,
+        columns: Optional[Sequence[str]] = None
+    ) -> Union[
+        CollectionResponse, StreamingCollectionResponse, ColumnarCollectionResponse
+    ]:
         """
         Makes a Rest.li FINDER request to find entities by some specified criteria.
 
@@ -224,9 +536,14 @@ class RestliClient:
             path_keys (Optional[Dict[str, Any]], optional): If there are path key placeholders as part of the `resource_path` argument, the key placeholders must be specified in this `path_keys` dictionary. The path key values can be strings, numbers, or objects, and these will be properly encoded. Defaults to None.
             query_params (Optional[Dict[str, Any]], optional): A dictionary of query parameters, where the key is the query parameter name, and the value is the query parameter value. This method will properly encode the query parameters. Defaults to {}.
             version_string (Optional[str], optional): A version string of the format "YYYYMM" or "YYYYMM.RR". If specified, the version header will be passed and the request will use the versioned APIs base URL. Defaults to None.
+            stream (bool, optional): If True, the body is parsed while it is downloaded, and a StreamingCollectionResponse yielding the elements as they are parsed is returned. Streamed requests bypass the response caches, singleflight and hedging. Defaults to False.
+            columns (Optional[Sequence[str]], optional): If specified, a ColumnarCollectionResponse is returned, storing the elements as one compact column per dot-separated field path (e.g. ["impressions", "pivotValues.0"]) instead of a list of dictionaries. Combined with `stream`, the columns are built as the body is downloaded. Columnar requests bypass the response caches and singleflight. Defaults to None.
+
+        Raises:
+            InvalidArgumentError: Error if `columns` is empty, or has an invalid or duplicated field path
 
         Returns:
-            CollectionResponse: An instance of the CollectionResponse class representing the response from the Rest.li FINDER call
+            Union[CollectionResponse, StreamingCollectionResponse, ColumnarCollectionResponse]: An instance of the CollectionResponse class representing the response from the Rest.li FINDER call, a StreamingCollectionResponse if `stream` is True, or a ColumnarCollectionResponse if `columns` is specified
 
         Example:
             >>> response = restli_client.finder(
@@ -262,7 +579,126 @@ class RestliClient:
             encoded_query_param_string=encoded_query_param_string,
             access_token=access_token,
             version_string=version_string,
-            formatter=CollectionResponseFormatter,
+            stream=stream,
+            **self.__collection_formatter(stream=stream, columns=columns),
+        )
+
+    def iter_get_all(
+        self,
+        *,
+        resource_path: str,
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None,
+        page_size: Optional[int] = None,
+        max_elements: Optional[int] = None,
+        prefetch_pages: int = 0
+    ) -> Paginator:
+        """
+        Lazily iterates over all entities on a resource, making Rest.li GET_ALL requests page by page. Each
+        page is only requested once the elements of the previous page have been consumed.
+
+        Args:
+            resource_path (str): The resource path after the base URL, beginning with a forward slash. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
+            access_token (str): The access token that should provide the application access to the specified API.
+            path_keys (Optional[Dict[str, Any]], optional): If there are path key placeholders as part of the `resource_path` argument, the key placeholders must be specified in this `path_keys` dictionary. The path key values can be strings, numbers, or objects, and these will be properly encoded. Defaults to None.
+            query_params (Optional[Dict[str, Any]], optional): A dictionary of query parameters, where the key is the query parameter name, and the value is the query parameter value. This method will properly encode the query parameters. A "start" query parameter is used as the start index of the first page. Defaults to {}.
+            version_string (Optional[str], optional): A version string of the format "YYYYMM" or "YYYYMM.RR". If specified, the version header will be passed and the request will use the versioned APIs base URL. Defaults to None.
+            page_size (Optional[int], optional): The number of entities to request per page. Defaults to the "count" query parameter if provided, otherwise 10.
+            max_elements (Optional[int], optional): The maximum number of entities to return. Defaults to None (no limit).
+            prefetch_pages (int, optional): The maximum number of pages to request concurrently ahead of the consumer, once the first page provides the total number of results. Entities are still returned in order. Defaults to 0 (pages are requested one after another).
+
+        Returns:
+            Paginator: An iterable over the entities. Use `pages()` on it to iterate over the CollectionResponse of each page instead.
+
+        Example:
+            >>> for field_of_study in restli_client.iter_get_all(
+                    resource_path="/fieldsOfStudy",
+                    access_token=MY_ACCESS_TOKEN,
+                    version_string="202212",
+                    page_size=50
+                ):
+                    process(field_of_study)
+        """
+
+        return self.__paginate(
+            lambda paged_query_params: self.get_all(
+                resource_path=resource_path,
+                access_token=access_token,
+                path_keys=path_keys,
+                query_params=paged_query_params,
+                version_string=version_string,
+            ),
+            query_params=query_params,
+            page_size=page_size,
+            max_elements=max_elements,
+            prefetch_pages=prefetch_pages,
+        )
+
+    def iter_finder(
+        self,
+        *,
+        resource_path: str,
+        finder_name: str,
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None,
+        page_size: Optional[int] = None,
+        max_elements: Optional[int] = None,
+        prefetch_pages: int = 0
+    ) -> Paginator:
+        """
+        Lazily iterates over the entities found by a Rest.li FINDER, requesting the results page by page.
+        Each page is only requested once the elements of the previous page have been consumed.
+
+        Args:
+            resource_path (str): The resource path after the base URL, beginning with a forward slash. If the path contains keys, add curly-brace placeholders for the keys and specify the path key-value map in the `path_keys` argument.
+            finder_name (str): The Rest.li finder name. This will be added to the request query parameters.
+            access_token (str): The access token that should provide the application access to the specified API.
+            path_keys (Optional[Dict[str, Any]], optional): If there are path key placeholders as part of the `resource_path` argument, the key placeholders must be specified in this `path_keys` dictionary. The path key values can be strings, numbers, or objects, and these will be properly encoded. Defaults to None.
+            query_params (Optional[Dict[str, Any]], optional): A dictionary of query parameters, where the key is the query parameter name, and the value is the query parameter value. This method will properly encode the query parameters. A "start" query parameter is used as the start index of the first page. Defaults to {}.
+            version_string (Optional[str], optional): A version string of the format "YYYYMM" or "YYYYMM.RR". If specified, the version header will be passed and the request will use the versioned APIs base URL. Defaults to None.
+            page_size (Optional[int], optional): The number of entities to request per page. Defaults to the "count" query parameter if provided, otherwise 10.
+            max_elements (Optional[int], optional): The maximum number of entities to return. Defaults to None (no limit).
+            prefetch_pages (int, optional): The maximum number of pages to request concurrently ahead of the consumer, once the first page provides the total number of results. Entities are still returned in order. Defaults to 0 (pages are requested one after another).
+
+        Returns:
+            Paginator: An iterable over the entities. Use `pages()` on it to iterate over the CollectionResponse of each page instead.
+
+        Example:
+            >>> for ad_account in restli_client.iter_finder(
+                    resource_path="/adAccounts",
+                    finder_name="search",
+                    query_params={
+                        "search": {
+                            "status": {
+                                "values": ["ACTIVE"]
+                            }
+                        }
+                    },
+                    access_token=MY_ACCESS_TOKEN,
+                    version_string="202212",
+                    page_size=100,
+                    max_elements=1000
+                ):
+                    process(ad_account)
+        """
+
+        return self.__paginate(
+            lambda paged_query_params: self.finder(
+                resource_path=resource_path,
+                finder_name=finder_name,
+                access_token=access_token,
+                path_keys=path_keys,
+                query_params=paged_query_params,
+                version_string=version_string,
+            ),
+            query_params=query_params,
+            page_size=page_size,
+            max_elements=max_elements,
+            prefetch_pages=prefetch_pages,
         )
 
     def batch_finder(
@@ -844,31 +1280,189 @@ class RestliClient:
         path_keys: Optional[Dict[str, Any]] = None,
         encoded_query_param_string: Optional[str] = None,
         request_body: Optional[Any] = None,
-        version_string: Optional[str] = None
+        version_string: Optional[str] = None,
+        stream: bool = False,
+        format_kwargs: Optional[Dict[str, Any]] = None
     ) -> T:
-        url = apiutils.build_rest_url(
+        prepared_request = prepare_restli_request(
+            restli_method=restli_method,
             resource_path=resource_path,
             path_keys=path_keys,
+            encoded_query_param_string=encoded_query_param_string,
+            request_body=request_body,
+            access_token=access_token,
             version_string=version_string,
+            json_codec=self.json_codec,
         )
 
-        if request_body is not None:
-            prepared_request = maybe_apply_query_tunneling_requests_with_body(
-                encoded_query_param_string=encoded_query_param_string,
-                url=url,
-                original_restli_method=restli_method,
-                original_request_body=request_body,
+        def send(request: requests.PreparedRequest) -> requests.Response:
+            return self.__send(
+                request,
+                restli_method=restli_method,
+                resource_path=resource_path,
                 access_token=access_token,
-                version_string=version_string,
+                stream=stream,
             )
-        else:
-            prepared_request = maybe_apply_query_tunneling_get_requests(
-                encoded_query_param_string=encoded_query_param_string,
-                url=url,
-                original_restli_method=restli_method,
-                access_token=access_token,
-                version_string=version_string,
+
+        # A streamed response is read once by a single caller, and a response formatted with specific
+        # arguments (e.g. columns) differs from other responses to the same request, so neither is shared
+        # nor cached
+        if (
+            stream
+            or format_kwargs
+            or restli_method not in READ_ONLY_RESTLI_METHODS
+            or (
+                self.singleflight_group is None
+                and self.response_cache is None
+                and self.revalidation_cache is None
+            )
+        ):
+            return formatter.format_response(
+                send(prepared_request),
+                json_codec=self.json_codec,
+                **(format_kwargs or {}),
             )
 
-        response = self.session.send(prepared_request)
-        return formatter.format_response(response)
+        request_key = get_request_key(prepared_request)
+
+        def send_and_format() -> T:
+            if self.revalidation_cache is None:
+                return formatter.format_response(
+                    send(prepared_request), json_codec=self.json_codec
+                )
+            return self.revalidation_cache.send_and_format(
+                send,
+                prepared_request,
+                formatter,
+                request_key=request_key,
+                json_codec=self.json_codec,
+            )
+
+        if self.response_cache is not None:
+            cached_response = self.response_cache.get(request_key)
+            if cached_response is not None:
+                return cached_response
+
+        if self.singleflight_group is not None:
+            formatted_response = self.singleflight_group.do(
+                request_key, send_and_format
+            )
+        else:
+            formatted_response = send_and_format()
+
+        if (
+            self.response_cache is not None
+            and 200 <= formatted_response.status_code < 300
+        ):
+            self.response_cache.set(request_key, formatted_response)
+
+        return formatted_response
+
+    @staticmethod
+    def __collection_formatter(
+        *, stream: bool, columns: Optional[Sequence[str]]
+    ) -> Dict[str, Any]:
+        if columns is not None:
+            parse_field_paths(columns)
+            return {
+                "formatter": ColumnarCollectionResponseFormatter,
+                "format_kwargs": {"columns": list(columns), "stream": stream},
+            }
+        return {
+            "formatter": StreamingCollectionResponseFormatter
+            if stream
+            else CollectionResponseFormatter
+        }
+
+    def __send(
+        self,
+        prepared_request: requests.PreparedRequest,
+        *,
+        restli_method: RESTLI_METHODS,
+        resource_path: str,
+        access_token: str,
+        stream: bool = False
+    ) -> requests.Response:
+        def send_once(request: requests.PreparedRequest) -> requests.Response:
+            if self.circuit_breaker is None:
+                acquire_rate_limit()
+                return send_limited(request)
+
+            # The circuit is checked first, so that requests failing fast do not consume rate limit tokens
+            self.circuit_breaker.before_request(resource_path)
+            try:
+                acquire_rate_limit()
+            except BaseException:
+                self.circuit_breaker.cancel_request(resource_path)
+                raise
+
+            status_code = None
+            try:
+                response = send_limited(request)
+                status_code = response.status_code
+                return response
+            finally:
+                self.circuit_breaker.record(resource_path, status_code)
+
+        def acquire_rate_limit() -> None:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(
+                    access_token=access_token, resource_path=resource_path
+                )
+
+        def send_limited(request: requests.PreparedRequest) -> requests.Response:
+            if self.concurrency_limiter is None:
+                return send_hedged(request)
+
+            start = self.concurrency_limiter.acquire()
+            status_code = None
+            try:
+                response = send_hedged(request)
+                status_code = response.status_code
+                return response
+            finally:
+                self.concurrency_limiter.release(start, status_code)
+
+        def send_hedged(request: requests.PreparedRequest) -> requests.Response:
+            # Hedging only wraps the HTTP call, so that waiting on the limiters is neither counted as
+            # latency nor triggers duplicates, and a duplicate does not consume another rate limit token
+            if (
+                self.hedge_policy is None
+                or restli_method not in self.hedge_policy.methods
+            ):
+                return self.session.send(request, stream=stream)
+            if stream:
+                # The losing response of a hedged request is not read, so it would hold its connection
+                return self.session.send(request, stream=True)
+            return self.hedge_policy.send(self.session.send, request)
+
+        if self.retry_policy is None:
+            return send_once(prepared_request)
+
+        return self.retry_policy.send(send_once, prepared_request, restli_method)
+
+    def __paginate(
+        self,
+        fetch_collection: Callable[[Dict[str, Any]], CollectionResponse],
+        *,
+        query_params: Optional[Dict[str, Any]],
+        page_size: Optional[int],
+        max_elements: Optional[int],
+        prefetch_pages: int
+    ) -> Paginator:
+        base_query_params = copy.deepcopy(query_params) if query_params else {}
+        start = base_query_params.pop("start", 0)
+        count = base_query_params.pop("count", DEFAULT_PAGE_SIZE)
+
+        def fetch_page(page_start: int, page_count: int) -> CollectionResponse:
+            paged_query_params = copy.deepcopy(base_query_params)
+            paged_query_params.update({"start": page_start, "count": page_count})
+            return fetch_collection(paged_query_params)
+
+        return Paginator(
+            fetch_page,
+            start=start,
+            page_size=page_size if page_size is not None else count,
+            max_elements=max_elements,
+            prefetch_pages=prefetch_pages,
+        )
@@ -0,0 +1,200 @@
+import sys
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+from linkedin_api.clients.restli.types import RestliEntity
+from linkedin_api.common.errors import InvalidArgumentError
+
+Column = Union[array, List[Any]]
+"""
+A column of values: an array of 64-bit integers or of doubles for numeric columns, and a list otherwise
+"""
+
+FieldPath = Tuple[Union[str, int], ...]
+
+_MISSING = object()
+
+
+def parse_field_path(field_path: str) -> FieldPath:
+    """
+    Parses a dot-separated field path (e.g. "dateRange.start.day", or "pivotValues.0" for the first item
+    of a list) into its segments. Integer segments index lists, and also look up object keys.
+
+    Args:
+        field_path (str): The field path
+
+    Raises:
+        InvalidArgumentError: Error if the field path is empty or has an empty segment
+
+    Returns:
+        FieldPath: The segments of the field path
+    """
+    if not isinstance(field_path, str) or not field_path:
+        raise InvalidArgumentError(
+            f"A column field path must be a non-empty string, got {field_path!r}"
+        )
+    segments = field_path.split(".")
+    if not all(segments):
+        raise InvalidArgumentError(
+            f"The column field path '{field_path}' has an empty segment"
+        )
+    return tuple(int(segment) if segment.isdigit() else segment for segment in segments)
+
+
+def parse_field_paths(field_paths: Sequence[str]) -> List[FieldPath]:
+    """
+    Parses the field paths of columns, see `parse_field_path()`.
+
+    Raises:
+        InvalidArgumentError: Error if a field path is invalid, or if the field paths are empty or not unique
+    """
+    if isinstance(field_paths, str) or not field_paths:
+        raise InvalidArgumentError(
+            "The column field paths must be a non-empty sequence of strings"
+        )
+    if len(set(field_paths)) != len(field_paths):
+        raise InvalidArgumentError("The column field paths must be unique")
+    return [parse_field_path(field_path) for field_path in field_paths]
+
+
+def get_field(element: Any, field_path: FieldPath) -> Any:
+    """
+    Returns the value at a field path of an element, or None if the path does not exist.
+    """
+    value = element
+    for segment in field_path:
+        if isinstance(value, dict):
+            value = value.get(
+                str(segment) if isinstance(segment, int) else segment, _MISSING
+            )
+        elif isinstance(value, list) and isinstance(segment, int):
+            value = value[segment] if segment < len(value) else _MISSING
+        else:
+            return None
+        if value is _MISSING:
+            return None
+    return value
+
+
+class _ColumnBuilder:
+    """
+    Builds a column, starting as an array of 64-bit integers, widening to an array of doubles once a
+    float is appended, and falling back to a list once any other value (including None, a boolean or an
+    integer overflowing 64 bits) is appended. Strings are interned, so that repeated values such as URNs
+    are stored once.
+    """
+
+    __slots__ = ("values",)
+
+    def __init__(self):
+        self.values: Column = array("q")
+
+    def append(self, value: Any) -> None:
+        values = self.values
+        value_type = type(value)
+        if value_type is str:
+            value = sys.intern(value)
+        elif type(values) is array:
+            if value_type is int:
+                try:
+                    values.append(value)
+                    return
+                except OverflowError:
+                    pass
+            elif value_type is float:
+                if values.typecode == "q":
+                    values = self.values = array("d", values)
+                values.append(value)
+                return
+        if type(values) is array:
+            values = self.values = values.tolist()
+        values.append(value)
+
+
+class ElementColumns:
+    """
+    The elements of a collection response stored column by column: one compact column per requested field
+    path, in which the value of the i-th element is at index i. Numeric columns are `array.array`s
+    (typecode "q" for integers, "d" once a column holds a float), and other columns are lists, whose
+    strings (e.g. URNs) are interned. A value that is missing from an element is stored as None, which
+    turns a numeric column into a list.
+    """
+
+    __slots__ = ("field_paths", "columns", "num_elements")
+
+    def __init__(
+        self, field_paths: Sequence[str], columns: Dict[str, Column], num_elements: int
+    ):
+        self.field_paths = list(field_paths)
+        """
+        The requested field paths, in order.
+        """
+
+        self.columns = columns
+        """
+        The column of each field path.
+        """
+
+        self.num_elements = num_elements
+        """
+        The number of elements, i.e. the length of each column.
+        """
+
+    def __getitem__(self, field_path: str) -> Column:
+        return self.columns[field_path]
+
+    def __contains__(self, field_path: str) -> bool:
+        return field_path in self.columns
+
+    def __len__(self) -> int:
+        return self.num_elements
+
+    def iter_rows(self) -> Iterator[Tuple[Any, ...]]:
+        """
+        Yields the values of each element as a tuple, in the order of the field paths.
+        """
+        return zip(*(self.columns[field_path] for field_path in self.field_paths))
+
+
+def build_columns(
+    elements: Iterable[RestliEntity], field_paths: Sequence[str]
+) -> ElementColumns:
+    """
+    Builds the columns of the specified field paths from elements, consuming them one by one, so that an
+    iterator of elements (e.g. from a streamed response) is never materialized as a list.
+
+    Args:
+        elements (Iterable[RestliEntity]): The elements
+        field_paths (Sequence[str]): The dot-separated field paths of the columns
+
+    Raises:
+        InvalidArgumentError: Error if the field paths are invalid, see `parse_field_paths()`
+
+    Returns:
+        ElementColumns: The columns
+    """
+    parsed_field_paths = parse_field_paths(field_paths)
+    builders = [_ColumnBuilder() for _ in field_paths]
+    simple_keys = [
+        parsed[0] if len(parsed) == 1 and isinstance(parsed[0], str) else None
+        for parsed in parsed_field_paths
+    ]
+
+    num_elements = 0
+    for element in elements:
+        num_elements += 1
+        for (builder, simple_key, parsed_field_path) in zip(
+            builders, simple_keys, parsed_field_paths
+        ):
+            if simple_key is not None and type(element) is dict:
+                builder.append(element.get(simple_key))
+            else:
+                builder.append(get_field(element, parsed_field_path))
+
+    return ElementColumns(
+        field_paths,
+        {
+            field_path: builder.values
+            for (field_path, builder) in zip(field_paths, builders)
+        },
+        num_elements,
+    )
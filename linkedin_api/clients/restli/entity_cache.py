@@ -0,0 +1,195 @@
+import hashlib
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from linkedin_api.clients.common.cache import CacheBackend, InMemoryCacheBackend
+from linkedin_api.clients.restli.response import BatchGetResponse
+from linkedin_api.clients.restli.types import EncodedEntityId, RestliEntity
+from linkedin_api.clients.restli.utils.batching import merge_batch_get_responses
+from linkedin_api.clients.restli.utils.encoder import encode
+from linkedin_api.clients.restli.utils.restli import (
+    encode_query_params_for_get_requests,
+)
+import linkedin_api.clients.restli.utils.api as apiutils
+
+DEFAULT_NEGATIVE_TTL_SECONDS = 60.0
+
+NOT_FOUND_STATUS_CODE = 404
+
+FetchBatch = Callable[[List[Any]], BatchGetResponse]
+
+
+class EntityCache:
+    """
+    A per-entity cache for BATCH_GET requests. Entities are cached individually, scoped by resource path,
+    path keys, query parameters (e.g. field projections), version and access token, so that a BATCH_GET
+    request only needs to fetch the ids that are not already cached. Entities that were not found (404)
+    are also cached, for a shorter time-to-live, so that they are not requested repeatedly.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        *,
+        ttl: Optional[float] = None,
+        negative_ttl: Optional[float] = DEFAULT_NEGATIVE_TTL_SECONDS,
+    ):
+        """
+        The constructor for the EntityCache class.
+
+        Args:
+            backend (Optional[CacheBackend], optional): The storage backend of the cached entities. Defaults to an InMemoryCacheBackend with its default size and time-to-live.
+            ttl (Optional[float], optional): The time-to-live of found entities, in seconds. Defaults to None (the backend default).
+            negative_ttl (Optional[float], optional): The time-to-live of not found entities, in seconds. If None, not found entities are not cached. Defaults to 60.
+        """
+        self.backend = backend if backend is not None else InMemoryCacheBackend()
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+
+    def batch_get(
+        self,
+        fetch_batch: FetchBatch,
+        *,
+        resource_path: str,
+        ids: List[Any],
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None,
+    ) -> BatchGetResponse:
+        """
+        Serves a BATCH_GET request from the cache, fetching only the ids that are not cached. The other
+        arguments are the same as `RestliClient.batch_get()`.
+
+        Args:
+            fetch_batch (FetchBatch): The function making the BATCH_GET request for the list of missing ids
+
+        Returns:
+            BatchGetResponse: The response merged from the cached entities and the fetched entities. If all
+            the ids are cached, no request is made, and the response has a 200 status code, empty headers and
+            no raw response.
+        """
+        url = apiutils.build_rest_url(resource_path, path_keys, version_string)
+        scope = get_entity_cache_scope(
+            url=url,
+            query_params=query_params,
+            access_token=access_token,
+            version_string=version_string,
+        )
+
+        cached_entries: Dict[EncodedEntityId, Tuple[int, Any]] = {}
+        missing_ids: Dict[EncodedEntityId, Any] = {}
+        for id in ids:
+            encoded_id = encode(id)
+            if encoded_id in cached_entries or encoded_id in missing_ids:
+                continue
+            entry = self.backend.get(f"{scope}:{encoded_id}")
+            if entry is None:
+                missing_ids[encoded_id] = id
+            else:
+                cached_entries[encoded_id] = entry
+
+        cached_response = to_batch_get_response(cached_entries, url=url)
+        if not missing_ids:
+            return cached_response
+
+        fetched_response = fetch_batch(list(missing_ids.values()))
+        if 200 <= fetched_response.status_code < 300:
+            self.__store(scope, fetched_response, missing_ids.keys())
+
+        if not cached_entries:
+            return fetched_response
+
+        return merge_batch_get_responses([fetched_response, cached_response])
+
+    def __store(
+        self,
+        scope: str,
+        batch_response: BatchGetResponse,
+        encoded_ids: List[EncodedEntityId],
+    ) -> None:
+        results = batch_response.results or {}
+        statuses = batch_response.statuses or {}
+        errors = batch_response.errors or {}
+
+        for encoded_id in encoded_ids:
+            key = f"{scope}:{encoded_id}"
+            error = errors.get(encoded_id)
+            error_status = error.get("status") if isinstance(error, dict) else None
+            status_code = statuses.get(encoded_id, error_status)
+
+            if encoded_id in results:
+                status_code = status_code or 200
+                if 200 <= status_code < 300:
+                    self.backend.set(
+                        key, (status_code, results[encoded_id]), ttl=self.ttl
+                    )
+            elif status_code == NOT_FOUND_STATUS_CODE and self.negative_ttl is not None:
+                self.backend.set(
+                    key, (NOT_FOUND_STATUS_CODE, error), ttl=self.negative_ttl
+                )
+
+
+def get_entity_cache_scope(
+    *,
+    url: str,
+    query_params: Optional[Dict[str, Any]],
+    access_token: str,
+    version_string: Optional[str],
+) -> str:
+    """
+    Returns the cache key prefix shared by the entities fetched with the same BATCH_GET request parameters.
+
+    Args:
+        url (str): The URL of the BATCH_GET request, not including query parameters
+        query_params (Optional[Dict[str, Any]]): The query parameters of the request, excluding the ids
+        access_token (str): The access token of the request
+        version_string (Optional[str]): The version string of the request
+
+    Returns:
+        str: The cache key prefix
+    """
+    digest = hashlib.sha256()
+    for part in [
+        url,
+        encode_query_params_for_get_requests(query_params),
+        version_string,
+        access_token,
+    ]:
+        digest.update((part or "").encode("utf-8"))
+        digest.update(b"\0")
+
+    return digest.hexdigest()
+
+
+def to_batch_get_response(
+    cached_entries: Dict[EncodedEntityId, Tuple[int, Any]], *, url: str
+) -> BatchGetResponse:
+    """
+    Builds a BatchGetResponse from cached entries.
+
+    Args:
+        cached_entries (Dict[EncodedEntityId, Tuple[int, Any]]): A map of encoded entity ids to their cached status code and entity (or error, for not found entities)
+        url (str): The URL of the BATCH_GET request
+
+    Returns:
+        BatchGetResponse: The response, with a 200 status code
+    """
+    results: Dict[EncodedEntityId, RestliEntity] = {}
+    statuses: Dict[EncodedEntityId, int] = {}
+    errors: Dict[EncodedEntityId, Any] = {}
+
+    for (encoded_id, (status_code, value)) in cached_entries.items():
+        statuses[encoded_id] = status_code
+        if 200 <= status_code < 300:
+            results[encoded_id] = value
+        elif value is not None:
+            errors[encoded_id] = value
+
+    return BatchGetResponse(
+        status_code=200,
+        url=url,
+        headers={},
+        response=None,
+        results=results,
+        statuses=statuses,
+        errors=errors,
+    )
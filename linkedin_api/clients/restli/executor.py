@@ -0,0 +1,150 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+from linkedin_api.clients.restli.response import BaseRestliResponse
+from linkedin_api.common.constants import RESTLI_METHODS
+from linkedin_api.common.errors import InvalidArgumentError
+
+DEFAULT_MAX_WORKERS = 8
+
+
+class RestliRequest:
+    """
+    The description of a Rest.li request to send with `RestliClient.execute_many()`. The Rest.li method
+    selects the RestliClient method that is called (e.g. RESTLI_METHODS.BATCH_GET calls `batch_get()`),
+    and the keyword arguments are passed to it.
+    """
+
+    def __init__(self, method: RESTLI_METHODS, **kwargs: Any):
+        """
+        The constructor for the RestliRequest class.
+
+        Args:
+            method (RESTLI_METHODS): The Rest.li method of the request
+            **kwargs: The keyword arguments of the corresponding RestliClient method (e.g. `resource_path`, `access_token`, `path_keys`, `query_params` or `entity`)
+
+        Raises:
+            InvalidArgumentError: Error if the method is not a Rest.li method
+        """
+        if not isinstance(method, RESTLI_METHODS):
+            raise InvalidArgumentError(
+                f"The 'method' argument must be a RESTLI_METHODS value, got {method!r}"
+            )
+        self.method = method
+        self.kwargs: Dict[str, Any] = kwargs
+
+    @property
+    def client_method_name(self) -> str:
+        """
+        The name of the RestliClient method sending the request (e.g. "batch_get").
+        """
+        return self.method.value.lower()
+
+    def __repr__(self) -> str:
+        resource_path = self.kwargs.get("resource_path")
+        return f"RestliRequest({self.method.value}, resource_path={resource_path!r})"
+
+
+class RestliResult:
+    """
+    The outcome of a request sent with `RestliClient.execute_many()`: either its response, or the error
+    raised while sending it or formatting its response.
+
+    Attributes:
+        index (int): The position of the request in the list of requests
+        request (RestliRequest): The request
+        response (Optional[BaseRestliResponse]): The response, if no error was raised. Note that error responses (e.g. 4xx) are responses, not errors.
+        error (Optional[Exception]): The error raised, if any
+    """
+
+    def __init__(
+        self,
+        index: int,
+        request: RestliRequest,
+        *,
+        response: Optional[BaseRestliResponse] = None,
+        error: Optional[Exception] = None,
+    ):
+        self.index = index
+        self.request = request
+        self.response = response
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the request was sent and its response formatted without raising an error.
+        """
+        return self.error is None
+
+    def get_response(self) -> BaseRestliResponse:
+        """
+        Returns the response, or raises the error raised by the request.
+        """
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+
+def execute_many(
+    send: Callable[[RestliRequest], BaseRestliResponse],
+    restli_requests: Sequence[RestliRequest],
+    *,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    ordered: bool = True,
+) -> Iterator[RestliResult]:
+    """
+    Sends requests concurrently on a bounded thread pool. All the requests are submitted before this
+    function returns; the returned iterator yields their results.
+
+    Args:
+        send (Callable[[RestliRequest], BaseRestliResponse]): The function sending a request
+        restli_requests (Sequence[RestliRequest]): The requests to send
+        max_workers (int, optional): The maximum number of requests sent concurrently. Defaults to 8.
+        ordered (bool, optional): If True, the results are yielded in the order of the requests, otherwise as the requests complete. Defaults to True.
+
+    Raises:
+        InvalidArgumentError: Error if `max_workers` is not positive
+
+    Returns:
+        Iterator[RestliResult]: The result of each request
+    """
+    if max_workers <= 0:
+        raise InvalidArgumentError("The 'max_workers' argument must be positive")
+
+    restli_requests = list(restli_requests)
+    if not restli_requests:
+        return iter([])
+
+    def run(index: int, request: RestliRequest) -> RestliResult:
+        try:
+            return RestliResult(index, request, response=send(request))
+        except Exception as error:
+            return RestliResult(index, request, error=error)
+
+    executor = ThreadPoolExecutor(
+        max_workers=min(max_workers, len(restli_requests)),
+        thread_name_prefix="linkedin-api-execute-many",
+    )
+    futures = [
+        executor.submit(run, index, request)
+        for (index, request) in enumerate(restli_requests)
+    ]
+    executor.shutdown(wait=False)
+    return _iter_results(futures, ordered=ordered)
+
+
+def _iter_results(futures: List[Future], *, ordered: bool) -> Iterator[RestliResult]:
+    try:
+        if ordered:
+            for future in futures:
+                yield future.result()
+        else:
+            pending = set(futures)
+            while pending:
+                (done, pending) = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+    finally:
+        # Requests that have not started yet are not sent once the iteration is abandoned
+        for future in futures:
+            future.cancel()
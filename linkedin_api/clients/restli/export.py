@@ -0,0 +1,210 @@
+import gzip
+import os
+from typing import IO, List, Optional, Union
+from linkedin_api.clients.common.json_codec import JsonCodec, resolve_json_codec
+from linkedin_api.clients.restli.jobs import CheckpointFile
+from linkedin_api.clients.restli.paginator import Paginator
+from linkedin_api.clients.restli.types import RestliEntity
+from linkedin_api.common.errors import InvalidArgumentError
+
+DEFAULT_CHECKPOINT_EVERY_PAGES = 1
+
+PathOrFile = Union[str, "os.PathLike[str]", IO[bytes]]
+
+
+def export_ndjson(
+    paginator: Paginator,
+    destination: PathOrFile,
+    *,
+    compress: bool = False,
+    checkpoint_path: Optional[Union[str, "os.PathLike[str]"]] = None,
+    checkpoint_every_pages: int = DEFAULT_CHECKPOINT_EVERY_PAGES,
+    fsync: bool = True,
+    json_codec: Optional[JsonCodec] = None,
+) -> int:
+    """
+    Exports the elements of a paged collection (e.g. from `RestliClient.iter_finder()` or
+    `RestliClient.iter_get_all()`) as newline-delimited JSON, one element per line, writing each page
+    as it is fetched. Memory usage is bounded by a single page (or the prefetched pages).
+
+    If a checkpoint path is specified, the start index of the next page and the size of the output file
+    are recorded in the checkpoint file after every `checkpoint_every_pages` pages, once the output is
+    flushed (and synced to disk if `fsync` is True). If the export is interrupted, calling this function
+    again with the same arguments truncates the output file to the last checkpoint and resumes from the
+    next page, so that no element is fetched or written twice. The checkpoint file is removed once the
+    export completes.
+
+    Args:
+        paginator (Paginator): The paginator over the collection
+        destination (PathOrFile): The path of the output file, or a binary file object to write to. Resuming from a checkpoint requires a path.
+        compress (bool, optional): If True, the output is gzip-compressed. Each checkpoint ends a gzip member, so a truncated file is still a valid gzip file. Defaults to False.
+        checkpoint_path (Optional[Union[str, os.PathLike]], optional): The path of the checkpoint file. Defaults to None (no checkpoints).
+        checkpoint_every_pages (int, optional): The number of pages written between checkpoints. Defaults to 1.
+        fsync (bool, optional): If True, the output and the checkpoint are synced to disk at each checkpoint and at the end of the export, so that they survive a crash of the host. Defaults to True.
+        json_codec (Optional[JsonCodec], optional): The JSON codec serializing the elements. Defaults to None (the default codec).
+
+    Raises:
+        InvalidArgumentError: Error if `checkpoint_every_pages` is not positive, a checkpoint path is specified with a file object destination, or the output file of a checkpoint is missing or smaller than recorded in the checkpoint
+
+    Returns:
+        int: The total number of elements exported, including the elements exported before resuming
+
+    Example:
+        >>> export_ndjson(
+                restli_client.iter_finder(
+                    resource_path="/adAccounts",
+                    finder_name="search",
+                    access_token=MY_ACCESS_TOKEN,
+                    version_string="202212",
+                    page_size=1000
+                ),
+                "ad_accounts.ndjson.gz",
+                compress=True,
+                checkpoint_path="ad_accounts.checkpoint"
+            )
+    """
+    if checkpoint_every_pages <= 0:
+        raise InvalidArgumentError(
+            "The 'checkpoint_every_pages' argument must be positive"
+        )
+    is_path = isinstance(destination, (str, os.PathLike))
+    if checkpoint_path is not None and not is_path:
+        raise InvalidArgumentError(
+            "Resuming from a checkpoint requires the 'destination' argument to be a path"
+        )
+
+    checkpoint_file = (
+        CheckpointFile(checkpoint_path, fsync=fsync)
+        if checkpoint_path is not None
+        else None
+    )
+    checkpoint = checkpoint_file.load() if checkpoint_file is not None else None
+    exported_elements = 0
+    if checkpoint is not None:
+        exported_elements = checkpoint["exported_elements"]
+        paginator = _resumed_paginator(
+            paginator, start=checkpoint["start"], consumed=exported_elements
+        )
+
+    if is_path:
+        if checkpoint is not None:
+            _check_resumable_destination(
+                destination, checkpoint_path, offset=checkpoint["offset"]
+            )
+            file = open(destination, "r+b")
+            file.truncate(checkpoint["offset"])
+            file.seek(checkpoint["offset"])
+        else:
+            file = open(destination, "wb")
+    else:
+        file = destination
+
+    writer = _NdjsonWriter(
+        file, compress=compress, json_codec=resolve_json_codec(json_codec)
+    )
+    remaining = paginator.max_elements
+    pages_since_checkpoint = 0
+    try:
+        for (page, next_start) in paginator.pages_with_cursor():
+            elements = page.elements or []
+            if remaining is not None:
+                elements = elements[:remaining]
+                remaining -= len(elements)
+            writer.write(elements)
+            exported_elements += len(elements)
+
+            pages_since_checkpoint += 1
+            if (
+                checkpoint_file is not None
+                and pages_since_checkpoint >= checkpoint_every_pages
+            ):
+                pages_since_checkpoint = 0
+                offset = writer.flush(fsync=fsync)
+                checkpoint_file.save(
+                    {
+                        "start": next_start,
+                        "exported_elements": exported_elements,
+                        "offset": offset,
+                    }
+                )
+        writer.flush(fsync=fsync)
+    finally:
+        writer.close()
+        if is_path:
+            file.close()
+
+    if checkpoint_file is not None:
+        checkpoint_file.remove()
+    return exported_elements
+
+
+def _check_resumable_destination(
+    destination: Union[str, "os.PathLike[str]"],
+    checkpoint_path: Union[str, "os.PathLike[str]"],
+    *,
+    offset: int,
+) -> None:
+    try:
+        size = os.path.getsize(destination)
+    except FileNotFoundError:
+        size = None
+    if size is None or size < offset:
+        state = "missing" if size is None else f"only {size} bytes long"
+        raise InvalidArgumentError(
+            f"The checkpoint '{os.fspath(checkpoint_path)}' resumes the export to '{os.fspath(destination)}' "
+            f"after {offset} bytes, but the file is {state}. Remove the checkpoint to restart the export."
+        )
+
+
+class _NdjsonWriter:
+    def __init__(self, file: IO[bytes], *, compress: bool, json_codec: JsonCodec):
+        self.file = file
+        self.compress = compress
+        self.json_codec = json_codec
+        self.__gzip_file: Optional[gzip.GzipFile] = None
+
+    def write(self, elements: List[RestliEntity]) -> None:
+        if not elements:
+            return
+        data = b"".join(self.json_codec.dumps(element) + b"\n" for element in elements)
+        if self.compress:
+            if self.__gzip_file is None:
+                self.__gzip_file = gzip.GzipFile(fileobj=self.file, mode="wb")
+            self.__gzip_file.write(data)
+        else:
+            self.file.write(data)
+
+    def flush(self, *, fsync: bool) -> Optional[int]:
+        """
+        Ends the current gzip member, flushes the file and returns its size, if it is seekable.
+        """
+        self.close()
+        self.file.flush()
+        if fsync and hasattr(self.file, "fileno"):
+            try:
+                os.fsync(self.file.fileno())
+            except (OSError, ValueError):
+                # Not backed by a file descriptor (e.g. an in-memory buffer)
+                pass
+        return self.file.tell() if self.file.seekable() else None
+
+    def close(self) -> None:
+        # Closing the GzipFile writes the gzip trailer, without closing the underlying file
+        if self.__gzip_file is not None:
+            self.__gzip_file.close()
+            self.__gzip_file = None
+
+
+def _resumed_paginator(paginator: Paginator, *, start: int, consumed: int) -> Paginator:
+    max_elements = (
+        max(0, paginator.max_elements - consumed)
+        if paginator.max_elements is not None
+        else None
+    )
+    return Paginator(
+        paginator.fetch_page,
+        start=start,
+        page_size=paginator.page_size,
+        max_elements=max_elements,
+        prefetch_pages=paginator.prefetch_pages,
+    )
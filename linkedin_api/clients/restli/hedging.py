@@ -0,0 +1,195 @@
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, FrozenSet, Optional
+from requests import PreparedRequest, Response
+from linkedin_api.common.constants import READ_ONLY_RESTLI_METHODS, RESTLI_METHODS
+from linkedin_api.common.errors import InvalidArgumentError
+
+DEFAULT_PERCENTILE = 95.0
+DEFAULT_INITIAL_DELAY_SECONDS = 1.0
+DEFAULT_MIN_DELAY_SECONDS = 0.01
+DEFAULT_MIN_SAMPLES = 20
+DEFAULT_WINDOW_SIZE = 1000
+DEFAULT_BUDGET_RATIO = 0.05
+DEFAULT_BUDGET_MAX_TOKENS = 10.0
+DEFAULT_MAX_WORKERS = 32
+DEFAULT_MAX_PRIMARY_WORKERS = 64
+
+
+class HedgePolicy:
+    """
+    A policy for hedging read-only requests: if no response is received within the hedge delay, a
+    duplicate request is sent, and the response that arrives first is returned. The other request is
+    cancelled if it has not started yet, and its response is ignored otherwise.
+
+    The hedge delay is a percentile (e.g. the 95th) of the recently observed latencies, so that only the
+    slowest requests are hedged. A budget caps the extra load: each request deposits a fraction of a
+    token, and each hedge consumes a token. While the budget does not allow a hedge, requests are sent
+    on the calling thread. Otherwise, the request is sent from a bounded pool of reusable threads, so
+    that the calling thread can return whichever response arrives first, and duplicates are sent from a
+    second bounded pool. While all the threads of the first pool are busy, requests are sent on the
+    calling thread without hedging, so that they never wait for a thread.
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float = DEFAULT_PERCENTILE,
+        initial_delay: float = DEFAULT_INITIAL_DELAY_SECONDS,
+        min_delay: float = DEFAULT_MIN_DELAY_SECONDS,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        budget_ratio: float = DEFAULT_BUDGET_RATIO,
+        budget_max_tokens: float = DEFAULT_BUDGET_MAX_TOKENS,
+        methods: FrozenSet[RESTLI_METHODS] = READ_ONLY_RESTLI_METHODS,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_primary_workers: int = DEFAULT_MAX_PRIMARY_WORKERS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        The constructor for the HedgePolicy class.
+
+        Args:
+            percentile (float, optional): The percentile of the observed latencies used as the hedge delay, between 0 and 100. Defaults to 95.
+            initial_delay (float, optional): The hedge delay in seconds until `min_samples` latencies are observed. Defaults to 1.
+            min_delay (float, optional): The minimum hedge delay, in seconds. Defaults to 0.01.
+            min_samples (int, optional): The number of observed latencies required to use the percentile. Defaults to 20.
+            window_size (int, optional): The number of most recent latencies the percentile is computed on. Defaults to 1000.
+            budget_ratio (float, optional): The fraction of a token deposited by each request, i.e. the maximum ratio of hedges to requests. Defaults to 0.05.
+            budget_max_tokens (float, optional): The maximum number of tokens, i.e. the maximum burst of hedges. Defaults to 10.
+            methods (FrozenSet[RESTLI_METHODS], optional): The Rest.li methods to hedge, which must be idempotent. Defaults to GET, BATCH_GET, GET_ALL, FINDER and BATCH_FINDER.
+            max_workers (int, optional): The maximum number of threads sending duplicate requests. Defaults to 32.
+            max_primary_workers (int, optional): The maximum number of threads sending hedged requests, i.e. of requests in flight that can be hedged. Defaults to 64.
+            clock (Callable[[], float], optional): The monotonic clock used to measure latencies, in seconds. Defaults to time.monotonic.
+        """
+        if not 0 < percentile <= 100:
+            raise InvalidArgumentError(
+                "The 'percentile' argument must be between 0 and 100"
+            )
+        if not 1 <= min_samples <= window_size:
+            raise InvalidArgumentError(
+                "The arguments must satisfy 1 <= min_samples <= window_size"
+            )
+        if max_workers < 1 or max_primary_workers < 1:
+            raise InvalidArgumentError(
+                "The 'max_workers' and 'max_primary_workers' arguments must be at least 1"
+            )
+
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.budget_ratio = budget_ratio
+        self.budget_max_tokens = budget_max_tokens
+        self.methods = methods
+        self.clock = clock
+        self.hedged_requests = 0
+        self.__lock = threading.Lock()
+        self.__latencies = deque(maxlen=window_size)
+        self.__tokens = budget_max_tokens
+        self.__executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="linkedin-api-hedge"
+        )
+        # A slot is held by each primary request in flight, so that submitted primaries never queue
+        self.__primary_slots = threading.BoundedSemaphore(max_primary_workers)
+        self.__primary_executor = ThreadPoolExecutor(
+            max_workers=max_primary_workers,
+            thread_name_prefix="linkedin-api-hedge-primary",
+        )
+
+    def send(
+        self,
+        send: Callable[[PreparedRequest], Response],
+        prepared_request: PreparedRequest,
+    ) -> Response:
+        """
+        Sends a request, and a duplicate request if no response is received within the hedge delay.
+
+        Args:
+            send (Callable[[PreparedRequest], Response]): The function sending the request
+            prepared_request (PreparedRequest): The request to send
+
+        Returns:
+            Response: The first response received. If both requests fail, the error of the first one is raised.
+        """
+        if not self.__deposit() or not self.__primary_slots.acquire(blocking=False):
+            # No duplicate could be sent, or no primary thread is idle, so the request is sent without
+            # any thread hand-off
+            return self.__timed_send(send, prepared_request)
+
+        try:
+            primary = self.__primary_executor.submit(
+                self.__timed_send, send, prepared_request
+            )
+        except BaseException:
+            self.__primary_slots.release()
+            raise
+        # Also called if the primary is cancelled before it starts
+        primary.add_done_callback(lambda _: self.__primary_slots.release())
+        (done, _) = wait([primary], timeout=self.get_delay())
+        if done or not self.__try_acquire():
+            return primary.result()
+
+        hedge = self.__executor.submit(self.__timed_send, send, prepared_request.copy())
+        pending = {primary, hedge}
+        first_error: Optional[Future] = None
+        while pending:
+            (done, pending) = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for other in pending:
+                        other.cancel()
+                    return future.result()
+                if first_error is None:
+                    first_error = future
+        return first_error.result()
+
+    def get_delay(self) -> float:
+        """
+        Returns the current hedge delay, in seconds.
+        """
+        with self.__lock:
+            if len(self.__latencies) < self.min_samples:
+                return self.initial_delay
+            latencies = sorted(self.__latencies)
+        index = min(
+            len(latencies) - 1, math.ceil(len(latencies) * self.percentile / 100) - 1
+        )
+        return max(self.min_delay, latencies[index])
+
+    def shutdown(self) -> None:
+        """
+        Shuts down the threads sending hedged and duplicate requests.
+        """
+        self.__primary_executor.shutdown(wait=False)
+        self.__executor.shutdown(wait=False)
+
+    def __timed_send(
+        self, send: Callable[[PreparedRequest], Response], request: PreparedRequest
+    ) -> Response:
+        start = self.clock()
+        response = send(request)
+        with self.__lock:
+            self.__latencies.append(self.clock() - start)
+        return response
+
+    def __deposit(self) -> bool:
+        """
+        Deposits the token fraction of a request, and returns whether a hedge could be afforded.
+        """
+        with self.__lock:
+            self.__tokens = min(
+                self.budget_max_tokens, self.__tokens + self.budget_ratio
+            )
+            return self.__tokens >= 1
+
+    def __try_acquire(self) -> bool:
+        with self.__lock:
+            if self.__tokens < 1:
+                return False
+            self.__tokens -= 1
+            self.hedged_requests += 1
+            return True
@@ -0,0 +1,270 @@
+import copy
+import json
+import os
+from typing import Any, Dict, Iterator, List, Optional, Union, TYPE_CHECKING
+from linkedin_api.clients.restli.paginator import Paginator
+from linkedin_api.clients.restli.response import BatchGetResponse, CollectionResponse
+from linkedin_api.clients.restli.utils.batching import (
+    DEFAULT_MAX_IDS_PER_BATCH,
+    chunk_ids,
+)
+from linkedin_api.clients.restli.utils.query_tunneling import MAX_QUERY_STRING_LENGTH
+from linkedin_api.clients.restli.utils.restli import (
+    encode_query_params_for_get_requests,
+)
+from linkedin_api.common.errors import InvalidArgumentError
+
+if TYPE_CHECKING:
+    from linkedin_api.clients.restli.client import RestliClient
+
+Path = Union[str, "os.PathLike[str]"]
+
+DEFAULT_PAGES_STEP = "pages"
+DEFAULT_BATCH_GET_STEP = "batch_get"
+
+
+class CheckpointFile:
+    """
+    A JSON checkpoint stored in a local file. Checkpoints are written to a temporary file that is then
+    renamed, so that a crash never leaves a partially written checkpoint.
+    """
+
+    def __init__(self, path: Path, *, fsync: bool = True):
+        """
+        The constructor for the CheckpointFile class.
+
+        Args:
+            path (Path): The path of the checkpoint file
+            fsync (bool, optional): If True, each checkpoint is synced to disk before it replaces the previous one, so that it survives a crash of the host. Defaults to True.
+        """
+        self.path = path
+        self.fsync = fsync
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        Returns the last saved checkpoint, or None if there is none.
+        """
+        try:
+            with open(self.path, "r") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+
+    def save(self, checkpoint: Dict[str, Any]) -> None:
+        """
+        Saves a checkpoint, replacing the previous one.
+
+        Args:
+            checkpoint (Dict[str, Any]): The JSON-serializable checkpoint
+        """
+        temporary_path = f"{os.fspath(self.path)}.tmp"
+        with open(temporary_path, "w") as file:
+            json.dump(checkpoint, file)
+            file.flush()
+            if self.fsync:
+                os.fsync(file.fileno())
+        os.replace(temporary_path, self.path)
+
+    def remove(self) -> None:
+        """
+        Removes the checkpoint file, if it exists.
+        """
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class ResumableJob:
+    """
+    A long-running job over paginated collections and BATCH_GET chunks, whose progress is saved to a
+    checkpoint file after each page or chunk, so that a job restarted after a crash or a redeployment
+    resumes where it stopped instead of fetching everything again.
+
+    A job is made of named steps, each iterating over the pages of a paginator or over the BATCH_GET
+    chunks of a list of ids. The progress of a page or chunk is saved once the caller asks for the next
+    one, i.e. once the caller has processed it. A page or chunk whose processing was interrupted is
+    therefore fetched again on restart, but a completed one never is. Completed steps yield nothing when
+    the job is run again, until `reset()` is called.
+
+    The job parameters (e.g. the finder parameters) are saved in the checkpoint, and a checkpoint saved
+    with different parameters is rejected, so that the progress of one sync is never applied to another.
+    """
+
+    def __init__(
+        self,
+        checkpoint_path: Path,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        fsync: bool = True,
+    ):
+        """
+        The constructor for the ResumableJob class.
+
+        Args:
+            checkpoint_path (Path): The path of the checkpoint file
+            params (Optional[Dict[str, Any]], optional): The JSON-serializable parameters identifying the job, such as the resource path and finder parameters. Defaults to None.
+            fsync (bool, optional): If True, each checkpoint is synced to disk. Defaults to True.
+
+        Raises:
+            InvalidArgumentError: Error if the checkpoint file was saved by a job with different parameters
+        """
+        self.checkpoint_file = CheckpointFile(checkpoint_path, fsync=fsync)
+        self.params = json.loads(json.dumps(params)) if params is not None else None
+
+        checkpoint = self.checkpoint_file.load()
+        if checkpoint is not None and checkpoint.get("params") != self.params:
+            raise InvalidArgumentError(
+                f"The checkpoint '{os.fspath(checkpoint_path)}' was saved by a job with different parameters"
+            )
+        self.__steps: Dict[str, Dict[str, Any]] = (
+            checkpoint["steps"] if checkpoint is not None else {}
+        )
+
+    def is_step_completed(self, step: str) -> bool:
+        """
+        Returns whether a step of the job has completed.
+        """
+        return self.__steps.get(step, {}).get("completed", False)
+
+    def pages(
+        self, paginator: Paginator, *, step: str = DEFAULT_PAGES_STEP
+    ) -> Iterator[CollectionResponse]:
+        """
+        Iterates over the pages of a paginator (e.g. from `RestliClient.iter_finder()`), resuming after
+        the last page processed by a previous run of the step. The paginator must be created with the
+        same arguments on every run.
+
+        Args:
+            paginator (Paginator): The paginator
+            step (str, optional): The name of the step. Defaults to "pages".
+
+        Returns:
+            Iterator[CollectionResponse]: The pages that have not been processed yet
+        """
+        progress = self.__steps.get(step)
+        if progress is not None:
+            if progress["completed"]:
+                return
+            max_elements = (
+                max(0, paginator.max_elements - progress["elements"])
+                if paginator.max_elements is not None
+                else None
+            )
+            paginator = Paginator(
+                paginator.fetch_page,
+                start=progress["start"],
+                page_size=paginator.page_size,
+                max_elements=max_elements,
+                prefetch_pages=paginator.prefetch_pages,
+            )
+        else:
+            progress = {"start": paginator.start, "elements": 0, "completed": False}
+
+        remaining = paginator.max_elements
+        for (page, next_start) in paginator.pages_with_cursor():
+            yield page
+
+            num_elements = len(page.elements or [])
+            if remaining is not None:
+                num_elements = min(num_elements, remaining)
+                remaining -= num_elements
+            progress = {
+                "start": next_start,
+                "elements": progress["elements"] + num_elements,
+                "completed": False,
+            }
+            self.__save_step(step, progress)
+
+        self.__save_step(step, dict(progress, completed=True))
+
+    def batch_get_chunks(
+        self,
+        restli_client: "RestliClient",
+        *,
+        resource_path: str,
+        ids: List[Any],
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None,
+        max_ids_per_request: int = DEFAULT_MAX_IDS_PER_BATCH,
+        step: str = DEFAULT_BATCH_GET_STEP,
+    ) -> Iterator[BatchGetResponse]:
+        """
+        Splits the ids into chunks like `RestliClient.batch_get_chunked()`, and makes a BATCH_GET request
+        for each chunk that has not been processed by a previous run of the step. The ids must be the
+        same, in the same order, on every run.
+
+        Args:
+            restli_client (RestliClient): The client making the requests
+            resource_path (str): The resource path after the base URL, beginning with a forward slash
+            ids (List[Any]): The ids to fetch
+            access_token (str): The access token that should provide the application access to the specified API
+            path_keys (Optional[Dict[str, Any]], optional): The path key values of the resource path. Defaults to None.
+            query_params (Optional[Dict[str, Any]], optional): The query parameters of the requests. Defaults to {}.
+            version_string (Optional[str], optional): The version string of the requests. Defaults to None.
+            max_ids_per_request (int, optional): The maximum number of ids per BATCH_GET request. Defaults to 100.
+            step (str, optional): The name of the step. Defaults to "batch_get".
+
+        Raises:
+            InvalidArgumentError: Error if the ids are split into a different number of chunks than in the checkpoint
+
+        Returns:
+            Iterator[BatchGetResponse]: The response of each chunk that has not been processed yet, in order
+        """
+        base_query_params = copy.deepcopy(query_params) if query_params else {}
+        base_query_params.update({"ids": []})
+        id_chunks = chunk_ids(
+            ids,
+            max_ids=max_ids_per_request,
+            max_encoded_length=MAX_QUERY_STRING_LENGTH,
+            base_encoded_length=len(
+                encode_query_params_for_get_requests(base_query_params)
+            ),
+        )
+
+        progress = self.__steps.get(step)
+        if progress is not None and progress["chunks"] != len(id_chunks):
+            raise InvalidArgumentError(
+                f"The ids of step '{step}' are split into {len(id_chunks)} chunks, but the checkpoint has {progress['chunks']}"
+            )
+        completed_chunks = set(progress["completed_chunks"]) if progress else set()
+
+        for (index, id_chunk) in enumerate(id_chunks):
+            if index in completed_chunks:
+                continue
+            yield restli_client.batch_get(
+                resource_path=resource_path,
+                ids=id_chunk,
+                access_token=access_token,
+                path_keys=path_keys,
+                query_params=query_params,
+                version_string=version_string,
+            )
+
+            completed_chunks.add(index)
+            self.__save_step(
+                step,
+                {
+                    "chunks": len(id_chunks),
+                    "completed_chunks": sorted(completed_chunks),
+                    "completed": len(completed_chunks) == len(id_chunks),
+                },
+            )
+
+        if not id_chunks:
+            self.__save_step(
+                step, {"chunks": 0, "completed_chunks": [], "completed": True}
+            )
+
+    def reset(self) -> None:
+        """
+        Discards the progress of all the steps, so that the next run starts over.
+        """
+        self.__steps = {}
+        self.checkpoint_file.remove()
+
+    def __save_step(self, step: str, progress: Dict[str, Any]) -> None:
+        self.__steps[step] = progress
+        self.checkpoint_file.save({"params": self.params, "steps": self.__steps})
@@ -0,0 +1,291 @@
+import copy
+import re
+import threading
+from concurrent.futures import Future
+from linkedin_api.clients.common.json_codec import JsonCodec
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+from linkedin_api.clients.restli.response import BatchGetResponse, GetResponse
+from linkedin_api.clients.restli.response_formatter import GetResponseFormatter
+from linkedin_api.clients.restli.utils.batching import DEFAULT_MAX_IDS_PER_BATCH
+from linkedin_api.clients.restli.utils.encoder import encode, param_encode
+from linkedin_api.common.errors import InvalidArgumentError
+
+if TYPE_CHECKING:
+    from linkedin_api.clients.restli.client import RestliClient
+
+DEFAULT_WINDOW_SECONDS = 0.005
+
+# Matches an entity resource path whose last segment is the entity key placeholder,
+# e.g. "/adCampaigns/{id}" or "/adAccounts/{account}/adCampaigns/{id}"
+ENTITY_RESOURCE_PATH_PATTERN = re.compile(r"^(.*)/\{([^{}/]+)\}$")
+
+
+class _PendingBatch:
+    def __init__(
+        self,
+        resource_path: str,
+        path_keys: Optional[Dict[str, Any]],
+        query_params: Optional[Dict[str, Any]],
+        access_token: str,
+        version_string: Optional[str],
+    ):
+        self.resource_path = resource_path
+        self.path_keys = path_keys
+        self.query_params = query_params
+        self.access_token = access_token
+        self.version_string = version_string
+        self.futures_by_id: Dict[str, Tuple[Any, List[Future]]] = {}
+        self.timer: Optional[threading.Timer] = None
+
+
+class BatchGetLoader:
+    """
+    Coalesces individual GET requests for entities of the same collection into a single BATCH_GET
+    request, in the style of a DataLoader. GET requests on the same collection resource path, with the
+    same path keys, query parameters, access token and version string, that are made within a short
+    window of each other are sent together, and each caller is resolved from the `results`, `statuses`
+    and `errors` of the BATCH_GET response.
+
+    Only resource paths whose last segment is the entity key placeholder (e.g. "/adCampaigns/{id}") can
+    be coalesced. The batch is sent once the window elapses, once it reaches the max batch size, or when
+    `dispatch()` is called.
+    """
+
+    def __init__(
+        self,
+        restli_client: "RestliClient",
+        *,
+        window_seconds: Optional[float] = DEFAULT_WINDOW_SECONDS,
+        max_batch_size: int = DEFAULT_MAX_IDS_PER_BATCH,
+    ):
+        """
+        The constructor for the BatchGetLoader class.
+
+        Args:
+            restli_client (RestliClient): The client used to send the BATCH_GET requests.
+            window_seconds (Optional[float], optional): The time window in seconds during which GET requests are collected before the batch is sent. If None, batches are only sent when `dispatch()` is called or when they are full. Defaults to 0.005.
+            max_batch_size (int, optional): The maximum number of distinct ids in a batch. A full batch is sent immediately. Defaults to 100.
+        """
+        if max_batch_size <= 0:
+            raise InvalidArgumentError("The 'max_batch_size' argument must be positive")
+
+        self.restli_client = restli_client
+        self.window_seconds = window_seconds
+        self.max_batch_size = max_batch_size
+        self.__lock = threading.Lock()
+        self.__pending: Dict[Tuple, _PendingBatch] = {}
+
+    @staticmethod
+    def can_load(resource_path: str, path_keys: Optional[Dict[str, Any]]) -> bool:
+        """
+        Returns whether a GET request on the provided resource path can be coalesced into a BATCH_GET.
+
+        Args:
+            resource_path (str): The resource path of the GET request
+            path_keys (Optional[Dict[str, Any]]): The path keys of the GET request
+
+        Returns:
+            bool: True if the last segment of the resource path is a path key placeholder
+        """
+        match = ENTITY_RESOURCE_PATH_PATTERN.match(resource_path)
+        return match is not None and path_keys is not None and match[2] in path_keys
+
+    def load(
+        self,
+        *,
+        resource_path: str,
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None,
+    ) -> "Future[GetResponse]":
+        """
+        Queues a GET request to be sent as part of a BATCH_GET request. The arguments are the same as
+        `RestliClient.get()`.
+
+        Raises:
+            InvalidArgumentError: Error if the resource path does not end with an entity key placeholder
+
+        Returns:
+            Future[GetResponse]: A future resolved with the GetResponse of the entity once the batch is sent
+        """
+        if not self.can_load(resource_path, path_keys):
+            raise InvalidArgumentError(
+                "The 'resource_path' argument must end with an entity key placeholder that is defined in 'path_keys'"
+            )
+
+        match = ENTITY_RESOURCE_PATH_PATTERN.match(resource_path)
+        collection_resource_path, id_key = match[1], match[2]
+        collection_path_keys = {k: v for (k, v) in path_keys.items() if k != id_key}
+        id = path_keys[id_key]
+
+        batch_key = (
+            collection_resource_path,
+            param_encode(collection_path_keys),
+            param_encode(query_params),
+            access_token,
+            version_string,
+        )
+        future: "Future[GetResponse]" = Future()
+        full_batch = None
+
+        with self.__lock:
+            batch = self.__pending.get(batch_key)
+            if batch is None:
+                batch = _PendingBatch(
+                    resource_path=collection_resource_path,
+                    path_keys=collection_path_keys or None,
+                    query_params=copy.deepcopy(query_params),
+                    access_token=access_token,
+                    version_string=version_string,
+                )
+                self.__pending[batch_key] = batch
+                if self.window_seconds is not None:
+                    batch.timer = threading.Timer(
+                        self.window_seconds, self.__dispatch_batch, args=(batch_key,)
+                    )
+                    batch.timer.daemon = True
+                    batch.timer.start()
+
+            batch.futures_by_id.setdefault(encode(id), (id, []))[1].append(future)
+            if len(batch.futures_by_id) >= self.max_batch_size:
+                full_batch = self.__pop_batch(batch_key)
+
+        if full_batch is not None:
+            self.__send_batch(full_batch)
+
+        return future
+
+    def get(
+        self,
+        *,
+        resource_path: str,
+        access_token: str,
+        path_keys: Optional[Dict[str, Any]] = None,
+        query_params: Optional[Dict[str, Any]] = None,
+        version_string: Optional[str] = None,
+    ) -> GetResponse:
+        """
+        Queues a GET request to be sent as part of a BATCH_GET request, and waits for its response. The
+        arguments are the same as `RestliClient.get()`.
+
+        Returns:
+            GetResponse: The response for the requested entity
+        """
+        future = self.load(
+            resource_path=resource_path,
+            access_token=access_token,
+            path_keys=path_keys,
+            query_params=query_params,
+            version_string=version_string,
+        )
+        if self.window_seconds is None and not future.done():
+            # Nothing else would send the batch, so send it right away
+            self.dispatch()
+        return future.result()
+
+    def dispatch(self) -> None:
+        """
+        Immediately sends all the pending batches.
+        """
+        with self.__lock:
+            batches = [self.__pop_batch(key) for key in list(self.__pending.keys())]
+
+        for batch in batches:
+            self.__send_batch(batch)
+
+    def __pop_batch(self, batch_key: Tuple) -> _PendingBatch:
+        # Must be called while holding the lock
+        batch = self.__pending.pop(batch_key)
+        if batch.timer is not None:
+            batch.timer.cancel()
+        return batch
+
+    def __dispatch_batch(self, batch_key: Tuple) -> None:
+        with self.__lock:
+            batch = self.__pop_batch(batch_key) if batch_key in self.__pending else None
+
+        if batch is not None:
+            self.__send_batch(batch)
+
+    def __send_batch(self, batch: _PendingBatch) -> None:
+        try:
+            batch_response = self.restli_client.batch_get(
+                resource_path=batch.resource_path,
+                ids=[id for (id, _) in batch.futures_by_id.values()],
+                access_token=batch.access_token,
+                path_keys=batch.path_keys,
+                query_params=batch.query_params,
+                version_string=batch.version_string,
+            )
+        except Exception as error:
+            for (_, futures) in batch.futures_by_id.values():
+                for future in futures:
+                    future.set_exception(error)
+            return
+
+        for (encoded_id, (_, futures)) in batch.futures_by_id.items():
+            try:
+                result = to_get_response(
+                    batch_response,
+                    encoded_id,
+                    json_codec=self.restli_client.json_codec,
+                )
+            except Exception as error:
+                for future in futures:
+                    future.set_exception(error)
+            else:
+                for future in futures:
+                    future.set_result(result)
+
+
+def to_get_response(
+    batch_response: BatchGetResponse,
+    encoded_id: str,
+    *,
+    json_codec: Optional[JsonCodec] = None,
+) -> GetResponse:
+    """
+    Extracts the GetResponse of a single entity from a BatchGetResponse.
+
+    If the BATCH_GET request itself failed, the response is formatted as the failed GET response. If the
+    entity is in the `errors` map, the error is returned as the entity along with its status code. If the
+    entity is missing from the response altogether, a 404 response is returned.
+
+    Args:
+        batch_response (BatchGetResponse): The BATCH_GET response
+        encoded_id (str): The encoded id of the entity
+        json_codec (Optional[JsonCodec], optional): The JSON codec parsing a failed response. Defaults to None (the default codec).
+
+    Returns:
+        GetResponse: The response for the entity
+    """
+    if not 200 <= batch_response.status_code < 300:
+        return GetResponseFormatter.format_response(
+            batch_response.response, json_codec=json_codec
+        )
+
+    results = batch_response.results or {}
+    statuses = batch_response.statuses or {}
+    errors = batch_response.errors or {}
+
+    if encoded_id in results:
+        status_code = statuses.get(encoded_id, 200)
+        entity = results[encoded_id]
+    elif encoded_id in errors:
+        error = errors[encoded_id]
+        status_code = statuses.get(
+            encoded_id, error.get("status", 500) if isinstance(error, dict) else 500
+        )
+        entity = error
+    else:
+        status_code = statuses.get(encoded_id, 404)
+        entity = None
+
+    return GetResponse(
+        status_code=status_code,
+        url=batch_response.url,
+        headers=batch_response.headers,
+        response=batch_response.response,
+        entity=entity,
+    )
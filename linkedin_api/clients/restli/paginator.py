@@ -0,0 +1,187 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Iterator, Optional, Tuple
+from linkedin_api.clients.restli.response import CollectionResponse
+from linkedin_api.clients.restli.types import RestliEntity
+from linkedin_api.common.errors import InvalidArgumentError
+
+DEFAULT_PAGE_SIZE = 10
+
+FetchPage = Callable[[int, int], CollectionResponse]
+"""
+A function that fetches a single page of a collection, given the start index and the page size
+"""
+
+
+class Paginator:
+    """
+    Lazily iterates over a paged Rest.li collection (e.g. the results of a GET_ALL or FINDER request).
+    Pages are only requested as the iteration reaches them, and each page is released once its elements
+    have been consumed, so memory usage stays bounded by a single page regardless of the collection size.
+
+    Iterating over a paginator yields the individual elements. Use `pages()` to iterate over the
+    CollectionResponse of each page instead.
+
+    Optionally, once the first page reveals the total number of results, the following pages can be
+    prefetched concurrently on a bounded thread pool. Pages (and their elements) are still yielded in
+    order.
+    """
+
+    def __init__(
+        self,
+        fetch_page: FetchPage,
+        *,
+        start: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_elements: Optional[int] = None,
+        prefetch_pages: int = 0
+    ):
+        """
+        The constructor for the Paginator class.
+
+        Args:
+            fetch_page (FetchPage): The function used to fetch a page, given the start index and page size.
+            start (int, optional): The start index of the first page (zero-based). Defaults to 0.
+            page_size (int, optional): The number of elements requested per page. Defaults to 10.
+            max_elements (Optional[int], optional): The maximum number of elements to return. Defaults to None (no limit).
+            prefetch_pages (int, optional): The maximum number of pages to fetch concurrently ahead of the consumer. Prefetching only happens when the first page provides the total number of results. Defaults to 0 (pages are fetched one after another).
+
+        Raises:
+            InvalidArgumentError: Error if the page size is not positive or the start index, max elements or prefetch pages are negative
+        """
+        if page_size <= 0:
+            raise InvalidArgumentError("The 'page_size' argument must be positive")
+        if start < 0:
+            raise InvalidArgumentError("The 'start' argument must not be negative")
+        if max_elements is not None and max_elements < 0:
+            raise InvalidArgumentError(
+                "The 'max_elements' argument must not be negative"
+            )
+        if prefetch_pages < 0:
+            raise InvalidArgumentError(
+                "The 'prefetch_pages' argument must not be negative"
+            )
+
+        self.fetch_page = fetch_page
+        self.start = start
+        self.page_size = page_size
+        self.max_elements = max_elements
+        self.prefetch_pages = prefetch_pages
+
+    def __iter__(self) -> Iterator[RestliEntity]:
+        remaining = self.max_elements
+        for page in self.pages():
+            for element in page.elements or []:
+                if remaining is not None:
+                    if remaining <= 0:
+                        return
+                    remaining -= 1
+                yield element
+
+    def pages(self) -> Iterator[CollectionResponse]:
+        """
+        Lazily fetches and yields each page of the collection, in order.
+
+        Returns:
+            Iterator[CollectionResponse]: The collection response of each page
+        """
+        for (page, _) in self.pages_with_cursor():
+            yield page
+
+    def pages_with_cursor(self) -> Iterator[Tuple[CollectionResponse, int]]:
+        """
+        Lazily fetches and yields each page of the collection, in order, along with the start index of
+        the next page. A paginator created with this start index (and `max_elements` reduced by the
+        number of elements consumed) resumes the iteration after the page.
+
+        Returns:
+            Iterator[Tuple[CollectionResponse, int]]: The collection response of each page, and the start index of the next page
+        """
+        start = self.start
+        remaining = self.max_elements
+
+        while remaining is None or remaining > 0:
+            count = self.__page_count(remaining)
+            page = self.fetch_page(start, count)
+            yield (page, start + count)
+
+            num_elements = len(page.elements or [])
+            if remaining is not None:
+                remaining -= num_elements
+            start = start + count
+            if not has_next_page(page, start=start, count=count):
+                return
+
+            total = page.paging.total if page.paging else None
+            if self.prefetch_pages > 0 and total is not None:
+                yield from self.__prefetched_pages(
+                    self.__planned_pages(start, remaining, total)
+                )
+                return
+
+    def __page_count(self, remaining: Optional[int]) -> int:
+        return self.page_size if remaining is None else min(self.page_size, remaining)
+
+    def __planned_pages(
+        self, start: int, remaining: Optional[int], total: int
+    ) -> Iterator[Tuple[int, int]]:
+        while start < total and (remaining is None or remaining > 0):
+            count = self.__page_count(remaining)
+            yield (start, count)
+            start = start + count
+            if remaining is not None:
+                remaining -= count
+
+    def __prefetched_pages(
+        self, planned_pages: Iterator[Tuple[int, int]]
+    ) -> Iterator[Tuple[CollectionResponse, int]]:
+        executor = ThreadPoolExecutor(max_workers=self.prefetch_pages)
+        pending = deque(
+            (executor.submit(self.fetch_page, start, count), start + count)
+            for (start, count) in islice(planned_pages, self.prefetch_pages)
+        )
+        try:
+            while pending:
+                (future, next_start) = pending.popleft()
+                page = future.result()
+                # Keep the window of in-flight requests full before handing the page to the consumer
+                next_page = next(planned_pages, None)
+                if next_page is not None:
+                    (start, count) = next_page
+                    pending.append(
+                        (executor.submit(self.fetch_page, start, count), start + count)
+                    )
+                yield (page, next_start)
+
+                if not page.elements:
+                    # The collection shrank since the total was reported
+                    return
+        finally:
+            for (future, _) in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+
+def has_next_page(page: CollectionResponse, *, start: int, count: int) -> bool:
+    """
+    Determines whether there is another page after the provided page.
+
+    Args:
+        page (CollectionResponse): The last fetched page
+        start (int): The start index of the next page
+        count (int): The number of elements that were requested for the last page
+
+    Returns:
+        bool: True if the next page should be fetched
+    """
+    num_elements = len(page.elements or [])
+    if num_elements == 0:
+        return False
+
+    total = page.paging.total if page.paging else None
+    if total is not None:
+        return start < total
+    else:
+        # Without a total, a partial page means the end of the collection was reached
+        return num_elements >= count
@@ -1,10 +1,14 @@
-from typing import Dict, Optional, Any, Union, List
+from collections import deque
+from typing import Deque, Dict, Iterator, Optional, Any, Union, List
 from requests import Response
-from linkedin_api.clients.common.response import BaseResponse
+from linkedin_api.clients.common.response import BaseResponse, LazyField
+from linkedin_api.clients.restli.columnar import ElementColumns
 from linkedin_api.clients.restli.types import RestliEntity, EncodedEntityId
 
 
 class Paging:
+    __slots__ = ("start", "count", "total")
+
     def __init__(
         self,
         start: Optional[int] = None,
@@ -28,10 +32,23 @@ class Paging:
 
 
 class BaseRestliResponse(BaseResponse):
-    pass
+    """
+    The base class of the Rest.li responses. The fields decoded from the response body are decoded on
+    first access, so that callers only checking the status code or headers do not pay for decoding.
+
+    The responses and their result objects declare `__slots__` instead of having a per-instance
+    `__dict__`, which keeps large batch responses compact. The storage of each lazy field is the slot
+    named after it with a leading underscore.
+    """
+
+    __slots__ = ()
 
 
 class GetResponse(BaseRestliResponse):
+    __slots__ = ("_entity",)
+
+    entity = LazyField()
+
     def __init__(
         self,
         status_code: int,
@@ -49,6 +66,12 @@ class GetResponse(BaseRestliResponse):
 
 
 class BatchGetResponse(BaseRestliResponse):
+    __slots__ = ("_results", "_statuses", "_errors")
+
+    results = LazyField()
+    statuses = LazyField()
+    errors = LazyField()
+
     def __init__(
         self,
         status_code: int,
@@ -82,6 +105,12 @@ class BatchGetResponse(BaseRestliResponse):
 
 
 class CollectionResponse(BaseRestliResponse):
+    __slots__ = ("_elements", "_paging", "_metadata")
+
+    elements = LazyField()
+    paging = LazyField()
+    metadata = LazyField()
+
     def __init__(
         self,
         status_code: int,
@@ -111,7 +140,141 @@ class CollectionResponse(BaseRestliResponse):
         """
 
 
+class StreamingCollectionResponse(BaseRestliResponse):
+    """
+    A collection response whose body is parsed while it is downloaded. The elements are yielded by
+    `iter_elements()` (or by iterating over the response) as soon as they are parsed, and the connection
+    is released once they have all been read, or when the response is closed.
+    """
+
+    __slots__ = ("_elements", "_buffered_elements", "_paging", "_metadata")
+
+    paging = LazyField()
+    metadata = LazyField()
+
+    def __init__(
+        self,
+        status_code: int,
+        url: str,
+        headers: Dict[str, str],
+        response: Response,
+        elements: Iterator[RestliEntity],
+        paging: Paging,
+        metadata: Optional[Any],
+    ):
+        super().__init__(
+            status_code=status_code, headers=headers, url=url, response=response
+        )
+        self._elements = elements
+        self._buffered_elements: Deque[RestliEntity] = deque()
+
+        self.paging = paging
+        """
+        Paging metadata object. If the paging field follows the elements in the body, accessing it
+        before all the elements have been iterated over reads the rest of the body, and the elements
+        not iterated over yet are buffered in memory.
+        """
+
+        self.metadata = metadata
+        """
+        Optional response metadata object, read like the paging metadata.
+        """
+
+    def __iter__(self) -> Iterator[RestliEntity]:
+        return self.iter_elements()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __reduce_ex__(self, protocol):
+        # Pickling the open stream would otherwise fail after reading the rest of the body to resolve
+        # the paging and metadata
+        raise TypeError(
+            "A StreamingCollectionResponse cannot be pickled or copied, as its body is read from an open stream"
+        )
+
+    def iter_elements(self) -> Iterator[RestliEntity]:
+        """
+        Yields the elements of the response as they are parsed. The elements can only be iterated over
+        once.
+
+        Raises:
+            ResponseFormattingError: Error if the body is not a valid collection response
+        """
+        while True:
+            if self._buffered_elements:
+                yield self._buffered_elements.popleft()
+                continue
+            try:
+                element = next(self._elements)
+            except StopIteration:
+                self.close()
+                return
+            yield element
+
+    def read_remaining_elements(self) -> None:
+        """
+        Reads the rest of the body, buffering the elements that have not been iterated over yet.
+        """
+        self._buffered_elements.extend(self._elements)
+        self.response.close()
+
+    def close(self) -> None:
+        """
+        Closes the response, releasing its connection. The elements that have not been read are
+        discarded.
+        """
+        self._elements = iter(())
+        self._buffered_elements.clear()
+        self.response.close()
+
+
+class ColumnarCollectionResponse(BaseRestliResponse):
+    """
+    A collection response whose elements are stored column by column, for the requested field paths only.
+    """
+
+    __slots__ = ("_columns", "_paging", "_metadata")
+
+    columns = LazyField()
+    paging = LazyField()
+    metadata = LazyField()
+
+    def __init__(
+        self,
+        status_code: int,
+        url: str,
+        headers: Dict[str, str],
+        response: Response,
+        columns: ElementColumns,
+        paging: Paging,
+        metadata: Optional[Any],
+    ):
+        super().__init__(
+            status_code=status_code, headers=headers, url=url, response=response
+        )
+        self.columns = columns
+        """
+        The columns of the requested field paths of the elements.
+        """
+
+        self.paging = paging
+        """
+        Paging metadata object
+        """
+
+        self.metadata = metadata
+        """
+        Optional response metadata object
+        """
+
+
 class BatchFinderResult:
+    __slots__ = ("elements", "paging", "metadata", "error", "isError")
+
     def __init__(
         self,
         elements: List[RestliEntity],
@@ -147,6 +310,10 @@ class BatchFinderResult:
 
 
 class BatchFinderResponse(BaseRestliResponse):
+    __slots__ = ("_results",)
+
+    results = LazyField()
+
     def __init__(
         self,
         status_code: int,
@@ -166,6 +333,10 @@ class BatchFinderResponse(BaseRestliResponse):
 
 
 class CreateResponse(BaseRestliResponse):
+    __slots__ = ("entity_id", "decoded_entity_id", "_entity")
+
+    entity = LazyField()
+
     def __init__(
         self,
         status_code: int,
@@ -197,6 +368,8 @@ class CreateResponse(BaseRestliResponse):
 
 
 class BatchCreateResult:
+    __slots__ = ("status", "id", "error")
+
     def __init__(self, status: int, id: str, error: Any):
         self.status = status
         """
@@ -215,6 +388,10 @@ class BatchCreateResult:
 
 
 class BatchCreateResponse(BaseRestliResponse):
+    __slots__ = ("_elements",)
+
+    elements = LazyField()
+
     def __init__(
         self,
         status_code: int,
@@ -234,6 +411,10 @@ class BatchCreateResponse(BaseRestliResponse):
 
 
 class UpdateResponse(BaseRestliResponse):
+    __slots__ = ("_entity",)
+
+    entity = LazyField()
+
     def __init__(
         self,
         status_code: int,
@@ -253,6 +434,8 @@ class UpdateResponse(BaseRestliResponse):
 
 
 class BatchUpdateResult:
+    __slots__ = ("status",)
+
     # TODO add support for return entity
     def __init__(self, status: int):
         self.status = status
@@ -262,6 +445,10 @@ class BatchUpdateResult:
 
 
 class BatchUpdateResponse(BaseRestliResponse):
+    __slots__ = ("_results",)
+
+    results = LazyField()
+
     def __init__(
         self,
         status_code: int,
@@ -281,6 +468,8 @@ class BatchUpdateResponse(BaseRestliResponse):
 
 
 class BatchDeleteResult:
+    __slots__ = ("status",)
+
     def __init__(self, status: int):
         self.status = status
         """
@@ -289,6 +478,10 @@ class BatchDeleteResult:
 
 
 class BatchDeleteResponse(BaseRestliResponse):
+    __slots__ = ("_results",)
+
+    results = LazyField()
+
     def __init__(
         self,
         status_code: int,
@@ -308,6 +501,10 @@ class BatchDeleteResponse(BaseRestliResponse):
 
 
 class ActionResponse(BaseRestliResponse):
+    __slots__ = ("_value",)
+
+    value = LazyField()
+
     def __init__(
         self,
         status_code: int,
@@ -1,5 +1,7 @@
-from typing import Dict
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
 
+from linkedin_api.clients.common.json_codec import JsonCodec, resolve_json_codec
+from linkedin_api.clients.common.response import LazyValue
 from linkedin_api.clients.common.response_formatter import (
     BaseResponseFormatter,
     wrap_format_exception,
@@ -8,6 +10,8 @@ from linkedin_api.clients.restli.response import (
     GetResponse,
     BatchGetResponse,
     CollectionResponse,
+    StreamingCollectionResponse,
+    ColumnarCollectionResponse,
     Paging,
     BatchFinderResponse,
     BatchFinderResult,
@@ -22,83 +26,242 @@ from linkedin_api.clients.restli.response import (
     BatchDeleteResult,
     ActionResponse,
 )
+from linkedin_api.clients.restli.columnar import ElementColumns, build_columns
 from linkedin_api.clients.restli.utils.restli import get_created_entity_id
+from linkedin_api.clients.restli.utils.streaming import (
+    DEFAULT_STREAM_CHUNK_SIZE,
+    CollectionStreamParser,
+)
 from requests import Response
 
 
+def lazy_body(
+    response: Response,
+    json_codec: Optional[JsonCodec] = None,
+    *,
+    allow_empty: bool = False
+) -> LazyValue:
+    """
+    Returns the JSON-decoded body of a response as a LazyValue, so that the body is only decoded if a
+    field derived from it is accessed.
+
+    Args:
+        response (Response): The response
+        json_codec (Optional[JsonCodec], optional): The codec parsing the body. Defaults to the default codec (see `get_default_json_codec()`).
+        allow_empty (bool, optional): If True, a body that cannot be decoded (e.g. an empty body) is decoded as None. Defaults to False.
+    """
+
+    json_codec = resolve_json_codec(json_codec)
+
+    def decode() -> Any:
+        try:
+            return json_codec.decode_response(response)
+        except ValueError:
+            if allow_empty:
+                return None
+            raise
+
+    return LazyValue(decode)
+
+
+def lazy_body_field(
+    body: LazyValue, key: str, transform: Optional[Callable[[Any], Any]] = None
+) -> LazyValue:
+    """
+    Returns a field of a lazily decoded body as a LazyValue, optionally transformed when not None.
+    """
+
+    def get_field() -> Any:
+        value = body.get().get(key, None)
+        return (
+            transform(value) if transform is not None and value is not None else value
+        )
+
+    return LazyValue(get_field)
+
+
 class GetResponseFormatter(BaseResponseFormatter[GetResponse]):
     @classmethod
     @wrap_format_exception
-    def format_response(cls, response) -> GetResponse:
-        json_data = response.json()
-
+    def format_response(
+        cls, response: Response, *, json_codec: Optional[JsonCodec] = None
+    ) -> GetResponse:
         return GetResponse(
             status_code=response.status_code,
             url=response.url,
             headers=response.headers,
             response=response,
-            entity=json_data,
+            entity=lazy_body(response, json_codec),
         )
 
 
 class BatchGetResponseFormatter(BaseResponseFormatter[BatchGetResponse]):
     @classmethod
     @wrap_format_exception
-    def format_response(cls, response: Response) -> BatchGetResponse:
-        json_data = response.json()
+    def format_response(
+        cls, response: Response, *, json_codec: Optional[JsonCodec] = None
+    ) -> BatchGetResponse:
+        body = lazy_body(response, json_codec)
         return BatchGetResponse(
             status_code=response.status_code,
             url=response.url,
             headers=response.headers,
             response=response,
-            results=json_data.get("results", None),
-            statuses=json_data.get("statuses", None),
-            errors=json_data.get("errors", None),
+            results=lazy_body_field(body, "results"),
+            statuses=lazy_body_field(body, "statuses"),
+            errors=lazy_body_field(body, "errors"),
         )
 
 
 class CollectionResponseFormatter(BaseResponseFormatter[CollectionResponse]):
     @classmethod
     @wrap_format_exception
-    def format_response(cls, response: Response) -> CollectionResponse:
-        json_data = response.json()
-        paging = json_data.get("paging", None)
+    def format_response(
+        cls, response: Response, *, json_codec: Optional[JsonCodec] = None
+    ) -> CollectionResponse:
+        body = lazy_body(response, json_codec)
 
         return CollectionResponse(
             status_code=response.status_code,
             url=response.url,
             headers=response.headers,
             response=response,
-            elements=json_data.get("elements", None),
-            paging=Paging(
-                paging.get("start", None),
-                paging.get("count", None),
-                paging.get("total", None),
-            )
-            if paging
-            else Paging(),
-            metadata=getattr(json_data, "metadata", None),
+            elements=lazy_body_field(body, "elements"),
+            paging=LazyValue(lambda: cls.format_paging(body.get().get("paging", None))),
+            metadata=lazy_body_field(body, "metadata"),
         )
 
+    @classmethod
+    def format_paging(cls, paging: Optional[Dict]) -> Paging:
+        if not paging:
+            return Paging()
+        return Paging(
+            paging.get("start", None),
+            paging.get("count", None),
+            paging.get("total", None),
+        )
 
-class BatchFinderResponseFormatter(BaseResponseFormatter[BatchFinderResponse]):
+
+class StreamingCollectionResponseFormatter(
+    BaseResponseFormatter[StreamingCollectionResponse]
+):
     @classmethod
     @wrap_format_exception
-    def format_response(cls, response: Response) -> BatchFinderResponse:
-        json_data = response.json()
-        elements = json_data.get("elements", None)
-        finder_results = (
-            [cls.format_finder_result(result) for result in elements]
-            if elements
-            else None
+    def format_response(
+        cls,
+        response: Response,
+        *,
+        json_codec: Optional[JsonCodec] = None,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE
+    ) -> StreamingCollectionResponse:
+        """
+        Formats a response sent with `stream=True`, whose body has not been downloaded yet. The JSON codec
+        is not used, as the body is parsed incrementally with the standard library decoder. The body of an
+        error response is downloaded right away, so that it remains readable from the raw response.
+        """
+        if 200 <= response.status_code < 300:
+            chunks = response.iter_content(chunk_size)
+        else:
+            chunks = [response.content]
+        parser = CollectionStreamParser(chunks)
+        streaming_response = StreamingCollectionResponse(
+            status_code=response.status_code,
+            url=response.url,
+            headers=response.headers,
+            response=response,
+            elements=parser.iter_elements(),
+            paging=None,
+            metadata=None,
         )
 
+        def get_field(key: str) -> Any:
+            # Fields preceding the elements in the body are available without reading the elements
+            if key not in parser.fields and not parser.completed:
+                streaming_response.read_remaining_elements()
+            return parser.fields.get(key, None)
+
+        streaming_response.paging = LazyValue(
+            lambda: CollectionResponseFormatter.format_paging(get_field("paging"))
+        )
+        streaming_response.metadata = LazyValue(lambda: get_field("metadata"))
+        return streaming_response
+
+
+class ColumnarCollectionResponseFormatter(
+    BaseResponseFormatter[ColumnarCollectionResponse]
+):
+    @classmethod
+    @wrap_format_exception
+    def format_response(
+        cls,
+        response: Response,
+        *,
+        json_codec: Optional[JsonCodec] = None,
+        columns: Sequence[str],
+        stream: bool = False,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE
+    ) -> ColumnarCollectionResponse:
+        """
+        Formats a collection response into the columns of the specified field paths. The decoded body is
+        not retained once the columns are built.
+
+        If `stream` is True, the response must have been sent with `stream=True`: the columns are built
+        right away from the elements parsed as the body is downloaded, so that the elements are never all
+        decoded at once. Otherwise, the body is decoded with the JSON codec when a field is first accessed.
+        """
+
+        def parse() -> Tuple[ElementColumns, Dict[str, Any]]:
+            if stream and 200 <= response.status_code < 300:
+                parser = CollectionStreamParser(response.iter_content(chunk_size))
+                element_columns = build_columns(parser.iter_elements(), columns)
+                response.close()
+                return (element_columns, parser.fields)
+
+            body = resolve_json_codec(json_codec).decode_response(response)
+            element_columns = build_columns(body.pop("elements", None) or [], columns)
+            return (element_columns, body)
+
+        parsed = LazyValue(parse)
+        if stream:
+            parsed.get()
+
+        return ColumnarCollectionResponse(
+            status_code=response.status_code,
+            url=response.url,
+            headers=response.headers,
+            response=response,
+            columns=LazyValue(lambda: parsed.get()[0]),
+            paging=LazyValue(
+                lambda: CollectionResponseFormatter.format_paging(
+                    parsed.get()[1].get("paging", None)
+                )
+            ),
+            metadata=LazyValue(lambda: parsed.get()[1].get("metadata", None)),
+        )
+
+
+class BatchFinderResponseFormatter(BaseResponseFormatter[BatchFinderResponse]):
+    @classmethod
+    @wrap_format_exception
+    def format_response(
+        cls, response: Response, *, json_codec: Optional[JsonCodec] = None
+    ) -> BatchFinderResponse:
+        body = lazy_body(response, json_codec)
+
+        def format_finder_results() -> Any:
+            elements = body.get().get("elements", None)
+            return (
+                [cls.format_finder_result(result) for result in elements]
+                if elements
+                else None
+            )
+
         return BatchFinderResponse(
             status_code=response.status_code,
             url=response.url,
             headers=response.headers,
             response=response,
-            results=finder_results,
+            results=LazyValue(format_finder_results),
         )
 
     @classmethod
@@ -116,12 +279,11 @@ class BatchFinderResponseFormatter(BaseResponseFormatter[BatchFinderResponse]):
 class CreateResponseFormatter(BaseResponseFormatter[CreateResponse]):
     @classmethod
     @wrap_format_exception
-    def format_response(cls, response: Response) -> CreateResponse:
-        try:
-            json_data = response.json()
-        except ValueError:
-            # Handle case of no entity returned in the response
-            json_data = None
+    def format_response(
+        cls, response: Response, *, json_codec: Optional[JsonCodec] = None
+    ) -> CreateResponse:
+        # No entity is returned in the response by most APIs
+        body = lazy_body(response, json_codec, allow_empty=True)
 
         return CreateResponse(
             status_code=response.status_code,
@@ -130,26 +292,28 @@ class CreateResponseFormatter(BaseResponseFormatter[CreateResponse]):
             response=response,
             entity_id=get_created_entity_id(response, False),
             decoded_entity_id=get_created_entity_id(response, True),
-            entity=json_data if json_data else None,
+            entity=LazyValue(lambda: body.get() or None),
         )
 
 
 class BatchCreateResponseFormatter(BaseResponseFormatter[BatchCreateResponse]):
     @classmethod
     @wrap_format_exception
-    def format_response(cls, response: Response) -> BatchCreateResponse:
-        json_data = response.json()
-        elements = json_data.get("elements", None)
-        batch_create_results = [
-            cls.format_batch_create_result(result) for result in elements
-        ]
+    def format_response(
+        cls, response: Response, *, json_codec: Optional[JsonCodec] = None
+    ) -> BatchCreateResponse:
+        body = lazy_body(response, json_codec)
+
+        def format_batch_create_results() -> Any:
+            elements = body.get().get("elements", None)
+            return [cls.format_batch_create_result(result) for result in elements]
 
         return BatchCreateResponse(
             status_code=response.status_code,
             url=response.url,
             headers=response.headers,
             response=response,
-            elements=batch_create_results,
+            elements=LazyValue(format_batch_create_results),
         )
 
     @classmethod
@@ -165,41 +329,41 @@ class BatchCreateResponseFormatter(BaseResponseFormatter[BatchCreateResponse]):
 class UpdateResponseFormatter(BaseResponseFormatter[UpdateResponse]):
     @classmethod
     @wrap_format_exception
-    def format_response(cls, response: Response) -> UpdateResponse:
-        try:
-            json_data = response.json()
-        except ValueError:
-            json_data = None
-
+    def format_response(
+        cls, response: Response, *, json_codec: Optional[JsonCodec] = None
+    ) -> UpdateResponse:
         return UpdateResponse(
             status_code=response.status_code,
             url=response.url,
             headers=response.headers,
             response=response,
-            entity=json_data if json_data is not None else None,
+            entity=lazy_body(response, json_codec, allow_empty=True),
         )
 
 
 class BatchUpdateResponseFormatter(BaseResponseFormatter[BatchUpdateResponse]):
     @classmethod
     @wrap_format_exception
-    def format_response(cls, response: Response) -> BatchUpdateResponse:
-        json_data = response.json()
-        results = json_data.get("results", None)
-        if results is not None:
-            batch_update_results = {
+    def format_response(
+        cls, response: Response, *, json_codec: Optional[JsonCodec] = None
+    ) -> BatchUpdateResponse:
+        body = lazy_body(response, json_codec)
+
+        def format_batch_update_results() -> Any:
+            results = body.get().get("results", None)
+            if results is None:
+                return None
+            return {
                 encoded_id: cls.format_batch_update_result(result)
                 for (encoded_id, result) in results.items()
             }
-        else:
-            batch_update_results = None
 
         return BatchUpdateResponse(
             status_code=response.status_code,
             url=response.url,
             headers=response.headers,
             response=response,
-            results=batch_update_results,
+            results=LazyValue(format_batch_update_results),
         )
 
     @classmethod
@@ -211,7 +375,9 @@ class BatchUpdateResponseFormatter(BaseResponseFormatter[BatchUpdateResponse]):
 class DeleteResponseFormatter(BaseResponseFormatter[BaseRestliResponse]):
     @classmethod
     @wrap_format_exception
-    def format_response(cls, response: Response) -> BaseRestliResponse:
+    def format_response(
+        cls, response: Response, *, json_codec: Optional[JsonCodec] = None
+    ) -> BaseRestliResponse:
         return BaseRestliResponse(
             status_code=response.status_code,
             url=response.url,
@@ -223,11 +389,16 @@ class DeleteResponseFormatter(BaseResponseFormatter[BaseRestliResponse]):
 class BatchDeleteResponseFormatter(BaseResponseFormatter[BatchDeleteResponse]):
     @classmethod
     @wrap_format_exception
-    def format_response(cls, response: Response) -> BatchDeleteResponse:
-        json_data = response.json()
-        results = json_data.get("results", None)
-        if results is not None:
-            batch_delete_results = {
+    def format_response(
+        cls, response: Response, *, json_codec: Optional[JsonCodec] = None
+    ) -> BatchDeleteResponse:
+        body = lazy_body(response, json_codec)
+
+        def format_batch_delete_results() -> Any:
+            results = body.get().get("results", None)
+            if results is None:
+                return None
+            return {
                 encoded_id: cls.format_batch_delete_result(result)
                 for (encoded_id, result) in results.items()
             }
@@ -237,7 +408,7 @@ class BatchDeleteResponseFormatter(BaseResponseFormatter[BatchDeleteResponse]):
             url=response.url,
             headers=response.headers,
             response=response,
-            results=batch_delete_results,
+            results=LazyValue(format_batch_delete_results),
         )
 
     @classmethod
@@ -249,13 +420,13 @@ class BatchDeleteResponseFormatter(BaseResponseFormatter[BatchDeleteResponse]):
 class ActionResponseFormatter(BaseResponseFormatter[ActionResponse]):
     @classmethod
     @wrap_format_exception
-    def format_response(cls, response: Response) -> ActionResponse:
-        json_data = response.json()
-
+    def format_response(
+        cls, response: Response, *, json_codec: Optional[JsonCodec] = None
+    ) -> ActionResponse:
         return ActionResponse(
             status_code=response.status_code,
             url=response.url,
             headers=response.headers,
             response=response,
-            value=json_data.get("value", None),
+            value=lazy_body_field(lazy_body(response, json_codec), "value"),
         )
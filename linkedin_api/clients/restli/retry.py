@@ -0,0 +1,285 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, FrozenSet, Optional
+from requests import PreparedRequest, Response
+from requests.exceptions import ConnectionError, Timeout
+from linkedin_api.common.constants import (
+    HEADERS,
+    IDEMPOTENT_RESTLI_METHODS,
+    RESTLI_METHODS,
+)
+from linkedin_api.common.errors import InvalidArgumentError
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BASE_DELAY_SECONDS = 0.5
+DEFAULT_MAX_DELAY_SECONDS = 30.0
+DEFAULT_MAX_ELAPSED_SECONDS = 60.0
+DEFAULT_BUDGET_MAX_TOKENS = 10.0
+DEFAULT_BUDGET_TOKEN_RATIO = 0.1
+
+TOO_MANY_REQUESTS_STATUS_CODE = 429
+DEFAULT_RETRY_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parses the value of a `Retry-After` header, which is either a number of seconds or an HTTP date.
+
+    Args:
+        value (Optional[str]): The header value
+
+    Returns:
+        Optional[float]: The number of seconds to wait, or None if the value is missing or invalid
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryBudget:
+    """
+    A thread-safe budget limiting the ratio of retries to successful requests, shared by all requests
+    using a retry policy. Each retry consumes a token and each successful request deposits a fraction of
+    a token; retries are only allowed while more than half of the tokens are available. When the API is
+    failing persistently, retries are therefore throttled instead of multiplying the load.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_tokens: float = DEFAULT_BUDGET_MAX_TOKENS,
+        token_ratio: float = DEFAULT_BUDGET_TOKEN_RATIO
+    ):
+        """
+        The constructor for the RetryBudget class.
+
+        Args:
+            max_tokens (float, optional): The maximum number of tokens, which is also the initial number. Defaults to 10.
+            token_ratio (float, optional): The fraction of a token deposited by each successful request. Defaults to 0.1.
+        """
+        if max_tokens <= 0:
+            raise InvalidArgumentError("The 'max_tokens' argument must be positive")
+        if token_ratio < 0:
+            raise InvalidArgumentError(
+                "The 'token_ratio' argument must not be negative"
+            )
+
+        self.max_tokens = max_tokens
+        self.token_ratio = token_ratio
+        self.__tokens = max_tokens
+        self.__lock = threading.Lock()
+
+    def record_success(self) -> None:
+        """
+        Deposits a fraction of a token for a request that did not need to be retried.
+        """
+        with self.__lock:
+            self.__tokens = min(self.max_tokens, self.__tokens + self.token_ratio)
+
+    def try_acquire(self) -> bool:
+        """
+        Consumes a token for a retry, and returns whether the retry is allowed.
+        """
+        with self.__lock:
+            self.__tokens = max(0.0, self.__tokens - 1)
+            return self.__tokens > self.max_tokens / 2
+
+    @property
+    def tokens(self) -> float:
+        """
+        The number of available tokens.
+        """
+        with self.__lock:
+            return self.__tokens
+
+
+class RetryPolicy:
+    """
+    A policy for retrying throttled or failed Rest.li requests with exponential backoff and full jitter.
+
+    Throttled (429) responses are retried for all Rest.li methods, since throttled requests are not
+    processed. Other retryable status codes and connection errors are only retried for idempotent methods
+    (GET, BATCH_GET, GET_ALL, FINDER, BATCH_FINDER, UPDATE, BATCH_UPDATE, DELETE and BATCH_DELETE), since
+    the request may have been processed. The delay before a retry is the `Retry-After` header value, if
+    present, and otherwise a random delay between zero and the exponentially increasing backoff, so that
+    clients throttled at the same time do not retry in lockstep.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        base_delay: float = DEFAULT_BASE_DELAY_SECONDS,
+        max_delay: float = DEFAULT_MAX_DELAY_SECONDS,
+        max_elapsed_time: Optional[float] = DEFAULT_MAX_ELAPSED_SECONDS,
+        max_retry_after: Optional[float] = None,
+        retry_status_codes: FrozenSet[int] = DEFAULT_RETRY_STATUS_CODES,
+        budget: Optional[RetryBudget] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+        random_fn: Callable[[], float] = random.random
+    ):
+        """
+        The constructor for the RetryPolicy class.
+
+        Args:
+            max_attempts (int, optional): The maximum number of attempts, including the first request. Defaults to 3.
+            base_delay (float, optional): The backoff before the first retry, in seconds, which doubles with each retry. Defaults to 0.5.
+            max_delay (float, optional): The maximum backoff, in seconds. Defaults to 30.
+            max_elapsed_time (Optional[float], optional): The maximum time in seconds from the first request after which no retry is started. If None, only `max_attempts` applies. Defaults to 60.
+            max_retry_after (Optional[float], optional): The maximum `Retry-After` header value honored, in seconds. A request whose response asks for a longer delay is not retried, so that a misbehaving server or proxy cannot block the calling thread for hours. Defaults to `max_delay`.
+            retry_status_codes (FrozenSet[int], optional): The response status codes to retry. Defaults to 429, 500, 502, 503 and 504.
+            budget (Optional[RetryBudget], optional): The retry budget shared by the requests using this policy. Defaults to None (no budget).
+            sleep (Callable[[float], None], optional): The function used to wait before a retry. Defaults to time.sleep.
+            clock (Callable[[], float], optional): The monotonic clock used for the elapsed time, in seconds. Defaults to time.monotonic.
+            random_fn (Callable[[], float], optional): The function returning a random number in [0, 1) for the jitter. Defaults to random.random.
+        """
+        if max_attempts < 1:
+            raise InvalidArgumentError("The 'max_attempts' argument must be at least 1")
+        if base_delay < 0 or max_delay < 0:
+            raise InvalidArgumentError(
+                "The 'base_delay' and 'max_delay' arguments must not be negative"
+            )
+        if max_retry_after is not None and max_retry_after < 0:
+            raise InvalidArgumentError(
+                "The 'max_retry_after' argument must not be negative"
+            )
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_elapsed_time = max_elapsed_time
+        self.max_retry_after = (
+            max_retry_after if max_retry_after is not None else max_delay
+        )
+        self.retry_status_codes = retry_status_codes
+        self.budget = budget
+        self.sleep = sleep
+        self.clock = clock
+        self.random_fn = random_fn
+
+    def send(
+        self,
+        send: Callable[[PreparedRequest], Response],
+        prepared_request: PreparedRequest,
+        restli_method: RESTLI_METHODS,
+    ) -> Response:
+        """
+        Sends a request, retrying it according to the policy.
+
+        Args:
+            send (Callable[[PreparedRequest], Response]): The function sending the request
+            prepared_request (PreparedRequest): The request to send
+            restli_method (RESTLI_METHODS): The Rest.li method of the request
+
+        Returns:
+            Response: The response of the last attempt. If the last attempt failed with a connection error, the error is raised.
+        """
+        start = self.clock()
+        attempt = 0
+
+        while True:
+            attempt += 1
+            response: Optional[Response] = None
+            try:
+                response = send(prepared_request)
+            except (ConnectionError, Timeout) as error:
+                delay = self.__get_retry_delay(
+                    restli_method, None, attempt=attempt, start=start
+                )
+                if delay is None:
+                    raise error
+            else:
+                delay = self.__get_retry_delay(
+                    restli_method, response, attempt=attempt, start=start
+                )
+                if delay is None:
+                    return response
+                # Releases the connection of a discarded response whose body was not read (e.g. streamed)
+                response.close()
+
+            self.sleep(delay)
+
+    def is_retryable(
+        self, restli_method: RESTLI_METHODS, response: Optional[Response]
+    ) -> bool:
+        """
+        Returns whether a response, or a connection error if the response is None, can be retried.
+        """
+        if response is None:
+            return restli_method in IDEMPOTENT_RESTLI_METHODS
+        if response.status_code not in self.retry_status_codes:
+            return False
+        return (
+            response.status_code == TOO_MANY_REQUESTS_STATUS_CODE
+            or restli_method in IDEMPOTENT_RESTLI_METHODS
+        )
+
+    def get_delay(self, attempt: int, response: Optional[Response]) -> Optional[float]:
+        """
+        Returns the delay in seconds before retrying the specified attempt: the `Retry-After` header value
+        if present, and otherwise a random delay up to the exponential backoff (full jitter). Returns None
+        if the `Retry-After` header value exceeds `max_retry_after`, in which case the request is not
+        retried.
+        """
+        if response is not None:
+            retry_after = parse_retry_after(
+                response.headers.get(HEADERS.RETRY_AFTER.value)
+            )
+            if retry_after is not None:
+                return retry_after if retry_after <= self.max_retry_after else None
+
+        backoff = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return self.random_fn() * backoff
+
+    def __get_retry_delay(
+        self,
+        restli_method: RESTLI_METHODS,
+        response: Optional[Response],
+        *,
+        attempt: int,
+        start: float
+    ) -> Optional[float]:
+        """
+        Returns the delay before retrying a response, or a connection error if the response is None, or
+        None if it should not be retried. A budget token is only consumed once all the other conditions
+        allow the retry.
+        """
+        if not self.is_retryable(restli_method, response):
+            # Only successes earn retry tokens, so that failures that are not retried (e.g. 4xx
+            # responses) do not fund the retries of an outage
+            if (
+                self.budget is not None
+                and response is not None
+                and 200 <= response.status_code < 400
+            ):
+                self.budget.record_success()
+            return None
+        if attempt >= self.max_attempts:
+            return None
+        delay = self.get_delay(attempt, response)
+        if delay is None or not self.__within_elapsed_time(start, delay):
+            return None
+        if self.budget is not None and not self.budget.try_acquire():
+            return None
+        return delay
+
+    def __within_elapsed_time(self, start: float, delay: float) -> bool:
+        return (
+            self.max_elapsed_time is None
+            or self.clock() - start + delay <= self.max_elapsed_time
+        )
@@ -0,0 +1,88 @@
+from typing import Callable, Optional, Type, TypeVar
+from requests import PreparedRequest, Response
+from linkedin_api.clients.common.cache import CacheBackend, InMemoryCacheBackend
+from linkedin_api.clients.common.json_codec import JsonCodec
+from linkedin_api.clients.common.response_formatter import BaseResponseFormatter
+from linkedin_api.clients.restli.response import BaseRestliResponse
+from linkedin_api.common.constants import HEADERS
+
+T = TypeVar("T", bound=BaseRestliResponse)
+
+NOT_MODIFIED_STATUS_CODE = 304
+
+
+class RevalidationCache:
+    """
+    A cache of read-only responses that are revalidated with conditional requests. The validators of
+    successful responses (the `ETag` and `Last-Modified` headers) are stored along with the formatted
+    response. Subsequent identical requests send the validators in the `If-None-Match` and
+    `If-Modified-Since` headers, and if the server responds with a 304 (Not Modified) status, the cached
+    response is returned instead, so that the unchanged body is neither downloaded nor parsed again.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None):
+        """
+        The constructor for the RevalidationCache class.
+
+        Args:
+            backend (Optional[CacheBackend], optional): The storage backend of the validators and cached responses. Defaults to an InMemoryCacheBackend whose entries do not expire.
+        """
+        self.backend = (
+            backend if backend is not None else InMemoryCacheBackend(ttl=None)
+        )
+
+    def send_and_format(
+        self,
+        send: Callable[[PreparedRequest], Response],
+        prepared_request: PreparedRequest,
+        formatter: Type[BaseResponseFormatter[T]],
+        *,
+        request_key: str,
+        json_codec: Optional[JsonCodec] = None
+    ) -> T:
+        """
+        Sends a conditional request if validators are cached for the request, and formats the response.
+
+        Args:
+            send (Callable[[PreparedRequest], Response]): The function sending the request
+            prepared_request (PreparedRequest): The request to send, to which the conditional headers are added
+            formatter (Type[BaseResponseFormatter[T]]): The formatter of the response
+            request_key (str): The cache key of the request
+            json_codec (Optional[JsonCodec], optional): The JSON codec parsing the response body. Defaults to None (the default codec).
+
+        Returns:
+            T: The formatted response, or the cached response if the server responded with a 304 status
+        """
+        entry = self.backend.get(request_key)
+        if entry is not None:
+            (etag, last_modified, _) = entry
+            if etag:
+                prepared_request.headers[HEADERS.IF_NONE_MATCH.value] = etag
+            if last_modified:
+                prepared_request.headers[
+                    HEADERS.IF_MODIFIED_SINCE.value
+                ] = last_modified
+
+        response = send(prepared_request)
+
+        if response.status_code == NOT_MODIFIED_STATUS_CODE and entry is not None:
+            # Refresh the recency of the entry, and any validator sent along with the 304 response
+            (etag, last_modified, cached_response) = entry
+            self.backend.set(
+                request_key,
+                (
+                    response.headers.get(HEADERS.ETAG.value, etag),
+                    response.headers.get(HEADERS.LAST_MODIFIED.value, last_modified),
+                    cached_response,
+                ),
+            )
+            return cached_response
+
+        formatted_response = formatter.format_response(response, json_codec=json_codec)
+
+        etag = response.headers.get(HEADERS.ETAG.value)
+        last_modified = response.headers.get(HEADERS.LAST_MODIFIED.value)
+        if 200 <= response.status_code < 300 and (etag or last_modified):
+            self.backend.set(request_key, (etag, last_modified, formatted_response))
+
+        return formatted_response
@@ -1,8 +1,6 @@
 import linkedin_api.common.constants as constants
-from linkedin_api.clients.restli.utils.encoder import encode
+from linkedin_api.clients.restli.utils.resource_path import compile_resource_path
 from typing import Dict, Any, Optional
-from linkedin_api.common.errors import InvalidArgumentError
-import re
 
 import sys
 
@@ -64,7 +62,8 @@ def build_rest_url(
           Defaults to None.
 
     Raises:
-        InvalidArgumentError: Error if placeholders in 'resource_path' don't match 'path_keys'
+        InvalidArgumentError: Error if placeholders in 'resource_path' don't match 'path_keys', or if
+          'resource_path' is not a valid template
 
     Returns:
         str: The constructed URL of the API request, not including query parameters
@@ -75,25 +74,7 @@ def build_rest_url(
     else:
         base_url = constants.NON_VERSIONED_BASE_URL
 
-    # Validate resource_path and path_keys
-    num_path_keys = 0 if path_keys is None else len(path_keys.keys())
-    if path_keys:
-        encoded_path_keys = {k: encode(v) for (k, v) in path_keys.items()}
-    else:
-        encoded_path_keys = {}
-
-    placeholders = re.findall(r"{(.*?)}", resource_path)
-
-    if len(placeholders) != num_path_keys:
-        raise InvalidArgumentError(
-            "The number of placeholders in the 'resource_path' argument do not match the number of keys in the 'path_keys' argument"
-        )
-
-    try:
-        resource_path = resource_path.format(**encoded_path_keys)
-    except Exception as error:
-        raise InvalidArgumentError(
-            "The placeholders in the 'resource_path' argument do not match the keys in the 'path_keys' argument"
-        ) from error
+    # The template is parsed once and reused, see `precompile_resource_paths()`
+    resource_path = compile_resource_path(resource_path).expand(path_keys)
 
     return f"{base_url}{resource_path}"
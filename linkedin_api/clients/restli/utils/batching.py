@@ -0,0 +1,111 @@
+from linkedin_api.clients.restli.utils.encoder import encode
+from linkedin_api.clients.restli.response import BatchGetResponse
+from linkedin_api.common.constants import LIST_ITEM_SEP
+from linkedin_api.common.errors import InvalidArgumentError
+from typing import Any, List, Optional, Sequence
+
+DEFAULT_MAX_IDS_PER_BATCH = 100
+
+
+def chunk_ids(
+    ids: Sequence[Any],
+    *,
+    max_ids: int = DEFAULT_MAX_IDS_PER_BATCH,
+    max_encoded_length: Optional[int] = None,
+    base_encoded_length: int = 0
+) -> List[List[Any]]:
+    """
+    Splits a list of entity ids into chunks, preserving their order, such that each chunk has at most
+    `max_ids` ids and the encoded query string of each chunk does not exceed `max_encoded_length`.
+
+    Args:
+        ids (Sequence[Any]): The unencoded entity ids
+        max_ids (int, optional): The maximum number of ids per chunk. Defaults to 100.
+        max_encoded_length (Optional[int], optional): The maximum length of the encoded query string of each chunk. Defaults to None (no limit).
+        base_encoded_length (int, optional): The length of the encoded query string with an empty id list (i.e. with "ids=List()"), which accounts for the other query parameters. Defaults to 0.
+
+    Raises:
+        InvalidArgumentError: Error if `max_ids` is not positive
+
+    Returns:
+        List[List[Any]]: The list of id chunks. An id that exceeds the max encoded length on its own is
+        placed in a chunk by itself.
+    """
+    if max_ids <= 0:
+        raise InvalidArgumentError("The 'max_ids' argument must be positive")
+
+    chunks = []
+    current_chunk = []
+    current_length = base_encoded_length
+
+    for id in ids:
+        encoded_id_length = len(encode(id))
+        added_length = encoded_id_length + (len(LIST_ITEM_SEP) if current_chunk else 0)
+        exceeds_length = (
+            max_encoded_length is not None
+            and current_length + added_length > max_encoded_length
+        )
+
+        if current_chunk and (len(current_chunk) >= max_ids or exceeds_length):
+            chunks.append(current_chunk)
+            current_chunk = []
+            current_length = base_encoded_length
+            added_length = encoded_id_length
+
+        current_chunk.append(id)
+        current_length += added_length
+
+    if current_chunk:
+        chunks.append(current_chunk)
+
+    return chunks
+
+
+def merge_batch_get_responses(responses: List[BatchGetResponse]) -> BatchGetResponse:
+    """
+    Merges the responses of several BATCH_GET requests into a single BatchGetResponse.
+
+    The `results`, `statuses` and `errors` maps are merged. The status code is the first unsuccessful
+    status code of the responses if any, otherwise the status code of the first response. The url,
+    headers and raw response are the ones of the first response.
+
+    Args:
+        responses (List[BatchGetResponse]): The non-empty list of responses to merge
+
+    Returns:
+        BatchGetResponse: The merged response
+    """
+    if not responses:
+        raise InvalidArgumentError("At least one response is required")
+
+    first_response = responses[0]
+    status_code = next(
+        (
+            response.status_code
+            for response in responses
+            if not 200 <= response.status_code < 300
+        ),
+        first_response.status_code,
+    )
+
+    return BatchGetResponse(
+        status_code=status_code,
+        url=first_response.url,
+        headers=first_response.headers,
+        response=first_response.response,
+        results=_merge_maps([response.results for response in responses]),
+        statuses=_merge_maps([response.statuses for response in responses]),
+        errors=_merge_maps([response.errors for response in responses]),
+    )
+
+
+def _merge_maps(maps):
+    # Merge the maps, keeping None if none of the responses contained the map
+    present_maps = [m for m in maps if m is not None]
+    if not present_maps:
+        return None
+
+    merged = {}
+    for m in present_maps:
+        merged.update(m)
+    return merged
@@ -7,9 +7,9 @@ from linkedin_api.common.constants import (
     HEADERS,
 )
 import linkedin_api.clients.restli.utils.api as apiutils
+from linkedin_api.clients.common.json_codec import JsonCodec, resolve_json_codec
 import random
 import string
-import json
 from typing import Optional
 
 MAX_QUERY_STRING_LENGTH = 4000
@@ -69,7 +69,10 @@ def maybe_apply_query_tunneling_requests_with_body(
     original_request_body,
     access_token,
     version_string,
+    json_codec: Optional[JsonCodec] = None,
 ):
+    # The body is serialized once, for both the tunneled and the regular request
+    encoded_request_body = resolve_json_codec(json_codec).dumps(original_request_body)
     original_http_method = RESTLI_METHOD_TO_HTTP_METHOD_MAP[
         original_restli_method.value.upper()
     ]
@@ -78,9 +81,8 @@ def maybe_apply_query_tunneling_requests_with_body(
         encoded_query_param_string
     ):
         boundary = generate_random_string()
-        raw_request_body_string = encoded_query_param_string + json.dumps(
-            original_request_body
-        )
+        request_body_string = encoded_request_body.decode("utf-8")
+        raw_request_body_string = encoded_query_param_string + request_body_string
         while raw_request_body_string.find(boundary) >= 0:
             boundary = generate_random_string()
 
@@ -90,7 +92,7 @@ def maybe_apply_query_tunneling_requests_with_body(
             f"{encoded_query_param_string}\r\n"
             f"--{boundary}\r\n"
             f"{HEADERS.CONTENT_TYPE.value}: {CONTENT_TYPE.JSON.value}\r\n\r\n"
-            f"{json.dumps(original_request_body)}\r\n"
+            f"{request_body_string}\r\n"
             f"--{boundary}--"
         )
 
@@ -99,7 +101,7 @@ def maybe_apply_query_tunneling_requests_with_body(
             url=url,
             data=multipart_request_body,
             headers=apiutils.get_restli_request_headers(
-                content_type=CONTENT_TYPE.MULTIPART_MIXED_WITH_BOUNDARY.value(boundary),
+                content_type=CONTENT_TYPE.MULTIPART_MIXED_WITH_BOUNDARY(boundary),
                 http_method_override=original_http_method,
                 restli_method=original_restli_method,
                 access_token=access_token,
@@ -114,7 +116,7 @@ def maybe_apply_query_tunneling_requests_with_body(
         request = requests.Request(
             method=original_http_method,
             url=final_url,
-            json=original_request_body,
+            data=encoded_request_body,
             headers=apiutils.get_restli_request_headers(
                 restli_method=original_restli_method,
                 access_token=access_token,
@@ -0,0 +1,149 @@
+import threading
+from functools import lru_cache
+from string import Formatter
+from typing import Any, Dict, Iterable, Optional, Tuple
+from linkedin_api.clients.restli.utils.encoder import encode
+from linkedin_api.common.errors import InvalidArgumentError
+
+DEFAULT_MAX_CACHED_TEMPLATES = 1024
+
+
+class ResourcePathTemplate:
+    """
+    A resource path template (e.g. "/adAccounts/{id}" or "/socialActions/{id}/comments/{commentId}"),
+    parsed once into its literal segments and placeholders, so that expanding it with path keys only
+    encodes the path key values and concatenates them with the literal segments.
+    """
+
+    __slots__ = ("template", "literals", "placeholders")
+
+    def __init__(self, template: str):
+        """
+        The constructor for the ResourcePathTemplate class.
+
+        Args:
+            template (str): The resource path template, with curly-brace placeholders for the path keys
+
+        Raises:
+            InvalidArgumentError: Error if the template has unbalanced braces, or a placeholder that is not a plain name (e.g. "{}", "{0}", "{id:x}" or "{id.name}")
+        """
+        literals = []
+        placeholders = []
+        literal = ""
+        try:
+            parsed_template = list(Formatter().parse(template))
+        except ValueError as error:
+            raise InvalidArgumentError(
+                f"The resource path '{template}' is not a valid template: {error}"
+            ) from error
+
+        for (literal_text, field_name, format_spec, conversion) in parsed_template:
+            literal += literal_text
+            if field_name is None:
+                continue
+            if not field_name.isidentifier() or format_spec or conversion is not None:
+                raise InvalidArgumentError(
+                    f"The resource path '{template}' has an invalid placeholder '{{{field_name}}}'"
+                )
+            literals.append(literal)
+            placeholders.append(field_name)
+            literal = ""
+        literals.append(literal)
+
+        self.template = template
+        """
+        The resource path template.
+        """
+
+        self.literals: Tuple[str, ...] = tuple(literals)
+        """
+        The literal segments surrounding the placeholders, one more than the placeholders.
+        """
+
+        self.placeholders: Tuple[str, ...] = tuple(placeholders)
+        """
+        The names of the placeholders, in order.
+        """
+
+    def expand(self, path_keys: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Replaces the placeholders with the encoded values of the path keys.
+
+        Args:
+            path_keys (Optional[Dict[str, Any]], optional): The path key values, keyed by placeholder name. Defaults to None.
+
+        Raises:
+            InvalidArgumentError: Error if the placeholders do not match the keys of `path_keys`
+
+        Returns:
+            str: The resource path
+        """
+        num_path_keys = len(path_keys) if path_keys else 0
+        if len(self.placeholders) != num_path_keys:
+            raise InvalidArgumentError(
+                "The number of placeholders in the 'resource_path' argument do not match the number of keys in the 'path_keys' argument"
+            )
+        if not num_path_keys:
+            return self.literals[0]
+
+        literals = self.literals
+        parts = [literals[0]]
+        for (index, placeholder) in enumerate(self.placeholders, 1):
+            try:
+                value = path_keys[placeholder]
+            except KeyError as error:
+                raise InvalidArgumentError(
+                    "The placeholders in the 'resource_path' argument do not match the keys in the 'path_keys' argument"
+                ) from error
+            parts.append(encode(value))
+            parts.append(literals[index])
+        return "".join(parts)
+
+
+_precompiled_templates: Dict[str, ResourcePathTemplate] = {}
+_precompiled_templates_lock = threading.Lock()
+
+
+@lru_cache(maxsize=DEFAULT_MAX_CACHED_TEMPLATES)
+def _compile_cached(resource_path: str) -> ResourcePathTemplate:
+    return ResourcePathTemplate(resource_path)
+
+
+def compile_resource_path(resource_path: str) -> ResourcePathTemplate:
+    """
+    Returns the compiled template of a resource path. Precompiled templates are always reused, and other
+    templates are compiled on first use and kept in a bounded cache of the most recently used ones, so
+    that resource paths with formatted-in ids do not grow the cache without bound.
+
+    Args:
+        resource_path (str): The resource path template
+
+    Raises:
+        InvalidArgumentError: Error if the template is invalid, see `ResourcePathTemplate`
+
+    Returns:
+        ResourcePathTemplate: The compiled template
+    """
+    template = _precompiled_templates.get(resource_path)
+    if template is not None:
+        return template
+    return _compile_cached(resource_path)
+
+
+def precompile_resource_paths(resource_paths: Iterable[str]) -> None:
+    """
+    Compiles resource path templates ahead of their first use (e.g. at startup), validating them, and
+    keeps them for the lifetime of the process.
+
+    Args:
+        resource_paths (Iterable[str]): The resource path templates (e.g. ["/adAccounts/{id}", "/adAnalytics"])
+
+    Raises:
+        InvalidArgumentError: Error if a template is invalid, in which case no template is registered
+    """
+    templates = {
+        resource_path: ResourcePathTemplate(resource_path)
+        for resource_path in resource_paths
+    }
+    with _precompiled_templates_lock:
+        _precompiled_templates.update(templates)
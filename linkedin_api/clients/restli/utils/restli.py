@@ -1,9 +1,16 @@
 from linkedin_api.clients.restli.utils.encoder import param_encode
 from linkedin_api.clients.restli.utils.decoder import reduced_decode
-from linkedin_api.common.constants import HEADERS
+from linkedin_api.clients.restli.utils.query_tunneling import (
+    maybe_apply_query_tunneling_get_requests,
+    maybe_apply_query_tunneling_requests_with_body,
+)
+import linkedin_api.clients.restli.utils.api as apiutils
+from linkedin_api.clients.common.json_codec import JsonCodec
+from linkedin_api.common.constants import HEADERS, RESTLI_METHODS
 from typing import Dict, Any, Optional
 import copy
-from requests import Response
+import hashlib
+from requests import Response, PreparedRequest
 
 
 def get_created_entity_id(response: Response, decode: bool = False) -> Any:
@@ -64,3 +71,90 @@ def encode_query_params_for_get_requests(query_params: Optional[Dict[str, Any]])
         )
 
     return encoded_query_param_string
+
+
+def prepare_restli_request(
+    *,
+    restli_method: RESTLI_METHODS,
+    resource_path: str,
+    access_token: str,
+    path_keys: Optional[Dict[str, Any]] = None,
+    encoded_query_param_string: Optional[str] = None,
+    request_body: Optional[Any] = None,
+    version_string: Optional[str] = None,
+    json_codec: Optional[JsonCodec] = None,
+) -> PreparedRequest:
+    """
+    Builds the prepared request for a Rest.li call, including the full URL, headers and body. Query
+    tunneling is applied if necessary. This is transport-agnostic, so the same prepared request can be
+    sent by a blocking or an asyncio HTTP client.
+
+    Args:
+        restli_method (RESTLI_METHODS): The Rest.li method of the request
+        resource_path (str): The resource path template string, beginning with a forward slash
+        access_token (str): The access token used to authorize the request
+        path_keys (Optional[Dict[str, Any]], optional): The path keys for the placeholders in the resource path. Defaults to None.
+        encoded_query_param_string (Optional[str], optional): The already encoded query param string. Defaults to None.
+        request_body (Optional[Any], optional): The unencoded request body, if any. Defaults to None.
+        version_string (Optional[str], optional): The API version string, if using versioned APIs. Defaults to None.
+        json_codec (Optional[JsonCodec], optional): The codec serializing the request body. Defaults to the default codec (see `get_default_json_codec()`).
+
+    Returns:
+        PreparedRequest: The prepared request, ready to be sent
+    """
+    url = apiutils.build_rest_url(
+        resource_path=resource_path,
+        path_keys=path_keys,
+        version_string=version_string,
+    )
+
+    if request_body is not None:
+        return maybe_apply_query_tunneling_requests_with_body(
+            encoded_query_param_string=encoded_query_param_string,
+            url=url,
+            original_restli_method=restli_method,
+            original_request_body=request_body,
+            access_token=access_token,
+            version_string=version_string,
+            json_codec=json_codec,
+        )
+    else:
+        return maybe_apply_query_tunneling_get_requests(
+            encoded_query_param_string=encoded_query_param_string,
+            url=url,
+            original_restli_method=restli_method,
+            access_token=access_token,
+            version_string=version_string,
+        )
+
+
+def get_request_key(prepared_request: PreparedRequest) -> str:
+    """
+    Computes a key identifying a prepared Rest.li request, for deduplicating or caching identical
+    requests. The key is derived from the HTTP method, the URL (including the encoded query string),
+    the body (which includes the tunneled query string, if any), the Rest.li method and version headers,
+    and the access token. The access token is only included as a digest.
+
+    Args:
+        prepared_request (PreparedRequest): The prepared request
+
+    Returns:
+        str: The hex digest key of the request
+    """
+    body = prepared_request.body or b""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+
+    digest = hashlib.sha256()
+    for part in [
+        prepared_request.method,
+        prepared_request.url,
+        prepared_request.headers.get(HEADERS.RESTLI_METHOD.value),
+        prepared_request.headers.get(HEADERS.LINKEDIN_VERSION.value),
+        prepared_request.headers.get(HEADERS.AUTHORIZATION.value),
+    ]:
+        digest.update((part or "").encode("utf-8"))
+        digest.update(b"\0")
+    digest.update(body)
+
+    return digest.hexdigest()
@@ -0,0 +1,68 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+
+R = TypeVar("R")
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls that share the same key: while a call for a key is in flight, other
+    callers with the same key wait for it to complete and receive the same result (or exception)
+    instead of making their own call. Once the call completes, the next call for that key is made
+    again. Nothing is cached beyond the duration of the call.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], R]) -> R:
+        """
+        Calls `fn`, unless a call with the same key is already in flight, in which case its result is
+        awaited and returned.
+
+        Args:
+            key (Hashable): The key identifying identical calls
+            fn (Callable[[], R]): The function to call
+
+        Returns:
+            R: The result of the (possibly shared) call
+        """
+        with self.__lock:
+            call = self.__calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _Call()
+                self.__calls[key] = call
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self.__lock:
+                del self.__calls[key]
+            call.done.set()
+
+        return call.result
+
+    def in_flight(self) -> int:
+        """
+        Returns the number of distinct calls currently in flight.
+        """
+        with self.__lock:
+            return len(self.__calls)
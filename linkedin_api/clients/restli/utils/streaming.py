@@ -0,0 +1,180 @@
+import codecs
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator, Tuple
+from linkedin_api.common.errors import ResponseFormattingError
+
+DEFAULT_STREAM_CHUNK_SIZE = 64 * 1024
+
+STREAMED_FIELD = "elements"
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_START = frozenset("-0123456789")
+_NUMBER_DELIMITERS = frozenset(",]} \t\n\r")
+# The consumed prefix of the buffer is discarded once it exceeds this size
+_COMPACTION_THRESHOLD = 64 * 1024
+
+
+class CollectionStreamParser:
+    """
+    An incremental parser of a JSON collection response body (an object with an "elements" array, and
+    fields such as "paging" and "metadata"), fed with the chunks of the body as they are downloaded.
+
+    The elements are yielded one by one as soon as they are parsed, so that only the element being
+    parsed is buffered rather than the whole body. The other top-level fields are stored in `fields` as
+    they are parsed, in the order of the body. Values are parsed with the standard library JSON decoder.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        """
+        The constructor for the CollectionStreamParser class.
+
+        Args:
+            chunks (Iterable[bytes]): The chunks of the UTF-8 encoded body (e.g. `response.iter_content()`)
+        """
+        self.fields: Dict[str, Any] = {}
+        """
+        The top-level fields other than "elements" parsed so far.
+        """
+
+        self.completed = False
+        """
+        Whether the whole body has been parsed.
+        """
+
+        self.__chunks = iter(chunks)
+        self.__text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.__json_decoder = json.JSONDecoder()
+        self.__buffer = ""
+        self.__position = 0
+        self.__exhausted = False
+
+    def iter_elements(self) -> Iterator[Any]:
+        """
+        Parses the body, yielding the elements of the "elements" array as they are parsed.
+
+        Raises:
+            ResponseFormattingError: Error if the body is not a valid JSON object
+
+        Returns:
+            Iterator[Any]: The elements
+        """
+        try:
+            yield from self.__parse()
+        except ValueError as e:
+            raise ResponseFormattingError(
+                f"Invalid collection response body: {e}"
+            ) from e
+
+    def __parse(self) -> Iterator[Any]:
+        self.__expect("{")
+        if self.__peek() == "}":
+            self.__position += 1
+        else:
+            while True:
+                key = self.__decode_value()
+                if not isinstance(key, str):
+                    raise ValueError(f"Expected an object key, got {key!r}")
+                self.__expect(":")
+
+                if key == STREAMED_FIELD and self.__peek() == "[":
+                    self.__position += 1
+                    yield from self.__parse_elements()
+                else:
+                    self.fields[key] = self.__decode_value()
+
+                if self.__peek() == ",":
+                    self.__position += 1
+                    continue
+                self.__expect("}")
+                break
+
+        if self.__peek() != "":
+            raise ValueError("Unexpected data after the response body")
+        self.completed = True
+
+    def __parse_elements(self) -> Iterator[Any]:
+        if self.__peek() == "]":
+            self.__position += 1
+            return
+        while True:
+            yield self.__decode_value()
+            if self.__peek() == ",":
+                self.__position += 1
+                continue
+            self.__expect("]")
+            return
+
+    def __decode_value(self) -> Any:
+        """
+        Decodes the value at the current position. A number might be truncated by the end of the
+        buffer (e.g. "-1500" of "-1500.5"), so unless the body is exhausted, it is only decoded once a
+        delimiter follows it.
+        """
+        first_character = self.__peek()
+        if first_character == "":
+            raise ValueError("Unexpected end of the response body")
+        is_number = first_character in _NUMBER_START
+        while True:
+            try:
+                (value, end) = self.__json_decoder.raw_decode(
+                    self.__buffer, self.__position
+                )
+            except ValueError:
+                if self.__exhausted:
+                    raise
+            else:
+                if (
+                    not is_number
+                    or self.__exhausted
+                    or (
+                        end < len(self.__buffer)
+                        and self.__buffer[end] in _NUMBER_DELIMITERS
+                    )
+                ):
+                    self.__position = end
+                    self.__compact()
+                    return value
+            # Reads at least as much again as the unparsed data, so that a value spanning many chunks
+            # is decoded a logarithmic number of times
+            self.__read(max(1, len(self.__buffer) - self.__position))
+
+    def __peek(self) -> str:
+        """
+        Skips whitespace and returns the next character, or an empty string at the end of the body.
+        """
+        while True:
+            self.__position = _WHITESPACE.match(self.__buffer, self.__position).end()
+            if self.__position < len(self.__buffer):
+                return self.__buffer[self.__position]
+            if self.__exhausted:
+                return ""
+            self.__read(1)
+
+    def __expect(self, character: str) -> None:
+        actual = self.__peek()
+        if actual != character:
+            raise ValueError(
+                f"Expected {character!r} at position {self.__position}, got {actual!r}"
+            )
+        self.__position += 1
+
+    def __read(self, min_length: int) -> None:
+        target_length = len(self.__buffer) + min_length
+        while len(self.__buffer) < target_length and not self.__exhausted:
+            (text, self.__exhausted) = self.__next_text()
+            self.__buffer += text
+
+    def __next_text(self) -> Tuple[str, bool]:
+        for chunk in self.__chunks:
+            text = self.__text_decoder.decode(chunk)
+            if text:
+                return (text, False)
+        return (self.__text_decoder.decode(b"", final=True), True)
+
+    def __compact(self) -> None:
+        if self.__position > _COMPACTION_THRESHOLD and self.__position * 2 > len(
+            self.__buffer
+        ):
+            self.__buffer = self.__buffer[self.__position :]
+            self.__position = 0
@@ -14,6 +14,11 @@ class HEADERS(Enum):
     AUTHORIZATION = "Authorization"
     USER_AGENT = "user-agent"
     CREATED_ENTITY_ID = "x-restli-id"
+    ETAG = "ETag"
+    LAST_MODIFIED = "Last-Modified"
+    IF_NONE_MATCH = "If-None-Match"
+    IF_MODIFIED_SINCE = "If-Modified-Since"
+    RETRY_AFTER = "Retry-After"
 
 
 class CONTENT_TYPE(Enum):
@@ -65,6 +70,27 @@ RESTLI_METHOD_TO_HTTP_METHOD_MAP = {
     "BATCH_DELETE": "DELETE",
 }
 
+# Rest.li methods that only read data, so identical requests can be safely deduplicated or sent again
+READ_ONLY_RESTLI_METHODS = frozenset(
+    [
+        RESTLI_METHODS.GET,
+        RESTLI_METHODS.BATCH_GET,
+        RESTLI_METHODS.GET_ALL,
+        RESTLI_METHODS.FINDER,
+        RESTLI_METHODS.BATCH_FINDER,
+    ]
+)
+
+# Rest.li methods that can be sent again without changing the result beyond that of the first request
+IDEMPOTENT_RESTLI_METHODS = READ_ONLY_RESTLI_METHODS | frozenset(
+    [
+        RESTLI_METHODS.UPDATE,
+        RESTLI_METHODS.BATCH_UPDATE,
+        RESTLI_METHODS.DELETE,
+        RESTLI_METHODS.BATCH_DELETE,
+    ]
+)
+
 # Rest.li special characters
 LIST_PREFIX = "List("
 LIST_SUFFIX = ")"
@@ -12,3 +12,11 @@ class ResponseFormattingError(Exception):
 
 class InvalidSerializedRestliError(Exception):
     """Error raised when an incorrectly serialized Rest.li string is encountered"""
+
+
+class RateLimitExceededError(Exception):
+    """Error raised when a request exceeds the client-side rate limit"""
+
+
+class CircuitOpenError(Exception):
+    """Error raised when a request is rejected because the circuit of its resource is open"""
@@ -0,0 +1,61 @@
+from linkedin_api.clients.common.cache import InMemoryCacheBackend
+from linkedin_api.common.errors import InvalidArgumentError
+import pytest
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_in_memory_cache_backend_ttl():
+    clock = FakeClock()
+    cache = InMemoryCacheBackend(ttl=10, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=20)
+
+    clock.now = 9
+    assert cache.get("a") == 1
+
+    clock.now = 10
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    clock.now = 20
+    assert cache.get("b") is None
+    assert len(cache) == 0
+
+
+def test_in_memory_cache_backend_lru_eviction():
+    cache = InMemoryCacheBackend(max_entries=2, ttl=None)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # Reading "a" makes "b" the least recently used entry
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_in_memory_cache_backend_delete_and_clear():
+    cache = InMemoryCacheBackend()
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", None)
+
+    cache.delete("a")
+    assert cache.get("a") is None
+    assert len(cache) == 1
+
+    cache.clear()
+    assert cache.get("b") is None
+
+
+def test_in_memory_cache_backend_invalid_max_entries():
+    with pytest.raises(InvalidArgumentError):
+        InMemoryCacheBackend(max_entries=0)
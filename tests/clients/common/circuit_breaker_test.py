@@ -0,0 +1,121 @@
+from linkedin_api.clients.common.circuit_breaker import CIRCUIT_STATES, CircuitBreaker
+from linkedin_api.clients.common.rate_limiter import RateLimit, RateLimiter
+from linkedin_api.clients.restli.client import RestliClient
+from linkedin_api.common.constants import NON_VERSIONED_BASE_URL
+from linkedin_api.common.errors import CircuitOpenError
+import pytest
+import responses
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_circuit_breaker_opens_at_failure_rate():
+    breaker = CircuitBreaker(
+        failure_rate_threshold=0.5, minimum_requests=4, window_size=4
+    )
+
+    for status_code in [200, 500, 404, 503]:
+        breaker.before_request("/a")
+        breaker.record("/a", status_code)
+
+    assert breaker.get_state("/a") == CIRCUIT_STATES.OPEN
+    assert breaker.get_state("/b") == CIRCUIT_STATES.CLOSED
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("/a")
+    breaker.before_request("/b")
+
+
+def test_circuit_breaker_half_open():
+    clock = FakeClock()
+    breaker = CircuitBreaker(
+        minimum_requests=1, window_size=1, open_duration=10, clock=clock
+    )
+    breaker.record("/a", None)
+    assert breaker.get_state("/a") == CIRCUIT_STATES.OPEN
+
+    # A failed trial request opens the circuit again
+    clock.now = 10
+    breaker.before_request("/a")
+    assert breaker.get_state("/a") == CIRCUIT_STATES.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("/a")
+    breaker.record("/a", 500)
+    assert breaker.get_state("/a") == CIRCUIT_STATES.OPEN
+
+    # A successful trial request closes it
+    clock.now = 20
+    breaker.before_request("/a")
+    breaker.record("/a", 200)
+    assert breaker.get_state("/a") == CIRCUIT_STATES.CLOSED
+
+
+@responses.activate
+def test_restli_client_circuit_breaker():
+    responses.get(
+        f"{NON_VERSIONED_BASE_URL}/adAnalytics?q=analytics", status=504, json={}
+    )
+    responses.get(f"{NON_VERSIONED_BASE_URL}/me", json={"id": "abc"})
+
+    restli_client = RestliClient(
+        circuit_breaker=CircuitBreaker(minimum_requests=2, window_size=2)
+    )
+    for _ in range(2):
+        response = restli_client.finder(
+            resource_path="/adAnalytics", finder_name="analytics", access_token="ABC123"
+        )
+        assert response.status_code == 504
+
+    with pytest.raises(CircuitOpenError):
+        restli_client.finder(
+            resource_path="/adAnalytics", finder_name="analytics", access_token="ABC123"
+        )
+    assert len(responses.calls) == 2
+
+    response = restli_client.get(resource_path="/me", access_token="ABC123")
+    assert response.entity == {"id": "abc"}
+
+
+def test_circuit_breaker_cancel_request_frees_trial_slot():
+    clock = FakeClock()
+    breaker = CircuitBreaker(
+        minimum_requests=1, window_size=1, open_duration=10, clock=clock
+    )
+    breaker.record("/a", None)
+    clock.now = 10
+    breaker.before_request("/a")
+    breaker.cancel_request("/a")
+
+    breaker.before_request("/a")
+    assert breaker.get_state("/a") == CIRCUIT_STATES.HALF_OPEN
+
+
+@responses.activate
+def test_restli_client_open_circuit_does_not_consume_rate_limit():
+    responses.get(f"{NON_VERSIONED_BASE_URL}/adAccounts/1", status=503, json={})
+    responses.get(f"{NON_VERSIONED_BASE_URL}/me", json={"id": "abc"})
+
+    restli_client = RestliClient(
+        circuit_breaker=CircuitBreaker(minimum_requests=2, window_size=2),
+        rate_limiter=RateLimiter(per_application=RateLimit(3, 3600), blocking=False),
+    )
+    for _ in range(2):
+        restli_client.get(
+            resource_path="/adAccounts/{id}",
+            path_keys={"id": 1},
+            access_token="ABC123",
+        )
+    with pytest.raises(CircuitOpenError):
+        restli_client.get(
+            resource_path="/adAccounts/{id}",
+            path_keys={"id": 1},
+            access_token="ABC123",
+        )
+
+    response = restli_client.get(resource_path="/me", access_token="ABC123")
+    assert response.entity == {"id": "abc"}
@@ -0,0 +1,127 @@
+import asyncio
+import threading
+from linkedin_api.clients.common.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    AimdConcurrencyLimit,
+    AsyncAdaptiveConcurrencyLimiter,
+)
+from linkedin_api.clients.restli.client import RestliClient
+from linkedin_api.common.constants import NON_VERSIONED_BASE_URL
+from linkedin_api.common.errors import InvalidArgumentError
+import pytest
+import responses
+
+
+def test_aimd_concurrency_limit_increase_and_backoff():
+    limit = AimdConcurrencyLimit(initial_limit=2, max_limit=3, latency_tolerance=None)
+
+    # The limit only grows while it is used
+    limit.on_sample(latency=0.1, status_code=200, in_flight=0)
+    assert limit.limit == 2
+
+    # The limit grows by one per window of requests
+    for _ in range(3):
+        limit.on_sample(latency=0.1, status_code=200, in_flight=2)
+    assert limit.limit == 3
+    for _ in range(10):
+        limit.on_sample(latency=0.1, status_code=200, in_flight=3)
+    assert limit.limit == 3
+
+    limit.on_sample(latency=0.1, status_code=429, in_flight=3)
+    assert limit.limit == 1
+    limit.on_sample(latency=0.1, status_code=None, in_flight=1)
+    assert limit.limit == 1
+
+
+def test_aimd_concurrency_limit_latency_gradient():
+    limit = AimdConcurrencyLimit(initial_limit=8, latency_tolerance=2.0)
+
+    limit.on_sample(latency=0.1, status_code=200, in_flight=8)
+    assert limit.limit == 8
+    limit.on_sample(latency=0.3, status_code=200, in_flight=8)
+    assert limit.limit == 4
+    assert limit.baseline_latency == pytest.approx(0.102)
+
+
+def test_aimd_concurrency_limit_baseline_ignores_error_responses():
+    limit = AimdConcurrencyLimit(initial_limit=8, latency_tolerance=2.0)
+
+    limit.on_sample(latency=0.001, status_code=404, in_flight=8)
+    assert limit.baseline_latency is None
+    limit.on_sample(latency=0.1, status_code=200, in_flight=8)
+    limit.on_sample(latency=0.15, status_code=200, in_flight=8)
+    assert limit.limit == 8
+
+
+def test_aimd_concurrency_limit_baseline_decays():
+    limit = AimdConcurrencyLimit(
+        initial_limit=8, max_limit=8, latency_tolerance=2.0, baseline_decay=0.5
+    )
+
+    limit.on_sample(latency=0.1, status_code=200, in_flight=8)
+    # After a lasting latency shift, the baseline catches up and the limit stops decreasing
+    for _ in range(10):
+        limit.on_sample(latency=0.5, status_code=200, in_flight=8)
+    assert limit.baseline_latency > 0.25
+    limit.on_sample(latency=0.5, status_code=200, in_flight=8)
+    limit.on_sample(latency=0.5, status_code=200, in_flight=8)
+    assert limit.limit > 1
+
+
+def test_aimd_concurrency_limit_invalid_arguments():
+    with pytest.raises(InvalidArgumentError):
+        AimdConcurrencyLimit(initial_limit=0)
+    with pytest.raises(InvalidArgumentError):
+        AimdConcurrencyLimit(backoff_ratio=1.5)
+
+
+def test_adaptive_concurrency_limiter_blocks_at_limit():
+    limiter = AdaptiveConcurrencyLimiter(AimdConcurrencyLimit(initial_limit=1))
+    start = limiter.acquire()
+    acquired = threading.Event()
+
+    def acquire():
+        limiter.release(limiter.acquire(), 200)
+        acquired.set()
+
+    thread = threading.Thread(target=acquire)
+    thread.start()
+    assert not acquired.wait(0.05)
+
+    limiter.release(start, 200)
+    thread.join()
+    assert acquired.is_set()
+    assert limiter.in_flight == 0
+
+
+def test_async_adaptive_concurrency_limiter():
+    limiter = AsyncAdaptiveConcurrencyLimiter(
+        AimdConcurrencyLimit(initial_limit=2, max_limit=2)
+    )
+    max_in_flight = 0
+
+    async def send():
+        nonlocal max_in_flight
+        start = await limiter.acquire()
+        max_in_flight = max(max_in_flight, limiter.in_flight)
+        await asyncio.sleep(0.01)
+        await limiter.release(start, 200)
+
+    async def run():
+        await asyncio.gather(*[send() for _ in range(6)])
+
+    asyncio.run(run())
+    assert max_in_flight == 2
+    assert limiter.in_flight == 0
+
+
+@responses.activate
+def test_restli_client_concurrency_limiter():
+    responses.get(f"{NON_VERSIONED_BASE_URL}/me", status=429, json={})
+
+    limiter = AdaptiveConcurrencyLimiter(AimdConcurrencyLimit(initial_limit=4))
+    restli_client = RestliClient(concurrency_limiter=limiter)
+    restli_client.get(resource_path="/me", access_token="ABC123")
+
+    assert limiter.limit.limit == 2
+    assert limiter.in_flight == 0
@@ -0,0 +1,192 @@
+import json
+import pytest
+import requests
+from linkedin_api.clients.common.json_codec import (
+    JsonCodec,
+    OrjsonCodec,
+    StdlibJsonCodec,
+    UjsonCodec,
+    JSON_CODEC_ENV_VAR,
+    get_default_json_codec,
+    get_fastest_json_codec,
+    resolve_json_codec,
+    set_default_json_codec,
+)
+from linkedin_api.clients.restli.utils.query_tunneling import (
+    MAX_QUERY_STRING_LENGTH,
+    maybe_apply_query_tunneling_requests_with_body,
+)
+from linkedin_api.common.constants import RESTLI_METHODS
+from linkedin_api.common.errors import InvalidArgumentError
+
+ENTITY = {
+    "name": "Test Ad Account ü",
+    "reference": "urn:li:organization:123",
+    "ids": [1, 2, 3],
+    "test": True,
+    "budget": None,
+}
+
+
+def create_response(content: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = content
+    return response
+
+
+def get_codecs():
+    codecs = [StdlibJsonCodec()]
+    for codec_class in (OrjsonCodec, UjsonCodec):
+        try:
+            codecs.append(codec_class())
+        except ImportError:
+            pass
+    return codecs
+
+
+@pytest.mark.parametrize("codec", get_codecs(), ids=lambda codec: codec.name)
+def test_round_trip(codec: JsonCodec):
+    encoded = codec.dumps(ENTITY)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == ENTITY
+    assert codec.loads(encoded) == ENTITY
+    assert codec.loads(encoded.decode("utf-8")) == ENTITY
+    assert codec.decode_response(create_response(encoded)) == ENTITY
+
+
+@pytest.mark.parametrize("codec", get_codecs(), ids=lambda codec: codec.name)
+def test_non_string_keys_are_serialized_as_strings(codec: JsonCodec):
+    assert json.loads(codec.dumps({1: "a"})) == {"1": "a"}
+
+
+@pytest.mark.parametrize("codec", get_codecs(), ids=lambda codec: codec.name)
+def test_invalid_json_raises_value_error(codec: JsonCodec):
+    with pytest.raises(ValueError):
+        codec.decode_response(create_response(b""))
+    with pytest.raises(ValueError):
+        codec.loads(b"{")
+
+
+def test_orjson_codec():
+    pytest.importorskip("orjson")
+    assert OrjsonCodec().dumps({"a": [1, 2]}) == b'{"a":[1,2]}'
+
+
+def test_ujson_codec():
+    pytest.importorskip("ujson")
+    assert UjsonCodec().dumps({"url": "https://a/b"}) == b'{"url":"https://a/b"}'
+
+
+def test_default_json_codec_is_cached():
+    codec = get_default_json_codec()
+    assert get_default_json_codec() is codec
+    assert resolve_json_codec(None) is codec
+
+    stdlib_codec = StdlibJsonCodec()
+    assert resolve_json_codec(stdlib_codec) is stdlib_codec
+
+
+@pytest.fixture
+def reset_default_json_codec():
+    set_default_json_codec(None)
+    yield
+    set_default_json_codec(None)
+
+
+def test_default_json_codec_is_stdlib(reset_default_json_codec, monkeypatch):
+    # Even with orjson or ujson installed, a faster codec is only used when requested
+    monkeypatch.delenv(JSON_CODEC_ENV_VAR, raising=False)
+    assert type(get_default_json_codec()) is StdlibJsonCodec
+
+
+@pytest.mark.parametrize(
+    "name,codec_class",
+    [("json", StdlibJsonCodec), ("orjson", OrjsonCodec), ("ujson", UjsonCodec)],
+)
+def test_default_json_codec_from_environment(
+    reset_default_json_codec, monkeypatch, name, codec_class
+):
+    if codec_class is not StdlibJsonCodec:
+        pytest.importorskip(name)
+    monkeypatch.setenv(JSON_CODEC_ENV_VAR, name)
+    assert type(get_default_json_codec()) is codec_class
+
+
+def test_default_json_codec_fastest_from_environment(
+    reset_default_json_codec, monkeypatch
+):
+    monkeypatch.setenv(JSON_CODEC_ENV_VAR, "fastest")
+    assert type(get_default_json_codec()) is type(get_fastest_json_codec())
+
+
+def test_default_json_codec_unknown_in_environment(
+    reset_default_json_codec, monkeypatch
+):
+    monkeypatch.setenv(JSON_CODEC_ENV_VAR, "simplejson")
+    with pytest.raises(InvalidArgumentError, match="simplejson"):
+        get_default_json_codec()
+
+
+def test_set_default_json_codec(reset_default_json_codec, monkeypatch):
+    monkeypatch.setenv(JSON_CODEC_ENV_VAR, "json")
+    codec = RecordingJsonCodec()
+    set_default_json_codec(codec)
+    assert get_default_json_codec() is codec
+    assert resolve_json_codec(None) is codec
+
+    set_default_json_codec(None)
+    assert type(get_default_json_codec()) is StdlibJsonCodec
+
+
+def test_get_fastest_json_codec():
+    codec = get_fastest_json_codec()
+    try:
+        import orjson  # noqa: F401
+
+        assert isinstance(codec, OrjsonCodec)
+    except ImportError:
+        assert isinstance(codec, (UjsonCodec, StdlibJsonCodec))
+
+
+class RecordingJsonCodec(StdlibJsonCodec):
+    def __init__(self):
+        self.dumps_calls = 0
+
+    def dumps(self, obj):
+        self.dumps_calls += 1
+        return b'{"encoded":"by codec"}'
+
+
+def test_request_body_is_encoded_once_with_codec():
+    codec = RecordingJsonCodec()
+    request = maybe_apply_query_tunneling_requests_with_body(
+        encoded_query_param_string="q=search",
+        url="https://api.linkedin.com/rest/adAccounts",
+        original_restli_method=RESTLI_METHODS.CREATE,
+        original_request_body=ENTITY,
+        access_token="ABC123",
+        version_string="202212",
+        json_codec=codec,
+    )
+
+    assert codec.dumps_calls == 1
+    assert request.body == b'{"encoded":"by codec"}'
+    assert request.headers["Content-Type"] == "application/json"
+
+
+def test_tunneled_request_body_is_encoded_once_with_codec():
+    codec = RecordingJsonCodec()
+    request = maybe_apply_query_tunneling_requests_with_body(
+        encoded_query_param_string="ids=" + "a" * MAX_QUERY_STRING_LENGTH,
+        url="https://api.linkedin.com/rest/adAccounts",
+        original_restli_method=RESTLI_METHODS.BATCH_PARTIAL_UPDATE,
+        original_request_body=ENTITY,
+        access_token="ABC123",
+        version_string="202212",
+        json_codec=codec,
+    )
+
+    assert codec.dumps_calls == 1
+    assert request.headers["Content-Type"].startswith("multipart/mixed")
+    assert '{"encoded":"by codec"}\r\n' in request.body
@@ -0,0 +1,169 @@
+from linkedin_api.clients.common.rate_limiter import (
+    InMemoryTokenBucketStore,
+    RateLimit,
+    RateLimiter,
+    SharedFileTokenBucketStore,
+)
+from linkedin_api.clients.restli.client import RestliClient
+from linkedin_api.common.constants import NON_VERSIONED_BASE_URL
+from linkedin_api.common.errors import InvalidArgumentError, RateLimitExceededError
+import multiprocessing
+import pytest
+import responses
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_in_memory_token_bucket_store():
+    store = InMemoryTokenBucketStore()
+    bucket = ("a", RateLimit(2, 1.0))
+
+    assert store.try_acquire([bucket], 0) == 0
+    assert store.try_acquire([bucket], 0) == 0
+    assert store.try_acquire([bucket], 0) == 0.5
+    assert store.try_acquire([bucket], 0.5) == 0
+
+
+def test_in_memory_token_bucket_store_acquires_all_or_none():
+    store = InMemoryTokenBucketStore()
+    bucket_a = ("a", RateLimit(1, 1.0))
+    bucket_b = ("b", RateLimit(10, 1.0))
+
+    assert store.try_acquire([bucket_a], 0) == 0
+    assert store.try_acquire([bucket_a, bucket_b], 0) == 1.0
+    # No token was consumed from the second bucket
+    for _ in range(10):
+        assert store.try_acquire([bucket_b], 0) == 0
+
+
+def test_shared_file_token_bucket_store(tmp_path):
+    path = str(tmp_path / "buckets")
+    bucket = ("a", RateLimit(2, 1.0))
+    # Separate stores on the same file behave like separate processes
+    store_1 = SharedFileTokenBucketStore(path, slots=16)
+    store_2 = SharedFileTokenBucketStore(path, slots=16)
+
+    assert store_1.try_acquire([bucket], 0) == 0
+    assert store_2.try_acquire([bucket], 0) == 0
+    assert store_1.try_acquire([bucket], 0) == 0.5
+    assert store_2.try_acquire([bucket, ("b", RateLimit(1, 1.0))], 0.5) == 0
+    assert store_1.try_acquire([("b", RateLimit(1, 1.0))], 0.5) == 1.0
+
+    store_1.close()
+    store_2.close()
+
+
+def test_shared_file_token_bucket_store_evicts_oldest_bucket(tmp_path):
+    store = SharedFileTokenBucketStore(str(tmp_path / "buckets"), slots=2)
+    rate_limit = RateLimit(1, 60)
+
+    assert store.try_acquire([("a", rate_limit)], 0) == 0
+    assert store.try_acquire([("b", rate_limit)], 1) == 0
+    assert store.try_acquire([("c", rate_limit)], 2) == 0
+    # "a" was evicted, so it starts full again
+    assert store.try_acquire([("a", rate_limit)], 3) == 0
+
+
+def test_shared_file_token_bucket_store_never_shares_a_slot_within_a_request(
+    tmp_path,
+):
+    store = SharedFileTokenBucketStore(str(tmp_path / "buckets"), slots=2)
+    bucket_a = ("a", RateLimit(1, 60))
+    bucket_b = ("b", RateLimit(10, 60))
+
+    assert store.try_acquire([("x", RateLimit(1, 60))], 0) == 0
+    assert store.try_acquire([("y", RateLimit(1, 60))], 1) == 0
+    # Both slots are evicted, one for each bucket of the request
+    assert store.try_acquire([bucket_a, bucket_b], 2) == 0
+    for _ in range(9):
+        assert store.try_acquire([bucket_b], 2) == 0
+    assert store.try_acquire([bucket_b], 2) > 0
+    assert store.try_acquire([bucket_a], 2) > 0
+
+    # With fewer slots than buckets, the acquisition fails instead of mixing up the buckets
+    with pytest.raises(InvalidArgumentError, match="fewer than the buckets"):
+        store.try_acquire([("c", RateLimit(1, 60)), bucket_a, bucket_b], 3)
+    single_slot_store = SharedFileTokenBucketStore(str(tmp_path / "single"), slots=1)
+    with pytest.raises(InvalidArgumentError):
+        single_slot_store.try_acquire([bucket_a, bucket_b], 0)
+    # The store is still usable
+    assert single_slot_store.try_acquire([bucket_b], 0) == 0
+
+    store.close()
+    single_slot_store.close()
+
+
+def acquire_shared_tokens(path):
+    store = SharedFileTokenBucketStore(path, slots=16)
+    return sum(
+        store.try_acquire([("a", RateLimit(20, 3600))], 0) == 0 for _ in range(10)
+    )
+
+
+def test_shared_file_token_bucket_store_across_processes(tmp_path):
+    path = str(tmp_path / "buckets")
+    with multiprocessing.get_context("fork").Pool(4) as pool:
+        acquired = pool.map(acquire_shared_tokens, [path] * 4)
+
+    assert sum(acquired) == 20
+
+
+def test_rate_limiter_scopes():
+    clock = FakeClock()
+    rate_limiter = RateLimiter(
+        per_access_token=RateLimit(1, 60), blocking=False, clock=clock
+    )
+
+    rate_limiter.acquire(access_token="A", resource_path="/me")
+    rate_limiter.acquire(access_token="B", resource_path="/me")
+    assert not rate_limiter.try_acquire(access_token="A", resource_path="/people")
+    with pytest.raises(RateLimitExceededError):
+        rate_limiter.acquire(access_token="B", resource_path="/me")
+
+
+def test_rate_limiter_blocking():
+    clock = FakeClock()
+    rate_limiter = RateLimiter(
+        per_resource_path=RateLimit(10, 1.0, burst=1),
+        max_wait=1.0,
+        sleep=clock.sleep,
+        clock=clock,
+    )
+
+    for _ in range(3):
+        rate_limiter.acquire(access_token="A", resource_path="/me")
+    assert clock.now == pytest.approx(0.2)
+
+    rate_limiter.per_resource_path = RateLimit(1, 10.0)
+    rate_limiter.acquire(access_token="A", resource_path="/people")
+    with pytest.raises(RateLimitExceededError):
+        rate_limiter.acquire(access_token="A", resource_path="/people")
+
+
+@responses.activate
+def test_restli_client_rate_limiter():
+    responses.get(f"{NON_VERSIONED_BASE_URL}/me", json={"id": "abc"})
+
+    clock = FakeClock()
+    restli_client = RestliClient(
+        rate_limiter=RateLimiter(
+            per_application=RateLimit(2, 1.0, burst=1),
+            sleep=clock.sleep,
+            clock=clock,
+        )
+    )
+    for _ in range(3):
+        response = restli_client.get(resource_path="/me", access_token="ABC123")
+        assert response.entity == {"id": "abc"}
+
+    assert len(responses.calls) == 3
+    assert clock.now == pytest.approx(1.0)
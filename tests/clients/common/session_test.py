@@ -0,0 +1,96 @@
+import pickle
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from linkedin_api.clients.auth.client import AuthClient
+from linkedin_api.clients.common.session import (
+    PooledHTTPAdapter,
+    SessionConfig,
+    create_session,
+    get_pool_stats,
+)
+from linkedin_api.clients.restli.client import RestliClient
+from requests.adapters import HTTPAdapter
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_create_session_pool_settings():
+    session = create_session(
+        SessionConfig(pool_maxsize=64, pool_block=True, tcp_keepalive=True)
+    )
+    adapter = session.get_adapter("https://api.linkedin.com")
+
+    assert isinstance(adapter, PooledHTTPAdapter)
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 64
+    assert adapter.poolmanager.connection_pool_kw["block"] is True
+    assert (
+        socket.SOL_SOCKET,
+        socket.SO_KEEPALIVE,
+        1,
+    ) in adapter.poolmanager.connection_pool_kw["socket_options"]
+
+    # Adapters can still be pickled, e.g. to be sent to another process
+    assert pickle.loads(pickle.dumps(adapter)).session_config.pool_maxsize == 64
+
+
+def test_pooled_http_adapter_default_timeout(monkeypatch):
+    timeouts = []
+    monkeypatch.setattr(
+        HTTPAdapter,
+        "send",
+        lambda self, request, timeout=None, **kwargs: timeouts.append(timeout),
+    )
+    adapter = PooledHTTPAdapter(SessionConfig(connect_timeout=3, read_timeout=30))
+
+    adapter.send(None)
+    adapter.send(None, timeout=5)
+    assert timeouts == [(3, 30), 5]
+    assert PooledHTTPAdapter(SessionConfig()).session_config.timeout is None
+
+
+def test_pool_stats():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_port}/me"
+
+    session = create_session()
+    try:
+        for _ in range(3):
+            session.get(url)
+        stats = get_pool_stats(session)[f"http://127.0.0.1:{server.server_port}"]
+        assert stats["num_connections"] == 1
+        assert stats["num_requests"] == 3
+        assert stats["idle_connections"] == 1
+        assert stats["maxsize"] == 10
+    finally:
+        session.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_clients_session_config():
+    config = SessionConfig(pool_maxsize=32, read_timeout=10)
+
+    restli_client = RestliClient(session_config=config)
+    auth_client = AuthClient("id", "secret", session_config=config)
+
+    for session in [restli_client.session, auth_client.session]:
+        adapter = session.get_adapter("https://api.linkedin.com")
+        assert adapter.session_config is config
+    assert restli_client.get_pool_stats() == {}
@@ -0,0 +1,236 @@
+import asyncio
+from urllib.parse import urlsplit
+from linkedin_api.clients.common.transport import AiohttpTransport
+from linkedin_api.clients.restli.response_formatter import BatchGetResponseFormatter
+from linkedin_api.clients.restli.utils.restli import (
+    encode_query_params_for_get_requests,
+    prepare_restli_request,
+)
+from linkedin_api.common.constants import RESTLI_METHODS
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+ACCESS_TOKEN = "ABC123"
+
+
+def create_app(received_requests):
+    async def echo(request):
+        received_requests.append(
+            {
+                "method": request.method,
+                "path_qs": request.path_qs,
+                "headers": dict(request.headers),
+                "body": await request.read(),
+            }
+        )
+        return web.json_response(
+            {"results": {"1": {"name": "A"}}, "statuses": {}, "errors": {}},
+            headers={"X-RestLi-Protocol-Version": "2.0.0"},
+        )
+
+    async def not_found(request):
+        return web.Response(
+            status=404,
+            reason="Not Found",
+            text='{"message": "Nope"}',
+            content_type="application/json",
+            charset="utf-8",
+        )
+
+    async def slow(request):
+        await asyncio.sleep(1)
+        return web.json_response({})
+
+    app = web.Application()
+    app.router.add_route("*", "/{prefix}/testResource", echo)
+    app.router.add_get("/{prefix}/missing", not_found)
+    app.router.add_get("/{prefix}/slow", slow)
+    return app
+
+
+def to_local_url(server, url):
+    parts = urlsplit(url)
+    path_qs = f"{parts.path}?{parts.query}" if parts.query else parts.path
+    return str(server.make_url(path_qs))
+
+
+def run_with_server(test):
+    async def run():
+        received_requests = []
+        server = TestServer(create_app(received_requests))
+        await server.start_server()
+        try:
+            return await test(server, received_requests)
+        finally:
+            await server.close()
+
+    return asyncio.run(run())
+
+
+def test_send_tunneled_request_body_and_headers():
+    ids = [f"urn:li:sponsoredAccount:{id}" for id in range(400)]
+    received = []
+
+    async def test(server, received_requests):
+        prepared_request = prepare_restli_request(
+            restli_method=RESTLI_METHODS.BATCH_GET,
+            resource_path="/testResource",
+            access_token=ACCESS_TOKEN,
+            encoded_query_param_string=encode_query_params_for_get_requests(
+                {"ids": ids}
+            ),
+            version_string="202302",
+        )
+        prepared_request.url = to_local_url(server, prepared_request.url)
+        transport = AiohttpTransport()
+        try:
+            await transport.send(prepared_request)
+        finally:
+            await transport.close()
+        received.extend(received_requests)
+        return prepared_request
+
+    prepared_request = run_with_server(test)
+
+    [request] = received
+    assert request["method"] == "POST"
+    assert request["path_qs"] == "/rest/testResource"
+    assert request["headers"]["X-HTTP-Method-Override"] == "GET"
+    assert request["headers"]["X-RestLi-Method"] == "BATCH_GET"
+    assert request["headers"]["LinkedIn-Version"] == "202302"
+    assert request["headers"]["Authorization"] == f"Bearer {ACCESS_TOKEN}"
+    assert (
+        request["headers"]["Content-Type"] == prepared_request.headers["Content-Type"]
+    )
+    # The tunneled query string is sent as the body, with its content length recomputed
+    expected_body = (
+        prepared_request.body.encode("utf-8")
+        if isinstance(prepared_request.body, str)
+        else prepared_request.body
+    )
+    assert request["body"] == expected_body
+    assert int(request["headers"]["Content-Length"]) == len(expected_body)
+
+
+def test_send_request_with_non_ascii_body():
+    received = []
+
+    async def test(server, received_requests):
+        prepared_request = prepare_restli_request(
+            restli_method=RESTLI_METHODS.CREATE,
+            resource_path="/testResource",
+            access_token=ACCESS_TOKEN,
+            request_body={"name": "Café ☕"},
+        )
+        prepared_request.url = to_local_url(server, prepared_request.url)
+        prepared_request.body = '{"name": "Café ☕"}'
+        transport = AiohttpTransport()
+        try:
+            await transport.send(prepared_request)
+        finally:
+            await transport.close()
+        received.extend(received_requests)
+
+    run_with_server(test)
+
+    [request] = received
+    assert request["body"] == '{"name": "Café ☕"}'.encode("utf-8")
+    assert int(request["headers"]["Content-Length"]) == len(request["body"])
+
+
+def test_send_converts_response():
+    async def test(server, received_requests):
+        prepared_request = prepare_restli_request(
+            restli_method=RESTLI_METHODS.BATCH_GET,
+            resource_path="/testResource",
+            access_token=ACCESS_TOKEN,
+            encoded_query_param_string="ids=List(1)",
+        )
+        prepared_request.url = to_local_url(server, prepared_request.url)
+        missing_request = prepare_restli_request(
+            restli_method=RESTLI_METHODS.GET,
+            resource_path="/missing",
+            access_token=ACCESS_TOKEN,
+        )
+        missing_request.url = to_local_url(server, missing_request.url)
+
+        transport = AiohttpTransport()
+        try:
+            return (
+                prepared_request,
+                await transport.send(prepared_request),
+                await transport.send(missing_request),
+            )
+        finally:
+            await transport.close()
+
+    (prepared_request, response, missing_response) = run_with_server(test)
+
+    assert response.status_code == 200
+    assert response.ok
+    assert response.request is prepared_request
+    assert response.url == prepared_request.url
+    assert response.headers["content-type"] == "application/json; charset=utf-8"
+    assert response.headers["x-restli-protocol-version"] == "2.0.0"
+    assert response.encoding == "utf-8"
+    assert BatchGetResponseFormatter.format_response(response).results == {
+        "1": {"name": "A"}
+    }
+
+    assert missing_response.status_code == 404
+    assert missing_response.reason == "Not Found"
+    assert missing_response.json() == {"message": "Nope"}
+
+
+def test_send_timeout():
+    async def test(server, received_requests):
+        prepared_request = prepare_restli_request(
+            restli_method=RESTLI_METHODS.GET,
+            resource_path="/slow",
+            access_token=ACCESS_TOKEN,
+        )
+        prepared_request.url = to_local_url(server, prepared_request.url)
+        transport = AiohttpTransport(timeout=0.05)
+        try:
+            with pytest.raises(asyncio.TimeoutError):
+                await transport.send(prepared_request)
+        finally:
+            await transport.close()
+
+    run_with_server(test)
+
+
+def test_close_session():
+    async def test(server, received_requests):
+        prepared_request = prepare_restli_request(
+            restli_method=RESTLI_METHODS.BATCH_GET,
+            resource_path="/testResource",
+            access_token=ACCESS_TOKEN,
+            encoded_query_param_string="ids=List(1)",
+        )
+        prepared_request.url = to_local_url(server, prepared_request.url)
+        transport = AiohttpTransport(limit=5, limit_per_host=2)
+
+        await transport.send(prepared_request)
+        session = transport._session
+        assert not session.closed
+        assert session.connector.limit == 5
+        assert session.connector.limit_per_host == 2
+
+        await transport.close()
+        assert session.closed
+        assert transport._session is None
+        # Closing twice is a no-op
+        await transport.close()
+
+        # A new session is created for requests sent after closing
+        response = await transport.send(prepared_request)
+        assert response.status_code == 200
+        assert transport._session is not session
+        await transport.close()
+        return len(received_requests)
+
+    assert run_with_server(test) == 2
@@ -0,0 +1,149 @@
+import asyncio
+import json
+from linkedin_api.clients.restli.async_client import AsyncRestliClient
+from linkedin_api.clients.common.transport import AsyncTransport, to_requests_response
+from linkedin_api.common.constants import NON_VERSIONED_BASE_URL, RESTLI_METHODS
+import pytest
+
+ACCESS_TOKEN = "ABC123"
+
+
+class FakeTransport(AsyncTransport):
+    """
+    Records the prepared requests and replies with a canned json response after yielding to the
+    event loop, so that concurrently issued requests overlap.
+    """
+
+    def __init__(self, json_body, status_code=200, headers=None):
+        self.json_body = json_body
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.closed = False
+
+    async def send(self, prepared_request):
+        self.requests.append(prepared_request)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return to_requests_response(
+            prepared_request=prepared_request,
+            status_code=self.status_code,
+            url=prepared_request.url,
+            headers={"Content-Type": "application/json", **self.headers},
+            content=json.dumps(self.json_body).encode("utf-8"),
+        )
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.parametrize(
+    "restli_method,request_args,response_json,expected_method,expected_url,expected_properties",
+    [
+        (
+            RESTLI_METHODS.GET,
+            {"resource_path": "/adAccounts/{id}", "path_keys": {"id": 123}},
+            {"name": "TestAdAccount"},
+            "GET",
+            "/adAccounts/123",
+            {"entity": {"name": "TestAdAccount"}},
+        ),
+        (
+            RESTLI_METHODS.BATCH_GET,
+            {"resource_path": "/testResource", "ids": [123, 456]},
+            {"results": {"123": {"name": "A"}, "456": {"name": "B"}}},
+            "GET",
+            "/testResource?ids=List(123,456)",
+            {"results": {"123": {"name": "A"}, "456": {"name": "B"}}},
+        ),
+        (
+            RESTLI_METHODS.FINDER,
+            {
+                "resource_path": "/testResource",
+                "finder_name": "search",
+                "query_params": {"start": 0, "count": 2},
+            },
+            {"elements": [{"name": "A"}], "paging": {"start": 0, "total": 1}},
+            "GET",
+            "/testResource?count=2&q=search&start=0",
+            {"elements": [{"name": "A"}]},
+        ),
+        (
+            RESTLI_METHODS.BATCH_UPDATE,
+            {
+                "resource_path": "/testResource",
+                "ids": [123],
+                "entities": [{"name": "A"}],
+            },
+            {"results": {"123": {"status": 204}}},
+            "PUT",
+            "/testResource?ids=List(123)",
+            {},
+        ),
+        (
+            RESTLI_METHODS.ACTION,
+            {
+                "resource_path": "/testResource",
+                "action_name": "doSomething",
+                "action_params": {"param1": 123},
+            },
+            {"value": {"result": "done"}},
+            "POST",
+            "/testResource?action=doSomething",
+            {"value": {"result": "done"}},
+        ),
+    ],
+)
+def test_async_restli_client(
+    restli_method,
+    request_args,
+    response_json,
+    expected_method,
+    expected_url,
+    expected_properties,
+):
+    transport = FakeTransport(response_json)
+    client = AsyncRestliClient(transport=transport)
+
+    response = asyncio.run(
+        getattr(client, restli_method.value.lower())(
+            access_token=ACCESS_TOKEN, **request_args
+        )
+    )
+
+    assert len(transport.requests) == 1
+    sent_request = transport.requests[0]
+    assert sent_request.method == expected_method
+    assert sent_request.url == NON_VERSIONED_BASE_URL + expected_url
+    assert sent_request.headers["X-RestLi-Method"] == restli_method.value
+    assert sent_request.headers["Authorization"] == f"Bearer {ACCESS_TOKEN}"
+    assert response.status_code == 200
+    for (key, value) in expected_properties.items():
+        assert getattr(response, key) == value
+
+
+def test_async_restli_client_concurrent_requests():
+    transport = FakeTransport({"name": "TestAdAccount"})
+
+    async def run():
+        async with AsyncRestliClient(transport=transport) as client:
+            return await asyncio.gather(
+                *[
+                    client.get(
+                        resource_path="/adAccounts/{id}",
+                        path_keys={"id": i},
+                        access_token=ACCESS_TOKEN,
+                    )
+                    for i in range(50)
+                ]
+            )
+
+    responses = asyncio.run(run())
+
+    assert len(responses) == 50
+    assert transport.max_in_flight == 50
+    assert transport.closed
@@ -884,4 +884,12 @@ def test_restliclient(
 
 
 def to_dict(obj):
-    return json.loads(json.dumps(obj, default=lambda o: o.__dict__))
+    return json.loads(json.dumps(obj, default=slots_to_dict))
+
+
+def slots_to_dict(obj):
+    return {
+        name: getattr(obj, name)
+        for cls in type(obj).__mro__
+        for name in getattr(cls, "__slots__", ())
+    }
@@ -0,0 +1,167 @@
+import json
+from array import array
+import pytest
+import requests
+import responses
+from linkedin_api.clients.common.cache import InMemoryCacheBackend
+from linkedin_api.clients.restli.client import RestliClient
+from linkedin_api.clients.restli.columnar import build_columns, parse_field_path
+from linkedin_api.clients.restli.response import ColumnarCollectionResponse
+from linkedin_api.clients.restli.response_formatter import (
+    ColumnarCollectionResponseFormatter,
+)
+from linkedin_api.common.constants import NON_VERSIONED_BASE_URL
+from linkedin_api.common.errors import InvalidArgumentError, ResponseFormattingError
+
+ACCESS_TOKEN = "ABC123"
+URL = f"{NON_VERSIONED_BASE_URL}/adAnalytics"
+
+ELEMENTS = [
+    {
+        "pivotValues": [f"urn:li:sponsoredCampaign:{id % 3}"],
+        "dateRange": {"start": {"day": id + 1, "month": 1, "year": 2023}},
+        "impressions": id * 100,
+        "clicks": id,
+        "costInLocalCurrency": f"{id}.5",
+    }
+    for id in range(10)
+]
+COLUMNS = [
+    "impressions",
+    "pivotValues.0",
+    "dateRange.start.day",
+    "costInLocalCurrency",
+]
+BODY = {"elements": ELEMENTS, "paging": {"start": 0, "count": 10, "total": 10}}
+
+
+def test_build_columns():
+    element_columns = build_columns(iter(ELEMENTS), COLUMNS)
+
+    assert len(element_columns) == 10
+    assert element_columns["impressions"] == array("q", range(0, 1000, 100))
+    assert element_columns["dateRange.start.day"] == array("q", range(1, 11))
+    assert element_columns["pivotValues.0"][:3] == [
+        "urn:li:sponsoredCampaign:0",
+        "urn:li:sponsoredCampaign:1",
+        "urn:li:sponsoredCampaign:2",
+    ]
+    # Repeated strings are stored once
+    assert element_columns["pivotValues.0"][0] is element_columns["pivotValues.0"][3]
+    assert "clicks" not in element_columns
+    assert next(element_columns.iter_rows()) == (
+        0,
+        "urn:li:sponsoredCampaign:0",
+        1,
+        "0.5",
+    )
+
+
+@pytest.mark.parametrize(
+    "values,expected_column",
+    [
+        ([1, 2, 3], array("q", [1, 2, 3])),
+        ([1, 2.5, 3], array("d", [1.0, 2.5, 3.0])),
+        ([], array("q")),
+        ([1, None, 3], [1, None, 3]),
+        ([1.5, "a"], [1.5, "a"]),
+        ([1, True], [1, True]),
+        ([1, 2**64], [1, 2**64]),
+        ([{"a": 1}], [{"a": 1}]),
+    ],
+)
+def test_column_types(values, expected_column):
+    element_columns = build_columns([{"value": value} for value in values], ["value"])
+
+    column = element_columns["value"]
+    assert type(column) is type(expected_column)
+    assert column == expected_column
+
+
+def test_field_paths():
+    elements = [{"a": {"b": [{"c": 1}]}, "d": {"0": 5}}, {"a": []}, "not an object"]
+
+    element_columns = build_columns(elements, ["a.b.0.c", "a.b.1.c", "d.0"])
+
+    assert element_columns["a.b.0.c"] == [1, None, None]
+    assert element_columns["a.b.1.c"] == [None, None, None]
+    assert element_columns["d.0"] == [5, None, None]
+    assert parse_field_path("pivotValues.0") == ("pivotValues", 0)
+
+
+@pytest.mark.parametrize(
+    "field_paths", [[], "impressions", [""], ["a..b"], ["a", "a"], [1]]
+)
+def test_invalid_field_paths(field_paths):
+    with pytest.raises(InvalidArgumentError):
+        build_columns([], field_paths)
+
+
+def create_response(body, status_code=200):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(body).encode()
+    return response
+
+
+def test_format_response():
+    response = ColumnarCollectionResponseFormatter.format_response(
+        create_response(BODY), columns=["clicks"]
+    )
+
+    assert isinstance(response, ColumnarCollectionResponse)
+    assert response.columns["clicks"] == array("q", range(10))
+    assert response.paging.total == 10
+    assert response.metadata is None
+
+
+def test_format_error_response():
+    response = ColumnarCollectionResponseFormatter.format_response(
+        create_response({"status": 400, "message": "Bad request"}, 400),
+        columns=["clicks"],
+    )
+
+    assert len(response.columns) == 0
+    assert response.paging.total is None
+
+    response = ColumnarCollectionResponseFormatter.format_response(
+        requests.Response(), columns=["clicks"]
+    )
+    with pytest.raises(ResponseFormattingError):
+        response.columns
+
+
+@pytest.mark.parametrize("stream", [False, True])
+@responses.activate
+def test_finder_columns(stream):
+    responses.get(URL, body=json.dumps(BODY))
+    restli_client = RestliClient(response_cache=InMemoryCacheBackend())
+
+    for _ in range(2):
+        response = restli_client.finder(
+            resource_path="/adAnalytics",
+            finder_name="analytics",
+            access_token=ACCESS_TOKEN,
+            columns=COLUMNS,
+            stream=stream,
+        )
+        assert isinstance(response, ColumnarCollectionResponse)
+        assert response.columns.field_paths == COLUMNS
+        assert list(response.columns["impressions"]) == [
+            element["impressions"] for element in ELEMENTS
+        ]
+        assert response.paging.count == 10
+
+    # Columnar responses are not cached
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_invalid_columns_are_rejected_before_sending():
+    restli_client = RestliClient()
+
+    with pytest.raises(InvalidArgumentError):
+        restli_client.get_all(
+            resource_path="/adAnalytics", access_token=ACCESS_TOKEN, columns=[]
+        )
+    assert len(responses.calls) == 0
@@ -0,0 +1,100 @@
+from linkedin_api.clients.restli.client import RestliClient
+from linkedin_api.clients.restli.entity_cache import EntityCache
+from linkedin_api.clients.restli.utils.decoder import decode
+from linkedin_api.common.constants import NON_VERSIONED_BASE_URL
+import json
+import responses
+from urllib.parse import urlparse, parse_qs
+
+ACCESS_TOKEN = "ABC123"
+
+
+def add_batch_get_callback(requested_ids):
+    # Entities with an id greater than 100 do not exist
+    def request_callback(request):
+        ids = [
+            int(id) for id in decode(parse_qs(urlparse(request.url).query)["ids"][0])
+        ]
+        requested_ids.append(ids)
+        body = {
+            "results": {str(id): {"id": id} for id in ids if id <= 100},
+            "statuses": {str(id): 200 if id <= 100 else 404 for id in ids},
+            "errors": {
+                str(id): {"status": 404, "message": "Not found"}
+                for id in ids
+                if id > 100
+            },
+        }
+        return (200, {}, json.dumps(body))
+
+    responses.add_callback(
+        responses.GET, f"{NON_VERSIONED_BASE_URL}/adCampaigns", request_callback
+    )
+
+
+@responses.activate
+def test_entity_cache_partial_hits():
+    requested_ids = []
+    add_batch_get_callback(requested_ids)
+    restli_client = RestliClient(entity_cache=EntityCache())
+
+    def batch_get(ids, access_token=ACCESS_TOKEN):
+        return restli_client.batch_get(
+            resource_path="/adCampaigns",
+            ids=ids,
+            query_params={"fields": "id"},
+            access_token=access_token,
+        )
+
+    batch_get([1, 2, 101])
+    response = batch_get([1, 2, 3, 101])
+
+    assert requested_ids == [[1, 2, 101], [3]]
+    assert response.status_code == 200
+    assert response.results == {"1": {"id": 1}, "2": {"id": 2}, "3": {"id": 3}}
+    assert response.statuses == {"1": 200, "2": 200, "3": 200, "101": 404}
+    assert response.errors == {"101": {"status": 404, "message": "Not found"}}
+
+    # Fully cached requests are not sent
+    response = batch_get([3, 2, 1])
+    assert len(requested_ids) == 2
+    assert response.response is None
+    assert response.results == {"1": {"id": 1}, "2": {"id": 2}, "3": {"id": 3}}
+
+    # Entities are cached per access token
+    batch_get([1], access_token="XYZ")
+    assert requested_ids[-1] == [1]
+
+
+@responses.activate
+def test_entity_cache_skips_failed_requests():
+    responses.get(
+        f"{NON_VERSIONED_BASE_URL}/adCampaigns",
+        json={"status": 401, "message": "Unauthorized"},
+        status=401,
+    )
+    entity_cache = EntityCache()
+    restli_client = RestliClient(entity_cache=entity_cache)
+
+    for _ in range(2):
+        response = restli_client.batch_get(
+            resource_path="/adCampaigns", ids=[1], access_token=ACCESS_TOKEN
+        )
+        assert response.status_code == 401
+
+    assert len(responses.calls) == 2
+    assert len(entity_cache.backend) == 0
+
+
+@responses.activate
+def test_entity_cache_without_negative_caching():
+    requested_ids = []
+    add_batch_get_callback(requested_ids)
+    restli_client = RestliClient(entity_cache=EntityCache(negative_ttl=None))
+
+    for _ in range(2):
+        restli_client.batch_get(
+            resource_path="/adCampaigns", ids=[1, 101], access_token=ACCESS_TOKEN
+        )
+
+    assert requested_ids == [[1, 101], [101]]
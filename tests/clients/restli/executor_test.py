@@ -0,0 +1,126 @@
+import threading
+from linkedin_api.clients.restli.client import RestliClient
+from linkedin_api.clients.restli.executor import RestliRequest, execute_many
+from linkedin_api.common.constants import NON_VERSIONED_BASE_URL, RESTLI_METHODS
+from linkedin_api.common.errors import InvalidArgumentError
+import pytest
+import requests
+import responses
+
+ACCESS_TOKEN = "ABC123"
+
+
+@responses.activate
+def test_execute_many_returns_results_in_order():
+    for id in range(5):
+        responses.get(f"{NON_VERSIONED_BASE_URL}/adAccounts/{id}", json={"id": id})
+    responses.post(
+        f"{NON_VERSIONED_BASE_URL}/adCampaigns",
+        status=201,
+        headers={"x-restli-id": "7"},
+    )
+
+    restli_requests = [
+        RestliRequest(
+            RESTLI_METHODS.GET,
+            resource_path="/adAccounts/{id}",
+            path_keys={"id": id},
+            access_token=ACCESS_TOKEN,
+        )
+        for id in range(5)
+    ]
+    restli_requests.append(
+        RestliRequest(
+            RESTLI_METHODS.CREATE,
+            resource_path="/adCampaigns",
+            entity={"name": "A"},
+            access_token=ACCESS_TOKEN,
+        )
+    )
+    results = list(RestliClient().execute_many(restli_requests, max_workers=3))
+
+    assert [result.index for result in results] == list(range(6))
+    assert [result.response.entity for result in results[:5]] == [
+        {"id": id} for id in range(5)
+    ]
+    assert results[5].response.entity_id == "7"
+    assert all(result.ok for result in results)
+
+
+@responses.activate
+def test_execute_many_captures_errors():
+    responses.get(f"{NON_VERSIONED_BASE_URL}/me", json={"id": "abc"})
+    responses.get(
+        f"{NON_VERSIONED_BASE_URL}/adAccounts/1",
+        body=requests.exceptions.ConnectionError("Connection refused"),
+    )
+
+    results = list(
+        RestliClient().execute_many(
+            [
+                RestliRequest(
+                    RESTLI_METHODS.GET,
+                    resource_path="/adAccounts/{id}",
+                    path_keys={"id": 1},
+                    access_token=ACCESS_TOKEN,
+                ),
+                RestliRequest(
+                    RESTLI_METHODS.GET, resource_path="/me", access_token=ACCESS_TOKEN
+                ),
+            ]
+        )
+    )
+
+    assert not results[0].ok
+    assert isinstance(results[0].error, requests.exceptions.ConnectionError)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        results[0].get_response()
+    assert results[1].get_response().entity == {"id": "abc"}
+
+
+def test_execute_many_as_completed():
+    release_first = threading.Event()
+
+    def send(request):
+        if request.kwargs["id"] == 0:
+            release_first.wait(1)
+        return request.kwargs["id"]
+
+    results = execute_many(
+        send,
+        [RestliRequest(RESTLI_METHODS.GET, id=id) for id in range(3)],
+        max_workers=3,
+        ordered=False,
+    )
+    indexes = [next(results).index, next(results).index]
+    release_first.set()
+    indexes.append(next(results).index)
+
+    assert sorted(indexes[:2]) == [1, 2]
+    assert indexes[2] == 0
+
+
+def test_execute_many_bounds_concurrency():
+    lock = threading.Lock()
+    in_flight = []
+    max_in_flight = []
+
+    def send(request):
+        with lock:
+            in_flight.append(request)
+            max_in_flight.append(len(in_flight))
+        threading.Event().wait(0.01)
+        with lock:
+            in_flight.remove(request)
+
+    list(
+        execute_many(
+            send, [RestliRequest(RESTLI_METHODS.GET) for _ in range(10)], max_workers=2
+        )
+    )
+    assert max(max_in_flight) <= 2
+
+
+def test_restli_request_invalid_method():
+    with pytest.raises(InvalidArgumentError):
+        RestliRequest("GET", resource_path="/me")
@@ -0,0 +1,155 @@
+import gzip
+import io
+import json
+from linkedin_api.clients.restli.export import export_ndjson
+from linkedin_api.clients.restli.paginator import Paginator
+from linkedin_api.clients.restli.response import CollectionResponse, Paging
+from linkedin_api.common.errors import InvalidArgumentError
+import pytest
+
+
+def fake_collection(total, fail_at=None):
+    """
+    Returns a fetch_page function over a collection of {"id": n} elements, which fails once when
+    fetching the page starting at `fail_at`, along with the list of (start, count) calls made.
+    """
+    calls = []
+    failures = [fail_at]
+
+    def fetch_page(start, count):
+        calls.append((start, count))
+        if start in failures:
+            failures.remove(start)
+            raise ConnectionError("Connection reset")
+        return CollectionResponse(
+            status_code=200,
+            url="",
+            headers={},
+            response=None,
+            elements=[{"id": id} for id in range(start, min(start + count, total))],
+            paging=Paging(start, count, total),
+            metadata=None,
+        )
+
+    return fetch_page, calls
+
+
+def read_ids(path, compress=False):
+    opener = gzip.open if compress else open
+    with opener(path, "rb") as file:
+        return [json.loads(line)["id"] for line in file]
+
+
+def test_export_ndjson_to_file_object():
+    fetch_page, _ = fake_collection(25)
+    output = io.BytesIO()
+
+    exported = export_ndjson(Paginator(fetch_page, page_size=10), output)
+
+    assert exported == 25
+    lines = output.getvalue().splitlines()
+    assert [json.loads(line) for line in lines] == [{"id": id} for id in range(25)]
+
+
+def test_export_ndjson_respects_max_elements(tmp_path):
+    fetch_page, _ = fake_collection(25)
+    path = tmp_path / "export.ndjson"
+
+    assert (
+        export_ndjson(Paginator(fetch_page, page_size=10, max_elements=15), path) == 15
+    )
+    assert read_ids(path) == list(range(15))
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_export_ndjson_resumes_from_checkpoint(tmp_path, compress):
+    fetch_page, calls = fake_collection(45, fail_at=20)
+    path = tmp_path / "export.ndjson"
+    checkpoint_path = tmp_path / "export.checkpoint"
+
+    with pytest.raises(ConnectionError):
+        export_ndjson(
+            Paginator(fetch_page, page_size=10),
+            path,
+            compress=compress,
+            checkpoint_path=checkpoint_path,
+        )
+    assert json.loads(checkpoint_path.read_text())["start"] == 20
+
+    exported = export_ndjson(
+        Paginator(fetch_page, page_size=10),
+        path,
+        compress=compress,
+        checkpoint_path=checkpoint_path,
+    )
+
+    assert exported == 45
+    assert read_ids(path, compress) == list(range(45))
+    # The pages exported before the failure are not fetched again
+    assert calls == [(0, 10), (10, 10), (20, 10), (20, 10), (30, 10), (40, 10)]
+    assert not checkpoint_path.exists()
+
+
+def test_export_ndjson_resume_discards_pages_after_checkpoint(tmp_path):
+    fetch_page, calls = fake_collection(30, fail_at=20)
+    path = tmp_path / "export.ndjson"
+    checkpoint_path = tmp_path / "export.checkpoint"
+
+    with pytest.raises(ConnectionError):
+        export_ndjson(
+            Paginator(fetch_page, page_size=5),
+            path,
+            checkpoint_path=checkpoint_path,
+            checkpoint_every_pages=3,
+        )
+
+    # The page 15-19 was written after the last checkpoint, so it is fetched and written again
+    assert (
+        export_ndjson(
+            Paginator(fetch_page, page_size=5),
+            path,
+            checkpoint_path=checkpoint_path,
+            checkpoint_every_pages=3,
+        )
+        == 30
+    )
+    assert read_ids(path) == list(range(30))
+    assert calls[5:] == [(15, 5), (20, 5), (25, 5)]
+
+
+@pytest.mark.parametrize("move_output", [True, False])
+def test_export_ndjson_resume_with_missing_or_truncated_output(tmp_path, move_output):
+    fetch_page, calls = fake_collection(30, fail_at=20)
+    path = tmp_path / "export.ndjson"
+    checkpoint_path = tmp_path / "export.checkpoint"
+
+    with pytest.raises(ConnectionError):
+        export_ndjson(
+            Paginator(fetch_page, page_size=10),
+            path,
+            checkpoint_path=checkpoint_path,
+        )
+    if move_output:
+        path.rename(tmp_path / "moved.ndjson")
+    else:
+        path.write_bytes(path.read_bytes()[:10])
+
+    with pytest.raises(InvalidArgumentError, match="export.checkpoint"):
+        export_ndjson(
+            Paginator(fetch_page, page_size=10),
+            path,
+            checkpoint_path=checkpoint_path,
+        )
+    # Nothing is fetched, and the checkpoint is kept
+    assert len(calls) == 3
+    assert checkpoint_path.exists()
+
+
+def test_export_ndjson_invalid_arguments():
+    fetch_page, _ = fake_collection(5)
+    with pytest.raises(InvalidArgumentError):
+        export_ndjson(
+            Paginator(fetch_page), io.BytesIO(), checkpoint_path="export.checkpoint"
+        )
+    with pytest.raises(InvalidArgumentError):
+        export_ndjson(Paginator(fetch_page), io.BytesIO(), checkpoint_every_pages=0)
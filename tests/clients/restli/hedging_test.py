@@ -0,0 +1,168 @@
+import time
+import threading
+from linkedin_api.clients.restli.client import RestliClient
+from linkedin_api.clients.restli.hedging import HedgePolicy
+from linkedin_api.common.constants import NON_VERSIONED_BASE_URL
+import requests
+import responses
+
+ACCESS_TOKEN = "ABC123"
+
+
+def create_response(status_code, body=b"{}"):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    return response
+
+
+def test_hedge_policy_sends_duplicate_after_delay():
+    release_primary = threading.Event()
+    calls = []
+
+    def send(request):
+        calls.append(request)
+        if len(calls) == 1:
+            release_primary.wait(1)
+            return create_response(500)
+        return create_response(200)
+
+    hedge_policy = HedgePolicy(initial_delay=0.01)
+    response = hedge_policy.send(send, requests.Request("GET", "https://a").prepare())
+    release_primary.set()
+
+    assert response.status_code == 200
+    assert len(calls) == 2
+    assert hedge_policy.hedged_requests == 1
+    hedge_policy.shutdown()
+
+
+def test_hedge_policy_budget():
+    def send(request):
+        threading.Event().wait(0.02)
+        return create_response(200)
+
+    hedge_policy = HedgePolicy(
+        initial_delay=0.001, budget_ratio=0.1, budget_max_tokens=1
+    )
+    for _ in range(3):
+        hedge_policy.send(send, requests.Request("GET", "https://a").prepare())
+
+    assert hedge_policy.hedged_requests == 1
+    hedge_policy.shutdown()
+
+
+def test_hedge_policy_percentile_delay():
+    hedge_policy = HedgePolicy(
+        percentile=90, initial_delay=5, min_samples=10, min_delay=0
+    )
+    assert hedge_policy.get_delay() == 5
+
+    for _ in range(10):
+        hedge_policy.send(lambda request: create_response(200), None)
+    assert hedge_policy.get_delay() < 5
+    hedge_policy.shutdown()
+
+
+def test_hedge_policy_sends_on_calling_thread_without_budget():
+    threads = []
+
+    def send(request):
+        threads.append(threading.current_thread())
+        return create_response(200)
+
+    hedge_policy = HedgePolicy(initial_delay=0, budget_ratio=0.1, budget_max_tokens=0)
+    hedge_policy.send(send, requests.Request("GET", "https://a").prepare())
+
+    assert threads == [threading.current_thread()]
+    assert hedge_policy.hedged_requests == 0
+    hedge_policy.shutdown()
+
+
+def test_hedge_policy_reuses_bounded_primary_threads():
+    threads = set()
+
+    def send(request):
+        threads.add(threading.current_thread())
+        return create_response(200)
+
+    hedge_policy = HedgePolicy(initial_delay=1, max_primary_workers=2)
+    for _ in range(20):
+        hedge_policy.send(send, requests.Request("GET", "https://a").prepare())
+
+    assert threading.current_thread() not in threads
+    assert len(threads) <= 2
+    assert all(
+        thread.name.startswith("linkedin-api-hedge-primary") for thread in threads
+    )
+    hedge_policy.shutdown()
+
+
+def test_hedge_policy_sends_on_calling_thread_when_primary_threads_are_busy():
+    release_primary = threading.Event()
+    primary_started = threading.Event()
+    threads = []
+
+    def send(request):
+        threads.append(threading.current_thread())
+        if request.url == "https://slow/":
+            primary_started.set()
+            release_primary.wait(1)
+        return create_response(200)
+
+    hedge_policy = HedgePolicy(initial_delay=5, max_primary_workers=1)
+    slow_request = threading.Thread(
+        target=hedge_policy.send,
+        args=(send, requests.Request("GET", "https://slow").prepare()),
+    )
+    slow_request.start()
+    primary_started.wait(1)
+
+    response = hedge_policy.send(send, requests.Request("GET", "https://a").prepare())
+    release_primary.set()
+    slow_request.join(1)
+
+    assert response.status_code == 200
+    assert threads[1] is threading.current_thread()
+    assert hedge_policy.hedged_requests == 0
+    hedge_policy.shutdown()
+
+
+@responses.activate
+def test_restli_client_hedges_read_only_requests():
+    calls = []
+    release_primary = threading.Event()
+
+    def slow_first_response(request):
+        calls.append(request)
+        if len(calls) == 1:
+            release_primary.wait(1)
+        return (200, {}, '{"id": "abc"}')
+
+    responses.add_callback(
+        responses.GET, f"{NON_VERSIONED_BASE_URL}/me", callback=slow_first_response
+    )
+    responses.post(f"{NON_VERSIONED_BASE_URL}/adAccounts", status=201)
+
+    hedge_policy = HedgePolicy(initial_delay=0.05, min_delay=0, budget_max_tokens=10)
+    restli_client = RestliClient(hedge_policy=hedge_policy)
+
+    response = restli_client.get(resource_path="/me", access_token=ACCESS_TOKEN)
+    assert response.entity == {"id": "abc"}
+    restli_client.create(
+        resource_path="/adAccounts", entity={"name": "A"}, access_token=ACCESS_TOKEN
+    )
+
+    assert hedge_policy.hedged_requests == 1
+    # The slow first GET is only recorded by responses once it completes
+    assert len(calls) == 2
+    assert len([call for call in responses.calls if call.request.method == "POST"]) == 1
+
+    # Let the slow first GET complete while responses is still active, so that it is not recorded by
+    # another test
+    release_primary.set()
+    deadline = time.monotonic() + 1
+    while len(responses.calls) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(responses.calls) == 3
+    hedge_policy.shutdown()
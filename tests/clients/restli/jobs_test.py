@@ -0,0 +1,112 @@
+import json
+from linkedin_api.clients.restli.client import RestliClient
+from linkedin_api.clients.restli.jobs import CheckpointFile, ResumableJob
+from linkedin_api.clients.restli.paginator import Paginator
+from linkedin_api.clients.restli.response import CollectionResponse, Paging
+from linkedin_api.common.constants import NON_VERSIONED_BASE_URL
+from linkedin_api.common.errors import InvalidArgumentError
+import pytest
+import responses
+from responses import matchers
+
+ACCESS_TOKEN = "ABC123"
+
+
+def fake_collection(total):
+    calls = []
+
+    def fetch_page(start, count):
+        calls.append((start, count))
+        return CollectionResponse(
+            status_code=200,
+            url="",
+            headers={},
+            response=None,
+            elements=list(range(start, min(start + count, total))),
+            paging=Paging(start, count, total),
+            metadata=None,
+        )
+
+    return fetch_page, calls
+
+
+def test_checkpoint_file(tmp_path):
+    checkpoint_file = CheckpointFile(tmp_path / "job.checkpoint")
+    assert checkpoint_file.load() is None
+
+    checkpoint_file.save({"start": 10})
+    assert checkpoint_file.load() == {"start": 10}
+    checkpoint_file.remove()
+    assert checkpoint_file.load() is None
+
+
+def test_resumable_job_pages(tmp_path):
+    fetch_page, calls = fake_collection(35)
+    checkpoint_path = tmp_path / "job.checkpoint"
+    params = {"finder": "search", "status": "ACTIVE"}
+
+    processed = []
+    job = ResumableJob(checkpoint_path, params=params)
+    for page in job.pages(Paginator(fetch_page, page_size=10)):
+        if page.paging.start == 20:
+            # The job is interrupted while the third page is being processed
+            break
+        processed.extend(page.elements)
+
+    job = ResumableJob(checkpoint_path, params=params)
+    for page in job.pages(Paginator(fetch_page, page_size=10)):
+        processed.extend(page.elements)
+
+    assert processed == list(range(35))
+    assert calls == [(0, 10), (10, 10), (20, 10), (20, 10), (30, 10)]
+    assert job.is_step_completed("pages")
+
+    # A completed step is not run again
+    assert list(job.pages(Paginator(fetch_page, page_size=10))) == []
+    job.reset()
+    assert len(list(job.pages(Paginator(fetch_page, page_size=10)))) == 4
+
+
+def test_resumable_job_rejects_checkpoint_of_other_job(tmp_path):
+    checkpoint_path = tmp_path / "job.checkpoint"
+    fetch_page, _ = fake_collection(5)
+    job = ResumableJob(checkpoint_path, params={"finder": "search"})
+    list(job.pages(Paginator(fetch_page)))
+
+    with pytest.raises(InvalidArgumentError):
+        ResumableJob(checkpoint_path, params={"finder": "other"})
+
+
+@responses.activate
+def test_resumable_job_batch_get_chunks(tmp_path):
+    for ids in ["List(1,2)", "List(3,4)", "List(5)"]:
+        responses.get(
+            f"{NON_VERSIONED_BASE_URL}/adCampaigns",
+            match=[matchers.query_param_matcher({"ids": ids})],
+            json={"results": {}, "statuses": {}, "errors": {}},
+        )
+    checkpoint_path = tmp_path / "job.checkpoint"
+
+    def run_job(stop_after=None):
+        job = ResumableJob(checkpoint_path)
+        for (index, _) in enumerate(
+            job.batch_get_chunks(
+                RestliClient(),
+                resource_path="/adCampaigns",
+                ids=[1, 2, 3, 4, 5],
+                access_token=ACCESS_TOKEN,
+                max_ids_per_request=2,
+            )
+        ):
+            if index == stop_after:
+                return
+
+    run_job(stop_after=1)
+    assert json.loads(checkpoint_path.read_text())["steps"]["batch_get"][
+        "completed_chunks"
+    ] == [0]
+    run_job()
+
+    requested_ids = [call.request.params["ids"] for call in responses.calls]
+    assert requested_ids == ["List(1,2)", "List(3,4)", "List(3,4)", "List(5)"]
+    assert ResumableJob(checkpoint_path).is_step_completed("batch_get")
@@ -0,0 +1,126 @@
+from concurrent.futures import ThreadPoolExecutor
+from linkedin_api.clients.restli.client import RestliClient
+from linkedin_api.clients.restli.loader import BatchGetLoader
+from linkedin_api.common.constants import NON_VERSIONED_BASE_URL, VERSIONED_BASE_URL
+from linkedin_api.common.errors import InvalidArgumentError
+import pytest
+import responses
+from responses import matchers
+
+ACCESS_TOKEN = "ABC123"
+
+
+@responses.activate
+def test_batch_get_loader_explicit_dispatch():
+    responses.get(
+        f"{VERSIONED_BASE_URL}/adAccounts/123/adCampaigns",
+        match=[
+            matchers.query_param_matcher({"ids": "List(1,2,3)", "fields": "id"}),
+            matchers.header_matcher({"X-RestLi-Method": "BATCH_GET"}),
+        ],
+        json={
+            "results": {"1": {"id": 1}, "2": {"id": 2}},
+            "statuses": {"1": 200, "2": 200, "3": 404},
+            "errors": {"3": {"status": 404, "message": "Not found"}},
+        },
+    )
+
+    loader = BatchGetLoader(RestliClient(), window_seconds=None)
+    futures = [
+        loader.load(
+            resource_path="/adAccounts/{account}/adCampaigns/{id}",
+            path_keys={"account": 123, "id": id},
+            query_params={"fields": "id"},
+            access_token=ACCESS_TOKEN,
+            version_string="202302",
+        )
+        for id in [1, 2, 3, 1]
+    ]
+    assert not any(future.done() for future in futures)
+
+    loader.dispatch()
+
+    assert len(responses.calls) == 1
+    results = [future.result() for future in futures]
+    assert [result.status_code for result in results] == [200, 200, 404, 200]
+    assert results[0].entity == {"id": 1}
+    assert results[1].entity == {"id": 2}
+    assert results[2].entity == {"status": 404, "message": "Not found"}
+    assert results[3].entity == {"id": 1}
+
+
+@responses.activate
+def test_batch_get_loader_sends_full_batches():
+    for ids in ["List(1,2)", "List(3)"]:
+        responses.get(
+            f"{NON_VERSIONED_BASE_URL}/adCampaigns",
+            match=[matchers.query_param_matcher({"ids": ids})],
+            json={"results": {}},
+        )
+
+    loader = BatchGetLoader(RestliClient(), window_seconds=None, max_batch_size=2)
+    futures = [
+        loader.load(
+            resource_path="/adCampaigns/{id}",
+            path_keys={"id": id},
+            access_token=ACCESS_TOKEN,
+        )
+        for id in [1, 2, 3]
+    ]
+
+    assert [future.done() for future in futures] == [True, True, False]
+    loader.dispatch()
+    assert futures[2].result().status_code == 404
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_batch_get_loader_failed_batch():
+    responses.get(
+        f"{NON_VERSIONED_BASE_URL}/adCampaigns",
+        json={"status": 401, "message": "Unauthorized"},
+        status=401,
+    )
+
+    loader = BatchGetLoader(RestliClient(), window_seconds=None)
+    response = loader.get(
+        resource_path="/adCampaigns/{id}", path_keys={"id": 1}, access_token="bad"
+    )
+
+    assert response.status_code == 401
+    assert response.entity == {"status": 401, "message": "Unauthorized"}
+
+
+def test_batch_get_loader_invalid_resource_path():
+    loader = BatchGetLoader(RestliClient())
+    with pytest.raises(InvalidArgumentError):
+        loader.load(resource_path="/me", access_token=ACCESS_TOKEN)
+
+
+@responses.activate
+def test_restli_client_coalesces_concurrent_gets():
+    responses.get(
+        f"{NON_VERSIONED_BASE_URL}/adCampaigns",
+        json={"results": {str(id): {"id": id} for id in range(10)}},
+    )
+    responses.get(f"{NON_VERSIONED_BASE_URL}/me", json={"id": "me"})
+
+    restli_client = RestliClient(coalesce_get_window=0.2)
+
+    def get_campaign(id):
+        return restli_client.get(
+            resource_path="/adCampaigns/{id}",
+            path_keys={"id": id},
+            access_token=ACCESS_TOKEN,
+        )
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        results = list(executor.map(get_campaign, range(10)))
+
+    assert [result.entity for result in results] == [{"id": id} for id in range(10)]
+    assert len(responses.calls) == 1
+
+    # Requests that cannot be coalesced are sent as is
+    me = restli_client.get(resource_path="/me", access_token=ACCESS_TOKEN)
+    assert me.entity == {"id": "me"}
+    assert len(responses.calls) == 2
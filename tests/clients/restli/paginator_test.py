@@ -0,0 +1,186 @@
+import threading
+import time
+from linkedin_api.clients.restli.client import RestliClient
+from linkedin_api.clients.restli.paginator import Paginator
+from linkedin_api.clients.restli.response import CollectionResponse, Paging
+from linkedin_api.common.constants import NON_VERSIONED_BASE_URL
+from linkedin_api.common.errors import InvalidArgumentError
+import pytest
+import responses
+from responses import matchers
+
+ACCESS_TOKEN = "ABC123"
+
+
+def fake_collection(total=None, available=None):
+    """
+    Returns a fetch_page function over a collection of integers, along with the list of
+    (start, count) calls that were made.
+    """
+    calls = []
+    available = total if available is None else available
+
+    def fetch_page(start, count):
+        calls.append((start, count))
+        elements = list(range(start, min(start + count, available)))
+        return CollectionResponse(
+            status_code=200,
+            url="",
+            headers={},
+            response=None,
+            elements=elements,
+            paging=Paging(start, count, total),
+            metadata=None,
+        )
+
+    return fetch_page, calls
+
+
+@pytest.mark.parametrize(
+    "total,available,start,page_size,max_elements,expected_calls",
+    [
+        # Total is known, last page is partial
+        (25, None, 0, 10, None, [(0, 10), (10, 10), (20, 10)]),
+        # Total is a multiple of the page size, so no empty trailing page is fetched
+        (20, None, 0, 10, None, [(0, 10), (10, 10)]),
+        # No total, a partial page ends the iteration
+        (None, 15, 0, 10, None, [(0, 10), (10, 10)]),
+        # No total, an empty page ends the iteration
+        (None, 20, 0, 10, None, [(0, 10), (10, 10), (20, 10)]),
+        # The last request is reduced to the remaining max elements
+        (100, None, 0, 10, 25, [(0, 10), (10, 10), (20, 5)]),
+        # Custom start index
+        (25, None, 5, 10, None, [(5, 10), (15, 10)]),
+    ],
+)
+def test_paginator(total, available, start, page_size, max_elements, expected_calls):
+    fetch_page, calls = fake_collection(total=total, available=available)
+
+    elements = list(
+        Paginator(
+            fetch_page, start=start, page_size=page_size, max_elements=max_elements
+        )
+    )
+
+    assert calls == expected_calls
+    expected_end = min(
+        total if total is not None else available,
+        start + max_elements if max_elements is not None else float("inf"),
+    )
+    assert elements == list(range(start, expected_end))
+
+
+def test_paginator_is_lazy():
+    fetch_page, calls = fake_collection(total=1000)
+    iterator = iter(Paginator(fetch_page, page_size=10))
+
+    assert calls == []
+    assert next(iterator) == 0
+    assert calls == [(0, 10)]
+
+
+def test_paginator_invalid_arguments():
+    fetch_page, _ = fake_collection(total=10)
+    with pytest.raises(InvalidArgumentError):
+        Paginator(fetch_page, page_size=0)
+    with pytest.raises(InvalidArgumentError):
+        Paginator(fetch_page, max_elements=-1)
+
+
+@responses.activate
+def test_iter_finder():
+    for (start, elements) in [(0, [{"id": 1}, {"id": 2}]), (2, [{"id": 3}])]:
+        responses.get(
+            f"{NON_VERSIONED_BASE_URL}/adAccounts",
+            match=[
+                matchers.query_param_matcher(
+                    {
+                        "q": "search",
+                        "search": "(test:false)",
+                        "start": str(start),
+                        "count": "2",
+                    }
+                )
+            ],
+            json={
+                "elements": elements,
+                "paging": {"start": start, "count": 2, "total": 3},
+            },
+        )
+
+    restli_client = RestliClient()
+    ad_accounts = list(
+        restli_client.iter_finder(
+            resource_path="/adAccounts",
+            finder_name="search",
+            query_params={"search": {"test": False}},
+            access_token=ACCESS_TOKEN,
+            page_size=2,
+        )
+    )
+
+    assert ad_accounts == [{"id": 1}, {"id": 2}, {"id": 3}]
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_iter_get_all_uses_query_param_start_and_count():
+    responses.get(
+        f"{NON_VERSIONED_BASE_URL}/fieldsOfStudy",
+        match=[matchers.query_param_matcher({"start": "10", "count": "5"})],
+        json={"elements": [{"id": 1}], "paging": {"start": 10, "count": 5}},
+    )
+
+    restli_client = RestliClient()
+    pages = list(
+        restli_client.iter_get_all(
+            resource_path="/fieldsOfStudy",
+            query_params={"start": 10, "count": 5},
+            access_token=ACCESS_TOKEN,
+        ).pages()
+    )
+
+    assert len(pages) == 1
+    assert pages[0].elements == [{"id": 1}]
+
+
+def test_paginator_prefetches_pages_concurrently_in_order():
+    lock = threading.Lock()
+    state = {"in_flight": 0, "max_in_flight": 0}
+    fetch_collection_page, calls = fake_collection(total=95)
+
+    def fetch_page(start, count):
+        with lock:
+            state["in_flight"] += 1
+            state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        # Later pages complete first, to verify that the order is preserved
+        time.sleep(0.05 - start / 10000)
+        with lock:
+            state["in_flight"] -= 1
+        return fetch_collection_page(start, count)
+
+    elements = list(Paginator(fetch_page, page_size=10, prefetch_pages=4))
+
+    assert elements == list(range(95))
+    assert sorted(calls) == [(start, 10) for start in range(0, 100, 10)]
+    assert state["max_in_flight"] == 4
+
+
+def test_paginator_prefetch_respects_max_elements():
+    fetch_page, calls = fake_collection(total=1000)
+
+    elements = list(
+        Paginator(fetch_page, page_size=10, max_elements=35, prefetch_pages=8)
+    )
+
+    assert elements == list(range(35))
+    assert sorted(calls) == [(0, 10), (10, 10), (20, 10), (30, 5)]
+
+
+def test_paginator_prefetch_without_total_is_serial():
+    fetch_page, calls = fake_collection(total=None, available=25)
+
+    elements = list(Paginator(fetch_page, page_size=10, prefetch_pages=4))
+
+    assert elements == list(range(25))
+    assert calls == [(0, 10), (10, 10), (20, 10)]
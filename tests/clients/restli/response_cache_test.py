@@ -0,0 +1,64 @@
+from linkedin_api.clients.common.cache import InMemoryCacheBackend
+from linkedin_api.clients.restli.client import RestliClient
+from linkedin_api.common.constants import NON_VERSIONED_BASE_URL
+import responses
+
+ACCESS_TOKEN = "ABC123"
+
+
+@responses.activate
+def test_response_cache_read_requests():
+    responses.get(f"{NON_VERSIONED_BASE_URL}/adAccounts/1", json={"id": 1})
+    responses.get(
+        f"{NON_VERSIONED_BASE_URL}/adAccounts?q=search",
+        json={"elements": [{"id": 1}], "paging": {"start": 0, "count": 10}},
+    )
+
+    restli_client = RestliClient(response_cache=InMemoryCacheBackend())
+
+    for _ in range(2):
+        response = restli_client.get(
+            resource_path="/adAccounts/{id}",
+            path_keys={"id": 1},
+            access_token=ACCESS_TOKEN,
+        )
+        assert response.entity == {"id": 1}
+        response = restli_client.finder(
+            resource_path="/adAccounts", finder_name="search", access_token=ACCESS_TOKEN
+        )
+        assert response.elements == [{"id": 1}]
+
+    assert len(responses.calls) == 2
+
+    # Requests with a different access token are not served from the cache
+    restli_client.get(
+        resource_path="/adAccounts/{id}", path_keys={"id": 1}, access_token="XYZ"
+    )
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_response_cache_skips_failures_and_writes():
+    responses.get(
+        f"{NON_VERSIONED_BASE_URL}/adAccounts/1",
+        json={"status": 500, "message": "Internal error"},
+        status=500,
+    )
+    responses.post(f"{NON_VERSIONED_BASE_URL}/adAccounts", status=201)
+
+    cache = InMemoryCacheBackend()
+    restli_client = RestliClient(response_cache=cache)
+
+    for _ in range(2):
+        response = restli_client.get(
+            resource_path="/adAccounts/{id}",
+            path_keys={"id": 1},
+            access_token=ACCESS_TOKEN,
+        )
+        assert response.status_code == 500
+        restli_client.create(
+            resource_path="/adAccounts", entity={"name": "A"}, access_token=ACCESS_TOKEN
+        )
+
+    assert len(responses.calls) == 4
+    assert len(cache) == 0
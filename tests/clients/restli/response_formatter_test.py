@@ -0,0 +1,80 @@
+import json
+from linkedin_api.clients.common.json_codec import StdlibJsonCodec
+from linkedin_api.clients.restli.response_formatter import (
+    BatchUpdateResponseFormatter,
+    CollectionResponseFormatter,
+    CreateResponseFormatter,
+    GetResponseFormatter,
+)
+from linkedin_api.common.errors import ResponseFormattingError
+import pytest
+import requests
+
+
+def create_response(status_code, body, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body if isinstance(body, bytes) else json.dumps(body).encode()
+    response.headers.update(headers or {})
+    return response
+
+
+class CountingJsonCodec(StdlibJsonCodec):
+    def __init__(self):
+        self.decode_calls = 0
+
+    def decode_response(self, response):
+        self.decode_calls += 1
+        return super().decode_response(response)
+
+
+def test_body_is_not_decoded_until_accessed():
+    json_codec = CountingJsonCodec()
+    formatted_response = BatchUpdateResponseFormatter.format_response(
+        create_response(200, {"results": {"1": {"status": 204}}}), json_codec=json_codec
+    )
+    assert formatted_response.status_code == 200
+    assert json_codec.decode_calls == 0
+
+    assert formatted_response.results["1"].status == 204
+    assert formatted_response.results["1"].status == 204
+    assert json_codec.decode_calls == 1
+
+
+def test_collection_fields_share_one_decoded_body():
+    json_codec = CountingJsonCodec()
+    response = create_response(
+        200,
+        {
+            "elements": [{"id": 1}],
+            "paging": {"start": 0, "count": 10, "total": 1},
+            "metadata": {"nextPageToken": "abc"},
+        },
+    )
+
+    formatted_response = CollectionResponseFormatter.format_response(
+        response, json_codec=json_codec
+    )
+    assert formatted_response.elements == [{"id": 1}]
+    assert formatted_response.paging.total == 1
+    assert formatted_response.metadata == {"nextPageToken": "abc"}
+    assert json_codec.decode_calls == 1
+
+
+def test_decoding_errors_are_raised_on_access():
+    formatted_response = GetResponseFormatter.format_response(
+        create_response(502, b"<html>Bad gateway</html>")
+    )
+
+    assert formatted_response.status_code == 502
+    with pytest.raises(ResponseFormattingError):
+        formatted_response.entity
+
+
+def test_create_response_without_entity():
+    formatted_response = CreateResponseFormatter.format_response(
+        create_response(201, b"", headers={"x-restli-id": "123"})
+    )
+
+    assert formatted_response.entity_id == "123"
+    assert formatted_response.entity is None
@@ -0,0 +1,157 @@
+import copy
+import pickle
+import pytest
+import requests
+from linkedin_api.clients.common.response import LazyValue
+from linkedin_api.clients.restli.response import (
+    ActionResponse,
+    BaseRestliResponse,
+    BatchCreateResponse,
+    BatchCreateResult,
+    BatchDeleteResponse,
+    BatchDeleteResult,
+    BatchFinderResponse,
+    BatchFinderResult,
+    BatchGetResponse,
+    BatchUpdateResponse,
+    BatchUpdateResult,
+    CollectionResponse,
+    CreateResponse,
+    GetResponse,
+    Paging,
+    UpdateResponse,
+)
+from linkedin_api.clients.restli.response_formatter import (
+    BatchGetResponseFormatter,
+    CollectionResponseFormatter,
+    GetResponseFormatter,
+    StreamingCollectionResponseFormatter,
+)
+
+RESPONSE_ARGS = {
+    "status_code": 200,
+    "url": "https://api.linkedin.com/rest/adAccounts",
+    "headers": {},
+    "response": requests.Response(),
+}
+
+
+def get_instances():
+    return [
+        Paging(0, 10, 100),
+        BatchFinderResult([], Paging()),
+        BatchCreateResult(201, "123", None),
+        BatchUpdateResult(204),
+        BatchDeleteResult(204),
+        BaseRestliResponse(**RESPONSE_ARGS),
+        GetResponse(**RESPONSE_ARGS, entity={}),
+        BatchGetResponse(**RESPONSE_ARGS, results={}, statuses={}, errors={}),
+        CollectionResponse(
+            **RESPONSE_ARGS, elements=[], paging=Paging(), metadata=None
+        ),
+        BatchFinderResponse(**RESPONSE_ARGS, results=[]),
+        CreateResponse(**RESPONSE_ARGS, entity_id="123", decoded_entity_id="123"),
+        BatchCreateResponse(**RESPONSE_ARGS, elements=[]),
+        UpdateResponse(**RESPONSE_ARGS, entity=None),
+        BatchUpdateResponse(**RESPONSE_ARGS, results={}),
+        BatchDeleteResponse(**RESPONSE_ARGS, results={}),
+        ActionResponse(**RESPONSE_ARGS, value=None),
+    ]
+
+
+@pytest.mark.parametrize(
+    "instance", get_instances(), ids=lambda instance: type(instance).__name__
+)
+def test_instances_have_no_dict(instance):
+    assert not hasattr(instance, "__dict__")
+    with pytest.raises(AttributeError):
+        instance.unknown_attribute = 1
+
+
+def test_lazy_fields_are_stored_in_slots():
+    response = CollectionResponse(
+        **RESPONSE_ARGS,
+        elements=LazyValue(lambda: [{"id": 1}]),
+        paging=Paging(0, 1, 1),
+        metadata=None,
+    )
+
+    assert response.elements == [{"id": 1}]
+    assert response._elements == [{"id": 1}]
+    assert response.paging.total == 1
+
+
+def test_result_objects_can_be_copied_and_pickled():
+    result = BatchCreateResult(201, "123", None)
+    copied_result = copy.copy(result)
+    assert (copied_result.status, copied_result.id, copied_result.error) == (
+        201,
+        "123",
+        None,
+    )
+
+    paging = pickle.loads(pickle.dumps(Paging(0, 10, 100)))
+    assert (paging.start, paging.count, paging.total) == (0, 10, 100)
+
+    response = copy.copy(GetResponse(**RESPONSE_ARGS, entity={"id": 1}))
+    assert response.entity == {"id": 1}
+    assert response.status_code == 200
+
+
+def pickle_copy(obj):
+    return pickle.loads(pickle.dumps(obj))
+
+
+def create_raw_response(body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.url = RESPONSE_ARGS["url"]
+    response._content = body
+    return response
+
+
+@pytest.mark.parametrize("read_fields_first", [False, True])
+@pytest.mark.parametrize("copy_function", [pickle_copy, copy.copy, copy.deepcopy])
+def test_formatted_responses_can_be_copied_and_pickled(
+    copy_function, read_fields_first
+):
+    get_response = GetResponseFormatter.format_response(
+        create_raw_response(b'{"id": 1}')
+    )
+    batch_get_response = BatchGetResponseFormatter.format_response(
+        create_raw_response(
+            b'{"results": {"1": {"id": 1}}, "statuses": {"1": 200}, "errors": {}}'
+        )
+    )
+    collection_response = CollectionResponseFormatter.format_response(
+        create_raw_response(
+            b'{"elements": [{"id": 1}], "paging": {"start": 0, "count": 1, "total": 1}}'
+        )
+    )
+    if read_fields_first:
+        # Only some of the lazy fields are resolved before copying
+        batch_get_response.results
+        collection_response.elements
+
+    copied_get_response = copy_function(get_response)
+    assert copied_get_response.entity == {"id": 1}
+    assert copied_get_response.status_code == 200
+
+    copied_batch_get_response = copy_function(batch_get_response)
+    assert copied_batch_get_response.results == {"1": {"id": 1}}
+    assert copied_batch_get_response.statuses == {"1": 200}
+    assert copied_batch_get_response.errors == {}
+
+    copied_collection_response = copy_function(collection_response)
+    assert copied_collection_response.elements == [{"id": 1}]
+    assert copied_collection_response.paging.total == 1
+    assert copied_collection_response.metadata is None
+
+
+def test_streaming_response_cannot_be_pickled():
+    response = StreamingCollectionResponseFormatter.format_response(
+        create_raw_response(b'{"elements": [], "paging": {}}')
+    )
+
+    with pytest.raises(TypeError, match="cannot be pickled"):
+        pickle.dumps(response)
@@ -0,0 +1,234 @@
+from linkedin_api.clients.restli.client import RestliClient
+from linkedin_api.clients.restli.retry import (
+    RetryBudget,
+    RetryPolicy,
+    parse_retry_after,
+)
+from linkedin_api.common.constants import NON_VERSIONED_BASE_URL, RESTLI_METHODS
+import pytest
+import requests
+import responses
+
+ACCESS_TOKEN = "ABC123"
+
+
+def create_retry_policy(delays, **kwargs):
+    return RetryPolicy(sleep=delays.append, random_fn=lambda: 0.5, **kwargs)
+
+
+@responses.activate
+def test_retry_throttled_request_with_retry_after():
+    url = f"{NON_VERSIONED_BASE_URL}/adAccounts/1"
+    responses.get(url, status=429, headers={"Retry-After": "2"})
+    responses.get(url, status=503)
+    responses.get(url, json={"id": 1})
+
+    delays = []
+    restli_client = RestliClient(
+        retry_policy=create_retry_policy(delays, base_delay=1.0)
+    )
+    response = restli_client.get(
+        resource_path="/adAccounts/{id}", path_keys={"id": 1}, access_token=ACCESS_TOKEN
+    )
+
+    assert response.status_code == 200
+    assert response.entity == {"id": 1}
+    # The Retry-After value, then half of the second backoff (full jitter)
+    assert delays == [2.0, 1.0]
+
+
+@responses.activate
+def test_retry_stops_after_max_attempts():
+    responses.get(f"{NON_VERSIONED_BASE_URL}/adAccounts/1", status=500, json={})
+
+    delays = []
+    restli_client = RestliClient(
+        retry_policy=create_retry_policy(delays, max_attempts=3)
+    )
+    response = restli_client.get(
+        resource_path="/adAccounts/{id}", path_keys={"id": 1}, access_token=ACCESS_TOKEN
+    )
+
+    assert response.status_code == 500
+    assert len(responses.calls) == 3
+    assert len(delays) == 2
+
+
+@responses.activate
+def test_retry_non_idempotent_methods_only_when_throttled():
+    url = f"{NON_VERSIONED_BASE_URL}/adAccounts"
+    responses.post(url, status=500, json={})
+
+    delays = []
+    restli_client = RestliClient(retry_policy=create_retry_policy(delays))
+    response = restli_client.create(
+        resource_path="/adAccounts", entity={"name": "A"}, access_token=ACCESS_TOKEN
+    )
+    assert response.status_code == 500
+    assert len(responses.calls) == 1
+
+    responses.replace(responses.POST, url, status=429, json={})
+    restli_client.create(
+        resource_path="/adAccounts", entity={"name": "A"}, access_token=ACCESS_TOKEN
+    )
+    assert len(responses.calls) == 4
+
+
+@responses.activate
+def test_retry_connection_errors():
+    url = f"{NON_VERSIONED_BASE_URL}/adAccounts/1"
+    responses.get(url, body=requests.ConnectionError("reset"))
+    responses.get(url, json={"id": 1})
+
+    restli_client = RestliClient(retry_policy=create_retry_policy([]))
+    response = restli_client.get(
+        resource_path="/adAccounts/{id}", path_keys={"id": 1}, access_token=ACCESS_TOKEN
+    )
+    assert response.entity == {"id": 1}
+
+    responses.replace(responses.GET, url, body=requests.ConnectionError("reset"))
+    with pytest.raises(requests.ConnectionError):
+        restli_client.get(
+            resource_path="/adAccounts/{id}",
+            path_keys={"id": 1},
+            access_token=ACCESS_TOKEN,
+        )
+
+
+@responses.activate
+def test_retry_max_elapsed_time():
+    responses.get(
+        f"{NON_VERSIONED_BASE_URL}/adAccounts/1",
+        status=429,
+        json={},
+        headers={"Retry-After": "120"},
+    )
+
+    delays = []
+    restli_client = RestliClient(
+        retry_policy=create_retry_policy(
+            delays, max_elapsed_time=60, max_retry_after=300
+        )
+    )
+    response = restli_client.get(
+        resource_path="/adAccounts/{id}", path_keys={"id": 1}, access_token=ACCESS_TOKEN
+    )
+
+    assert response.status_code == 429
+    assert len(responses.calls) == 1
+    assert delays == []
+
+
+@pytest.mark.parametrize(
+    "retry_after",
+    ["86400", "Wed, 01 Jan 2200 00:00:00 GMT"],
+)
+@responses.activate
+def test_retry_after_exceeding_max_retry_after_is_not_retried(retry_after):
+    responses.get(
+        f"{NON_VERSIONED_BASE_URL}/adAccounts/1",
+        status=429,
+        json={},
+        headers={"Retry-After": retry_after},
+    )
+
+    delays = []
+    budget = RetryBudget()
+    tokens = budget.tokens
+    # Even without an elapsed time limit, an oversized Retry-After never blocks the caller
+    restli_client = RestliClient(
+        retry_policy=create_retry_policy(
+            delays, max_elapsed_time=None, max_delay=30, budget=budget
+        )
+    )
+    response = restli_client.get(
+        resource_path="/adAccounts/{id}", path_keys={"id": 1}, access_token=ACCESS_TOKEN
+    )
+
+    assert response.status_code == 429
+    assert len(responses.calls) == 1
+    assert delays == []
+    assert budget.tokens == tokens
+
+
+@responses.activate
+def test_retry_after_up_to_max_retry_after_is_honored():
+    url = f"{NON_VERSIONED_BASE_URL}/adAccounts/1"
+    responses.get(url, status=429, json={}, headers={"Retry-After": "45"})
+    responses.get(url, json={"id": 1})
+
+    delays = []
+    restli_client = RestliClient(
+        retry_policy=create_retry_policy(delays, max_delay=30, max_retry_after=60)
+    )
+    response = restli_client.get(
+        resource_path="/adAccounts/{id}", path_keys={"id": 1}, access_token=ACCESS_TOKEN
+    )
+
+    assert response.status_code == 200
+    assert delays == [45.0]
+
+
+@responses.activate
+def test_retry_refused_by_max_elapsed_time_does_not_consume_budget():
+    responses.get(
+        f"{NON_VERSIONED_BASE_URL}/adAccounts/1",
+        status=429,
+        json={},
+        headers={"Retry-After": "20"},
+    )
+
+    budget = RetryBudget()
+    tokens = budget.tokens
+    restli_client = RestliClient(
+        retry_policy=create_retry_policy([], max_elapsed_time=10, budget=budget)
+    )
+    response = restli_client.get(
+        resource_path="/adAccounts/{id}", path_keys={"id": 1}, access_token=ACCESS_TOKEN
+    )
+
+    assert response.status_code == 429
+    assert len(responses.calls) == 1
+    assert budget.tokens == tokens
+
+
+def test_retry_budget():
+    budget = RetryBudget(max_tokens=4, token_ratio=0.5)
+
+    assert budget.try_acquire()
+    assert not budget.try_acquire()
+    budget.record_success()
+    budget.record_success()
+    assert budget.tokens == 3
+    assert not budget.try_acquire()
+
+
+def test_retry_budget_only_earns_tokens_on_success():
+    budget = RetryBudget(max_tokens=10, token_ratio=0.5)
+    retry_policy = create_retry_policy([], budget=budget)
+    request = requests.Request("GET", "https://a").prepare()
+    budget.try_acquire()
+    tokens = budget.tokens
+
+    def send_not_found(request):
+        response = requests.Response()
+        response.status_code = 404
+        return response
+
+    retry_policy.send(send_not_found, request, RESTLI_METHODS.GET)
+    assert budget.tokens == tokens
+
+    def send_ok(request):
+        response = requests.Response()
+        response.status_code = 200
+        return response
+
+    retry_policy.send(send_ok, request, RESTLI_METHODS.GET)
+    assert budget.tokens == tokens + 0.5
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("30") == 30.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("invalid") is None
+    assert parse_retry_after(None) is None
@@ -0,0 +1,81 @@
+from linkedin_api.clients.restli.client import RestliClient
+from linkedin_api.clients.restli.revalidation import RevalidationCache
+from linkedin_api.common.constants import NON_VERSIONED_BASE_URL
+import responses
+
+ACCESS_TOKEN = "ABC123"
+
+
+@responses.activate
+def test_revalidation_cache_not_modified():
+    url = f"{NON_VERSIONED_BASE_URL}/organizations/1"
+    responses.get(url, json={"id": 1}, headers={"ETag": '"v1"'})
+    responses.get(url, status=304)
+
+    revalidation_cache = RevalidationCache()
+    restli_client = RestliClient(revalidation_cache=revalidation_cache)
+
+    first_response = restli_client.get(
+        resource_path="/organizations/{id}",
+        path_keys={"id": 1},
+        access_token=ACCESS_TOKEN,
+    )
+    second_response = restli_client.get(
+        resource_path="/organizations/{id}",
+        path_keys={"id": 1},
+        access_token=ACCESS_TOKEN,
+    )
+
+    assert len(responses.calls) == 2
+    assert "If-None-Match" not in responses.calls[0].request.headers
+    assert responses.calls[1].request.headers["If-None-Match"] == '"v1"'
+    assert second_response is first_response
+    assert second_response.entity == {"id": 1}
+
+
+@responses.activate
+def test_revalidation_cache_modified():
+    url = f"{NON_VERSIONED_BASE_URL}/organizations?q=search"
+    responses.get(
+        url,
+        json={"elements": [{"id": 1}], "paging": {"start": 0, "count": 10}},
+        headers={"Last-Modified": "Wed, 21 Oct 2026 07:28:00 GMT"},
+    )
+    responses.get(
+        url,
+        json={"elements": [{"id": 2}], "paging": {"start": 0, "count": 10}},
+        headers={"ETag": '"v2"'},
+    )
+
+    restli_client = RestliClient(revalidation_cache=RevalidationCache())
+
+    for expected_elements in [[{"id": 1}], [{"id": 2}]]:
+        response = restli_client.finder(
+            resource_path="/organizations",
+            finder_name="search",
+            access_token=ACCESS_TOKEN,
+        )
+        assert response.elements == expected_elements
+
+    assert (
+        responses.calls[1].request.headers["If-Modified-Since"]
+        == "Wed, 21 Oct 2026 07:28:00 GMT"
+    )
+
+
+@responses.activate
+def test_revalidation_cache_skips_responses_without_validators():
+    responses.get(f"{NON_VERSIONED_BASE_URL}/organizations/1", json={"id": 1})
+
+    revalidation_cache = RevalidationCache()
+    restli_client = RestliClient(revalidation_cache=revalidation_cache)
+
+    for _ in range(2):
+        restli_client.get(
+            resource_path="/organizations/{id}",
+            path_keys={"id": 1},
+            access_token=ACCESS_TOKEN,
+        )
+
+    assert "If-None-Match" not in responses.calls[1].request.headers
+    assert len(revalidation_cache.backend) == 0
@@ -0,0 +1,211 @@
+import json
+import pytest
+import requests
+import responses
+from linkedin_api.clients.common.cache import InMemoryCacheBackend
+from linkedin_api.clients.restli.client import RestliClient
+from linkedin_api.clients.restli.response import (
+    CollectionResponse,
+    StreamingCollectionResponse,
+)
+from linkedin_api.clients.restli.response_formatter import (
+    StreamingCollectionResponseFormatter,
+)
+from linkedin_api.clients.restli.retry import RetryPolicy
+from linkedin_api.common.constants import NON_VERSIONED_BASE_URL
+from linkedin_api.common.errors import ResponseFormattingError
+
+ACCESS_TOKEN = "ABC123"
+URL = f"{NON_VERSIONED_BASE_URL}/adAccounts"
+
+ELEMENTS = [{"id": id, "name": f"Ad Account {id}"} for id in range(100)]
+
+
+class ChunkedRaw:
+    """
+    A raw response body that records how many chunks have been read, and whether its connection was
+    released.
+    """
+
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+        self.chunks_read = 0
+        self.released = False
+
+    def stream(self, chunk_size, decode_content=True):
+        for chunk in self.chunks:
+            self.chunks_read += 1
+            yield chunk
+
+    def close(self):
+        self.released = True
+
+    def release_conn(self):
+        self.released = True
+
+
+def create_streamed_response(chunks, status_code=200):
+    response = requests.Response()
+    response.status_code = status_code
+    response.raw = ChunkedRaw(chunks)
+    return response
+
+
+def test_elements_are_yielded_as_chunks_are_read():
+    raw_response = create_streamed_response(
+        [b'{"elements": [{"id": 1},', b' {"id": 2}]', b', "paging": {"total": 2}}']
+    )
+    response = StreamingCollectionResponseFormatter.format_response(raw_response)
+    elements = iter(response)
+
+    assert next(elements) == {"id": 1}
+    assert raw_response.raw.chunks_read == 1
+    assert next(elements) == {"id": 2}
+    assert raw_response.raw.chunks_read == 2
+    assert not raw_response.raw.released
+
+    assert list(elements) == []
+    assert raw_response.raw.released
+    assert response.paging.total == 2
+    assert response.metadata is None
+
+
+def test_paging_preceding_the_elements_does_not_read_them():
+    raw_response = create_streamed_response(
+        [b'{"paging": {"start": 0, "count": 2, "total": 9},', b' "elements": [1, 2]}']
+    )
+    response = StreamingCollectionResponseFormatter.format_response(raw_response)
+
+    assert next(iter(response)) == 1
+    assert response.paging.total == 9
+    assert raw_response.raw.chunks_read == 2
+    assert list(response) == [2]
+
+
+def test_paging_following_the_elements_buffers_them():
+    raw_response = create_streamed_response(
+        [b'{"elements": [1, 2, 3],', b' "paging": {"total": 3}, "metadata": {"a": 1}}']
+    )
+    response = StreamingCollectionResponseFormatter.format_response(raw_response)
+    elements = response.iter_elements()
+
+    assert next(elements) == 1
+    assert response.paging.total == 3
+    assert response.metadata == {"a": 1}
+    assert raw_response.raw.released
+    assert list(elements) == [2, 3]
+
+
+def test_close_discards_the_remaining_elements():
+    raw_response = create_streamed_response([b'{"elements": [1,', b" 2]}"])
+
+    with StreamingCollectionResponseFormatter.format_response(raw_response) as response:
+        elements = iter(response)
+        assert next(elements) == 1
+
+    assert raw_response.raw.released
+    assert list(elements) == []
+
+
+def test_invalid_body_raises_response_formatting_error():
+    response = StreamingCollectionResponseFormatter.format_response(
+        create_streamed_response([b'{"elements": [1,', b" oops]}"])
+    )
+
+    with pytest.raises(ResponseFormattingError):
+        list(response)
+
+
+@responses.activate
+def test_finder_stream():
+    responses.get(
+        URL,
+        body=json.dumps({"elements": ELEMENTS, "paging": {"start": 0, "total": 100}}),
+    )
+    restli_client = RestliClient()
+
+    response = restli_client.finder(
+        resource_path="/adAccounts",
+        finder_name="search",
+        access_token=ACCESS_TOKEN,
+        stream=True,
+    )
+
+    assert isinstance(response, StreamingCollectionResponse)
+    assert response.status_code == 200
+    assert list(response) == ELEMENTS
+    assert response.paging.total == 100
+
+
+@responses.activate
+def test_get_all_stream():
+    responses.get(URL, body=json.dumps({"elements": ELEMENTS}))
+    restli_client = RestliClient()
+
+    response = restli_client.get_all(
+        resource_path="/adAccounts", access_token=ACCESS_TOKEN, stream=True
+    )
+    assert list(response.iter_elements()) == ELEMENTS
+    assert response.paging.total is None
+
+    response = restli_client.get_all(
+        resource_path="/adAccounts", access_token=ACCESS_TOKEN
+    )
+    assert isinstance(response, CollectionResponse)
+    assert response.elements == ELEMENTS
+
+
+@responses.activate
+def test_error_response_body_remains_readable():
+    responses.get(URL, status=403, json={"status": 403, "message": "Forbidden"})
+    restli_client = RestliClient()
+
+    response = restli_client.finder(
+        resource_path="/adAccounts",
+        finder_name="search",
+        access_token=ACCESS_TOKEN,
+        stream=True,
+    )
+
+    assert response.status_code == 403
+    assert list(response) == []
+    assert response.response.json() == {"status": 403, "message": "Forbidden"}
+
+
+@responses.activate
+def test_streamed_requests_bypass_the_response_cache():
+    responses.get(URL, body=json.dumps({"elements": ELEMENTS}))
+    response_cache = InMemoryCacheBackend()
+    restli_client = RestliClient(response_cache=response_cache)
+
+    for _ in range(2):
+        response = restli_client.get_all(
+            resource_path="/adAccounts", access_token=ACCESS_TOKEN, stream=True
+        )
+        assert list(response) == ELEMENTS
+
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_retried_streamed_responses_are_closed(monkeypatch):
+    responses.get(URL, status=503)
+    responses.get(URL, body=json.dumps({"elements": [1]}))
+    restli_client = RestliClient(
+        retry_policy=RetryPolicy(max_attempts=2, sleep=lambda seconds: None)
+    )
+    closed = []
+    original_close = requests.Response.close
+
+    def close(response):
+        closed.append(response.status_code)
+        original_close(response)
+
+    monkeypatch.setattr(requests.Response, "close", close)
+
+    response = restli_client.get_all(
+        resource_path="/adAccounts", access_token=ACCESS_TOKEN, stream=True
+    )
+    assert closed == [503]
+    assert list(response) == [1]
+    assert closed == [503, 200]
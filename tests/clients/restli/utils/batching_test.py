@@ -0,0 +1,122 @@
+from linkedin_api.clients.restli.client import RestliClient
+from linkedin_api.clients.restli.response import BatchGetResponse
+from linkedin_api.clients.restli.utils.batching import (
+    chunk_ids,
+    merge_batch_get_responses,
+)
+from linkedin_api.clients.restli.utils.decoder import decode
+from linkedin_api.clients.restli.utils.encoder import encode
+from linkedin_api.common.constants import NON_VERSIONED_BASE_URL
+from linkedin_api.common.errors import InvalidArgumentError
+import json
+import pytest
+import responses
+from urllib.parse import urlparse, parse_qs
+
+ACCESS_TOKEN = "ABC123"
+
+
+@pytest.mark.parametrize(
+    "ids,kwargs,expected_chunks",
+    [
+        ([1, 2, 3, 4, 5], {"max_ids": 2}, [[1, 2], [3, 4], [5]]),
+        ([1, 2, 3], {"max_ids": 5}, [[1, 2, 3]]),
+        ([], {"max_ids": 5}, []),
+        # "List(" + "11,22" + ")" is 11 characters, one more id would exceed the limit of 13
+        (
+            [11, 22, 33, 44],
+            {"max_ids": 10, "max_encoded_length": 13, "base_encoded_length": 6},
+            [[11, 22], [33, 44]],
+        ),
+        # URNs are measured by their encoded length
+        (
+            ["urn:li:a:1", "urn:li:a:2"],
+            {"max_ids": 10, "max_encoded_length": 30, "base_encoded_length": 6},
+            [["urn:li:a:1"], ["urn:li:a:2"]],
+        ),
+        # An id longer than the limit is placed in its own chunk
+        (
+            [1, 123456789, 2],
+            {"max_ids": 10, "max_encoded_length": 8, "base_encoded_length": 6},
+            [[1], [123456789], [2]],
+        ),
+    ],
+)
+def test_chunk_ids(ids, kwargs, expected_chunks):
+    assert chunk_ids(ids, **kwargs) == expected_chunks
+
+
+def test_chunk_ids_invalid_max_ids():
+    with pytest.raises(InvalidArgumentError):
+        chunk_ids([1], max_ids=0)
+
+
+def test_merge_batch_get_responses():
+    def batch_get_response(status_code, results, statuses=None, errors=None):
+        return BatchGetResponse(
+            status_code=status_code,
+            url=f"url{status_code}",
+            headers={},
+            response=None,
+            results=results,
+            statuses=statuses,
+            errors=errors,
+        )
+
+    merged = merge_batch_get_responses(
+        [
+            batch_get_response(200, {"1": {"name": "A"}}),
+            batch_get_response(
+                400, {"2": {"name": "B"}}, {"2": 200, "3": 404}, {"3": {"status": 404}}
+            ),
+        ]
+    )
+
+    assert merged.status_code == 400
+    assert merged.url == "url200"
+    assert merged.results == {"1": {"name": "A"}, "2": {"name": "B"}}
+    assert merged.statuses == {"2": 200, "3": 404}
+    assert merged.errors == {"3": {"status": 404}}
+
+
+@responses.activate
+def test_batch_get_chunked():
+    def request_callback(request):
+        query = parse_qs(urlparse(request.url).query)
+        assert query["fields"] == ["id,name"]
+        ids = decode(query["ids"][0])
+        body = {"results": {encode(id): {"id": id} for id in ids}}
+        return (200, {}, json.dumps(body))
+
+    responses.add_callback(
+        responses.GET, f"{NON_VERSIONED_BASE_URL}/adCreatives", request_callback
+    )
+
+    restli_client = RestliClient()
+    ids = [f"urn:li:sponsoredCreative:{i}" for i in range(250)]
+    response = restli_client.batch_get_chunked(
+        resource_path="/adCreatives",
+        ids=ids,
+        query_params={"fields": "id,name"},
+        access_token=ACCESS_TOKEN,
+        max_ids_per_request=100,
+    )
+
+    assert len(responses.calls) == 3
+    assert response.status_code == 200
+    assert sorted(response.results.keys()) == sorted(encode(id) for id in ids)
+
+
+@responses.activate
+def test_batch_get_chunked_single_chunk():
+    responses.get(
+        f"{NON_VERSIONED_BASE_URL}/testResource?ids=List(1,2)",
+        json={"results": {"1": {}, "2": {}}},
+    )
+
+    response = RestliClient().batch_get_chunked(
+        resource_path="/testResource", ids=[1, 2], access_token=ACCESS_TOKEN
+    )
+
+    assert len(responses.calls) == 1
+    assert response.results == {"1": {}, "2": {}}
@@ -0,0 +1,121 @@
+from linkedin_api.clients.restli.utils.api import build_rest_url
+from linkedin_api.clients.restli.utils.resource_path import (
+    ResourcePathTemplate,
+    _precompiled_templates,
+    compile_resource_path,
+    precompile_resource_paths,
+)
+from linkedin_api.common.constants import NON_VERSIONED_BASE_URL, VERSIONED_BASE_URL
+from linkedin_api.common.errors import InvalidArgumentError
+import pytest
+
+
+@pytest.mark.parametrize(
+    "template,expected_literals,expected_placeholders",
+    [
+        ("/me", ("/me",), ()),
+        ("/adAccounts/{id}", ("/adAccounts/", ""), ("id",)),
+        (
+            "/socialActions/{id}/comments/{commentId}",
+            ("/socialActions/", "/comments/", ""),
+            ("id", "commentId"),
+        ),
+        ("/a/{{literal}}/{id}", ("/a/{literal}/", ""), ("id",)),
+    ],
+)
+def test_resource_path_template(template, expected_literals, expected_placeholders):
+    compiled_template = ResourcePathTemplate(template)
+
+    assert compiled_template.template == template
+    assert compiled_template.literals == expected_literals
+    assert compiled_template.placeholders == expected_placeholders
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "/adAccounts/{id",
+        "/adAccounts/id}",
+        "/a/{}",
+        "/a/{0}",
+        "/a/{id:x}",
+        "/a/{id!r}",
+        "/a/{id.name}",
+        "/a/{id[0]}",
+    ],
+)
+def test_resource_path_template_invalid(template):
+    with pytest.raises(InvalidArgumentError):
+        ResourcePathTemplate(template)
+
+
+@pytest.mark.parametrize(
+    "resource_path,path_keys,version_string,expected_url",
+    [
+        ("/me", None, None, f"{NON_VERSIONED_BASE_URL}/me"),
+        ("/me", {}, "202302", f"{VERSIONED_BASE_URL}/me"),
+        (
+            "/adAccounts/{id}",
+            {"id": 123},
+            "202302",
+            f"{VERSIONED_BASE_URL}/adAccounts/123",
+        ),
+        (
+            "/socialActions/{id}/comments/{commentId}",
+            {"id": "urn:li:share:1", "commentId": 2},
+            None,
+            f"{NON_VERSIONED_BASE_URL}/socialActions/urn%3Ali%3Ashare%3A1/comments/2",
+        ),
+        (
+            "/adAccountUsers/{key}",
+            {
+                "key": {
+                    "account": "urn:li:sponsoredAccount:1",
+                    "user": "urn:li:person:a",
+                }
+            },
+            "202302",
+            f"{VERSIONED_BASE_URL}/adAccountUsers/(account:urn%3Ali%3AsponsoredAccount%3A1,user:urn%3Ali%3Aperson%3Aa)",
+        ),
+    ],
+)
+def test_build_rest_url(resource_path, path_keys, version_string, expected_url):
+    assert build_rest_url(resource_path, path_keys, version_string) == expected_url
+
+
+@pytest.mark.parametrize(
+    "resource_path,path_keys,expected_message",
+    [
+        ("/adAccounts/{id}", None, "number of placeholders"),
+        ("/adAccounts", {"id": 1}, "number of placeholders"),
+        ("/adAccounts/{id}", {"accountId": 1}, "do not match the keys"),
+        ("/adAccounts/{id}/{id}", {"id": 1}, "number of placeholders"),
+    ],
+)
+def test_build_rest_url_mismatched_path_keys(
+    resource_path, path_keys, expected_message
+):
+    with pytest.raises(InvalidArgumentError, match=expected_message):
+        build_rest_url(resource_path, path_keys)
+
+
+def test_compile_resource_path_is_cached():
+    assert compile_resource_path("/adCampaigns/{id}") is compile_resource_path(
+        "/adCampaigns/{id}"
+    )
+
+
+def test_precompile_resource_paths():
+    precompile_resource_paths(["/adCampaignGroups/{id}", "/adCreatives/{id}"])
+
+    compiled_template = compile_resource_path("/adCampaignGroups/{id}")
+    assert compiled_template.placeholders == ("id",)
+    assert compile_resource_path("/adCampaignGroups/{id}") is compiled_template
+
+
+def test_precompile_resource_paths_invalid():
+    with pytest.raises(InvalidArgumentError):
+        precompile_resource_paths(["/adSegments/{id}", "/adSegments/{id"])
+
+    # No template is registered if any is invalid
+    assert "/adSegments/{id}" not in _precompiled_templates
@@ -0,0 +1,93 @@
+from concurrent.futures import ThreadPoolExecutor
+from linkedin_api.clients.restli.client import RestliClient
+from linkedin_api.clients.restli.utils.singleflight import SingleFlight
+from linkedin_api.common.constants import NON_VERSIONED_BASE_URL
+import json
+import pytest
+import responses
+import threading
+import time
+
+NUM_CALLERS = 8
+
+
+def test_singleflight_shares_result_of_in_flight_call():
+    singleflight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow_call():
+        calls.append(1)
+        started.set()
+        release.wait()
+        return object()
+
+    with ThreadPoolExecutor(max_workers=NUM_CALLERS) as executor:
+        leader = executor.submit(singleflight.do, "key", slow_call)
+        started.wait()
+        followers = [
+            executor.submit(singleflight.do, "key", slow_call)
+            for _ in range(NUM_CALLERS - 1)
+        ]
+        # Give the followers time to join the in-flight call
+        time.sleep(0.05)
+        release.set()
+        results = [leader.result()] + [follower.result() for follower in followers]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert singleflight.in_flight() == 0
+
+    # Once completed, the next call is made again
+    release.set()
+    singleflight.do("key", slow_call)
+    assert len(calls) == 2
+
+
+def test_singleflight_shares_exception():
+    singleflight = SingleFlight()
+    release = threading.Event()
+
+    def failing_call():
+        release.wait()
+        raise ValueError("failed")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(singleflight.do, "key", failing_call) for _ in range(2)
+        ]
+        time.sleep(0.05)
+        release.set()
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result()
+
+
+@responses.activate
+def test_restli_client_singleflight():
+    def slow_callback(request):
+        time.sleep(0.1)
+        return (200, {}, json.dumps({"id": 123}))
+
+    responses.add_callback(
+        responses.GET, f"{NON_VERSIONED_BASE_URL}/organizations/123", slow_callback
+    )
+    restli_client = RestliClient(singleflight=True)
+
+    def get_organization(access_token):
+        return restli_client.get(
+            resource_path="/organizations/{id}",
+            path_keys={"id": 123},
+            access_token=access_token,
+        )
+
+    with ThreadPoolExecutor(max_workers=NUM_CALLERS) as executor:
+        results = list(executor.map(get_organization, ["ABC123"] * NUM_CALLERS))
+    assert len(responses.calls) == 1
+    assert all(result is results[0] for result in results)
+
+    # Requests with different access tokens are not shared
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(get_organization, ["ABC123", "DEF456"]))
+    assert len(responses.calls) == 3
@@ -0,0 +1,116 @@
+import json
+import pytest
+from linkedin_api.clients.restli.utils.streaming import CollectionStreamParser
+from linkedin_api.common.errors import ResponseFormattingError
+
+BODY = {
+    "paging": {"start": 0, "count": 10, "total": 2},
+    "elements": [
+        {"id": 1, "name": "Ad Account ü"},
+        123,
+        -1.5e3,
+        True,
+        None,
+        "urn:li:sponsoredAccount:1",
+        [1, [2, {}]],
+        {},
+        10,
+    ],
+    "metadata": {"nextPageToken": "abc"},
+}
+
+
+def split(data: bytes, chunk_size: int):
+    return [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 100000])
+def test_parse_chunks(chunk_size):
+    parser = CollectionStreamParser(split(json.dumps(BODY).encode(), chunk_size))
+
+    assert list(parser.iter_elements()) == BODY["elements"]
+    assert parser.fields == {"paging": BODY["paging"], "metadata": BODY["metadata"]}
+    assert parser.completed
+
+
+@pytest.mark.parametrize(
+    "body,expected_elements,expected_fields",
+    [
+        (b"{}", [], {}),
+        (b' { "elements" : [ ] , "total" : 12 } \n', [], {"total": 12}),
+        (b'{"elements": [1, 2], "elements2": [3]}', [1, 2], {"elements2": [3]}),
+        (
+            b'{"status": 404, "message": "Not Found"}',
+            [],
+            {"status": 404, "message": "Not Found"},
+        ),
+    ],
+)
+def test_parse_bodies(body, expected_elements, expected_fields):
+    parser = CollectionStreamParser(split(body, 3))
+
+    assert list(parser.iter_elements()) == expected_elements
+    assert parser.fields == expected_fields
+
+
+def test_elements_are_yielded_before_the_body_is_downloaded():
+    downloaded_chunks = []
+
+    def chunks():
+        for chunk in [
+            b'{"elements": [{"id": 1}',
+            b', {"id": 2}',
+            b"]",
+            b', "paging": {}}',
+        ]:
+            downloaded_chunks.append(chunk)
+            yield chunk
+
+    parser = CollectionStreamParser(chunks())
+    elements = parser.iter_elements()
+
+    assert next(elements) == {"id": 1}
+    assert len(downloaded_chunks) == 1
+    assert next(elements) == {"id": 2}
+    assert len(downloaded_chunks) == 2
+    assert "paging" not in parser.fields
+
+    assert list(elements) == []
+    assert parser.fields == {"paging": {}}
+
+
+def test_truncated_number_waits_for_a_delimiter():
+    parser = CollectionStreamParser([b'{"elements": [12', b"34", b"5]}"])
+
+    assert list(parser.iter_elements()) == [12345]
+
+
+def test_large_body_is_compacted():
+    elements = [{"id": id, "name": "x" * (id % 300)} for id in range(5000)]
+    body = json.dumps({"elements": elements, "paging": {"total": 5000}}).encode()
+    parser = CollectionStreamParser(split(body, 4096))
+
+    assert list(parser.iter_elements()) == elements
+    assert parser.fields == {"paging": {"total": 5000}}
+    # The parsed prefix of the body is not retained
+    assert len(parser._CollectionStreamParser__buffer) < len(body) / 4
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b"",
+        b"[1, 2]",
+        b'{"elements": [1, ',
+        b'{"elements": [1 2]}',
+        b'{"elements": [1]',
+        b'{"elements": [1]} {}',
+        b"{1: 2}",
+        b'{"elements": [\xff]}',
+    ],
+)
+def test_invalid_body_raises_response_formatting_error(body):
+    parser = CollectionStreamParser(split(body, 2))
+
+    with pytest.raises(ResponseFormattingError):
+        list(parser.iter_elements())